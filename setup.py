@@ -33,6 +33,7 @@ setup(
         " and operations for working with them."
     ),
     install_requires=requirements,
+    extras_require={'numpy': ['numpy']},
     license="MIT license",
     long_description=readme,
     long_description_content_type='text/markdown',
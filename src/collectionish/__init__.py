@@ -8,7 +8,18 @@ __email__ = 'leaprovenzano@gmail.com'
 __version__ = '0.5.0'
 
 from ._uniquetuple import UniqueTuple
-from ._attydict import AttyDict
+from ._ordered_set import OrderedSet
+from ._int_uniquetuple import IntUniqueTuple
+from ._sorted_uniquetuple import SortedUniqueTuple
+from ._unique_stream import UniqueStream
+from ._attydict import AttyDict, FrozenAttyDict, LazyAttyDict
+from ._attyrecord import AttyRecord
+from ._attyview import AttyView
+from ._attybatch import AttyBatch, AttyRow
 from ._sentry import Sentry
 from ._ancestor_chain_map import AncestorChainMap
 from ._numdict import NumDict, NumAttyDict
+from ._incremental_numdict import IncrementalNumDict
+from ._array_numdict import ArrayNumDict
+from ._numdict_frame import NumDictFrame
+from ._numexpr import NumExpr
@@ -0,0 +1,412 @@
+from typing import Any, Callable, ClassVar, Iterable, Iterator, MutableMapping, Optional
+
+from collectionish._lru import CacheInfo, LRUCache
+from collectionish._numdict import NumDict, NumT
+from collectionish._uniquetuple import UniqueTuple
+from collectionish._vectorized import np
+
+
+_SCALARS = (int, float) if np is None else (int, float, np.bool_, np.integer, np.floating)
+
+
+def _as_values(values: Any) -> 'np.ndarray':
+    # a bool, int64 or float64 array
+    arr = np.asarray(values)
+    kind = arr.dtype.kind
+    if kind == 'b':
+        return arr
+    if kind in 'iu':
+        return arr.astype(np.int64, copy=False)
+    if kind == 'f':
+        return arr.astype(np.float64, copy=False)
+    raise TypeError('ArrayNumDict values must be bools, ints or floats')
+
+
+def _is_int(arr: 'np.ndarray') -> bool:
+    return arr.dtype.kind in 'biu'
+
+
+def _check_divisor(ufunc: Callable, divisor: Any):
+    # numpy returns inf, nan or 0 and warns where python raises
+    if ufunc in (np.true_divide, np.floor_divide, np.remainder) and np.any(divisor == 0):
+        raise ZeroDivisionError('division by zero')
+
+
+def _apply(ufunc: Callable, left: Any, right: Any) -> 'np.ndarray':
+    _check_divisor(ufunc, right)
+    if ufunc is np.power and _is_int(np.asarray(left)) and _is_int(np.asarray(right)):
+        if np.any(np.asarray(right) < 0):
+            # python gives a float for negative int powers, numpy refuses
+            left = np.asarray(left, dtype=np.float64)
+    return _as_values(ufunc(left, right))
+
+
+def _positions_in(keys: UniqueTuple, other_keys: UniqueTuple) -> Optional['np.ndarray']:
+    # the position of each of keys in other_keys, len(other_keys) where it's missing or None
+    # if the keys are the same.
+    if keys is other_keys:
+        return None
+    cache = ArrayNumDict._alignment_cache
+    cache_key = (keys, other_keys)
+    take = cache.get(cache_key, False)
+    if take is False:
+        positions = other_keys._positions()
+        missing = len(other_keys)
+        take = np.fromiter(
+            (positions.get(k, missing) for k in keys), dtype=np.intp, count=len(keys)
+        )
+        if len(keys) == missing and np.array_equal(take, np.arange(missing)):
+            take = None
+        cache.put(cache_key, take)
+    return take
+
+
+def _aligned(keys: UniqueTuple, other: Any, noop: NumT) -> 'np.ndarray':
+    # the values of other (an ArrayNumDict or NumDict) in the order of keys with noop for keys
+    # it doesn't have
+    if isinstance(other, ArrayNumDict):
+        take = _positions_in(keys, other._keys)
+        if take is None:
+            return other._values
+        return np.append(other._values, noop)[take]  # type: ignore[arg-type]
+    return _as_values([other.get(k, noop) for k in keys])
+
+
+class ArrayNumDict(MutableMapping[str, NumT]):
+
+    """A :class:`NumDict` whose values are stored in a single numpy array.
+
+    Keys are held in an immutable :class:`UniqueTuple` which maps each key to its position in
+    the values array. Results of arithmetic share the key index of their left hand operand, so
+    ``+ - * / // ** %``, comparisons, ``abs``, ``round``, ``-`` and the aggregations are each
+    a single vectorised numpy operation rather than a python call per key.
+
+    The semantics are the same as :class:`NumDict`: keys come from the left hand operand and a
+    key missing from the right hand one is treated as the identity for the operation (0 for
+    ``+`` and ``-``, 1 for everything else). When the keys of the two operands differ the
+    positions of the left hand keys in the right hand one are worked out once and cached, see
+    :meth:`ArrayNumDict.alignment_cache_info`.
+
+    Values are stored as bools, 64 bit ints or 64 bit floats so, unlike python ints, ints can
+    overflow. Division by zero raises ``ZeroDivisionError`` just as it would for a ``NumDict``.
+    ``round`` with a number of places is numpy's, which can round a decimal tie like ``6.45`` the
+    other way to python.
+    Adding or deleting keys copies the key index and values so it's linear time, it's
+    arithmetic on a fixed set of keys that this is built for.
+
+    ``ArrayNumDict`` requires numpy.
+
+    Example:
+        >>> from collectionish import ArrayNumDict, NumDict
+        >>>
+        >>> nd = ArrayNumDict(a=1.5, b=3.0, c=2.0)
+        >>> nd * ArrayNumDict(a=2, c=4)
+        ArrayNumDict({'a': 3.0, 'b': 3.0, 'c': 8.0})
+
+        >>> (nd + 1).sum()
+        9.5
+
+        >>> nd.array
+        array([1.5, 3. , 2. ])
+
+        >>> nd.to_numdict() == NumDict(a=1.5, b=3.0, c=2.0)
+        True
+    """
+
+    __slots__ = ('_keys', '_values')
+
+    _keys: UniqueTuple
+    _values: 'np.ndarray'
+
+    _alignment_cache: ClassVar[LRUCache] = LRUCache(maxsize=64)
+
+    def __init__(self, iterable_or_mapping: Any = None, **kwargs: NumT):
+        if np is None:
+            raise ImportError(f'{self.__class__.__name__} requires numpy')
+        if isinstance(iterable_or_mapping, ArrayNumDict) and not kwargs:
+            self._keys = iterable_or_mapping._keys
+            self._values = iterable_or_mapping._values.copy()
+            return
+        items = dict(() if iterable_or_mapping is None else iterable_or_mapping, **kwargs)
+        self._keys = UniqueTuple._from_unique(items)
+        self._values = _as_values(list(items.values()))
+
+    @classmethod
+    def from_arrays(cls, keys: Iterable[str], values: Any) -> 'ArrayNumDict':
+        """create an ``ArrayNumDict`` from keys and a matching sequence or array of values.
+
+        if ``keys`` is already a ``UniqueTuple`` it's used as the key index as is, so many
+        ``ArrayNumDict`` objects made with the same keys will share it.
+        """
+        keys = UniqueTuple.from_iterable(keys)
+        values = _as_values(values)
+        if len(keys) != len(values):
+            raise ValueError(f'got {len(keys)} keys but {len(values)} values')
+        return cls._from_index(keys, values.copy())
+
+    @classmethod
+    def _from_index(cls, keys: UniqueTuple, values: 'np.ndarray') -> 'ArrayNumDict':
+        # nothing is checked or copied here
+        new = cls.__new__(cls)
+        new._keys = keys
+        new._values = values
+        return new
+
+    @classmethod
+    def alignment_cache_info(cls) -> CacheInfo:
+        """return hits, misses, maxsize and current size of the key alignment cache."""
+        return cls._alignment_cache.info()
+
+    @property
+    def array(self) -> 'np.ndarray':
+        """a read only view of the values in key order."""
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def to_numdict(self) -> NumDict:
+        """copy this into a plain :class:`NumDict`."""
+        return NumDict(zip(self._keys, self._values.tolist()))
+
+    # arithmetic
+
+    def _operand(self, other: Any, noop: NumT) -> Any:
+        if isinstance(other, _SCALARS):
+            return other
+        if isinstance(other, (ArrayNumDict, NumDict)):
+            return _aligned(self._keys, other, noop)
+        return NotImplemented
+
+    def _apply_with_other(self, ufunc: Callable, other: Any, noop: NumT):
+        right = self._operand(other, noop)
+        if right is NotImplemented:
+            return NotImplemented
+        return self._from_index(self._keys, _apply(ufunc, self._values, right))
+
+    def _iapply_with_other(self, ufunc: Callable, other: Any, noop: NumT):
+        right = self._operand(other, noop)
+        if right is NotImplemented:
+            return NotImplemented
+        result = _apply(ufunc, self._values, right)
+        if result.dtype == self._values.dtype:
+            # write into the existing array so views of it (like NumDictFrame rows) see it
+            self._values[...] = result
+        else:
+            self._check_retype(result.dtype)
+            self._values = result
+        return self
+
+    def _check_retype(self, dtype: Any):
+        # a view (like a NumDictFrame row) changing dtype would need a new array, silently
+        # detaching it from the array it's a view of.
+        if self._values.base is not None:
+            raise TypeError(
+                f'cannot change the {self._values.dtype} values of a view'
+                f' (like a NumDictFrame row) to {dtype}'
+            )
+
+    def _rapply_with_other(self, ufunc: Callable, other: Any, noop: NumT):
+        if isinstance(other, _SCALARS):
+            return self._from_index(self._keys, _apply(ufunc, other, self._values))
+        if isinstance(other, NumDict):
+            # keys come from the left hand NumDict
+            return self.__class__(other)._apply_with_other(ufunc, self, noop)
+        return NotImplemented
+
+    def _has_same_keys(self, other: Any) -> bool:
+        if isinstance(other, ArrayNumDict):
+            return other._keys is self._keys or set(other._keys) == set(self._keys)
+        return set(other.keys()) == set(self._keys)
+
+    def _apply_comparison_with_other(self, ufunc: Callable, other: Any):
+        if isinstance(other, (ArrayNumDict, NumDict)) and not self._has_same_keys(other):
+            raise RuntimeError(
+                f'cannot compare {self.__class__.__name__}'
+                f' to {other.__class__.__name__} when keys do not match!'
+            )
+        # keys match so noop is never used
+        return self._apply_with_other(ufunc, other, 0)
+
+    # comparison ops
+
+    def __eq__(self, other: Any):
+        if isinstance(other, _SCALARS):
+            return self._from_index(self._keys, self._values == other)
+        if isinstance(other, ArrayNumDict) and other._keys is self._keys:
+            return bool(np.array_equal(self._values, other._values))
+        if isinstance(other, (ArrayNumDict, dict)):
+            return dict(zip(self._keys, self._values.tolist())) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other: Any):
+        if isinstance(other, _SCALARS):
+            return self._from_index(self._keys, self._values != other)
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore
+
+    def __ge__(self, other: Any):
+        return self._apply_comparison_with_other(np.greater_equal, other)
+
+    def __le__(self, other: Any):
+        return self._apply_comparison_with_other(np.less_equal, other)
+
+    def __gt__(self, other: Any):
+        return self._apply_comparison_with_other(np.greater, other)
+
+    def __lt__(self, other: Any):
+        return self._apply_comparison_with_other(np.less, other)
+
+    # standard numeric modifiers
+
+    def __abs__(self):
+        return self._from_index(self._keys, np.abs(self._values))
+
+    def __round__(self, places: Optional[int] = None):
+        if places is None:
+            # like round on a float this gives ints
+            return self._from_index(self._keys, _as_values(np.round(self._values).astype(int)))
+        if _is_int(self._values):
+            return self._from_index(self._keys, self._values.copy())
+        return self._from_index(self._keys, np.round(self._values, places))
+
+    def __neg__(self):
+        values = self._values
+        if values.dtype.kind == 'b':
+            # like -True
+            values = values.astype(np.int64)
+        return self._from_index(self._keys, -values)
+
+    # arithmetic ops
+
+    def __add__(self, other: Any):
+        return self._apply_with_other(np.add, other, noop=0)
+
+    def __iadd__(self, other: Any):
+        return self._iapply_with_other(np.add, other, noop=0)
+
+    def __radd__(self, other: Any):
+        return self._rapply_with_other(np.add, other, noop=0)
+
+    def __sub__(self, other: Any):
+        return self._apply_with_other(np.subtract, other, noop=0)
+
+    def __isub__(self, other: Any):
+        return self._iapply_with_other(np.subtract, other, noop=0)
+
+    def __rsub__(self, other: Any):
+        return self._rapply_with_other(np.subtract, other, noop=0)
+
+    def __mul__(self, other: Any):
+        return self._apply_with_other(np.multiply, other, noop=1)
+
+    def __imul__(self, other: Any):
+        return self._iapply_with_other(np.multiply, other, noop=1)
+
+    def __rmul__(self, other: Any):
+        return self._rapply_with_other(np.multiply, other, noop=1)
+
+    def __truediv__(self, other: Any):
+        return self._apply_with_other(np.true_divide, other, noop=1)
+
+    def __itruediv__(self, other: Any):
+        return self._iapply_with_other(np.true_divide, other, noop=1)
+
+    def __rtruediv__(self, other: Any):
+        return self._rapply_with_other(np.true_divide, other, noop=1)
+
+    def __pow__(self, other: Any):
+        return self._apply_with_other(np.power, other, noop=1)
+
+    def __ipow__(self, other: Any):
+        return self._iapply_with_other(np.power, other, noop=1)
+
+    def __rpow__(self, other: Any):
+        return self._rapply_with_other(np.power, other, noop=1)
+
+    def __mod__(self, other: Any):
+        return self._apply_with_other(np.remainder, other, noop=1)
+
+    def __imod__(self, other: Any):
+        return self._iapply_with_other(np.remainder, other, noop=1)
+
+    def __rmod__(self, other: Any):
+        return self._rapply_with_other(np.remainder, other, noop=1)
+
+    def __floordiv__(self, other: Any):
+        return self._apply_with_other(np.floor_divide, other, noop=1)
+
+    def __ifloordiv__(self, other: Any):
+        return self._iapply_with_other(np.floor_divide, other, noop=1)
+
+    def __rfloordiv__(self, other: Any):
+        return self._rapply_with_other(np.floor_divide, other, noop=1)
+
+    # special aggregation ops
+
+    def min(self):
+        """return the minimum value in this numdict."""
+        return self._values.min().item()
+
+    def max(self):
+        """return the maximum value in this numdict."""
+        return self._values.max().item()
+
+    def sum(self):
+        """return the sum of the values in this numdict."""
+        return self._values.sum().item()
+
+    def mean(self):
+        """return the mean (average) of the values in this numdict."""
+        if not len(self._values):
+            raise ZeroDivisionError('mean of an empty ArrayNumDict')
+        return self._values.mean().item()
+
+    # mapping
+
+    def __getitem__(self, key: str) -> NumT:
+        return self._values[self._keys.index_by_key(key)].item()
+
+    def __setitem__(self, key: str, value: NumT):
+        if not isinstance(value, _SCALARS):
+            raise TypeError('ArrayNumDict values must be bools, ints or floats')
+        i = self._keys._positions().get(key)
+        if i is None:
+            self._keys = UniqueTuple._from_unique((*self._keys, key))
+            self._values = _as_values(np.append(self._values, value))
+            return
+        dtype = np.result_type(self._values, value)
+        if dtype != self._values.dtype:
+            self._check_retype(dtype)
+            self._values = _as_values(self._values.astype(dtype))
+        self._values[i] = value
+
+    def __delitem__(self, key: str):
+        i = self._keys.index_by_key(key)
+        self._keys = UniqueTuple._from_unique(self._keys[:i] + self._keys[i + 1:])
+        self._values = np.delete(self._values, i)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def items(self):
+        return dict(zip(self._keys, self._values.tolist())).items()
+
+    def values(self):
+        return dict(zip(self._keys, self._values.tolist())).values()
+
+    def copy(self) -> 'ArrayNumDict':
+        return self._from_index(self._keys, self._values.copy())
+
+    def __reduce__(self):
+        return (self.__class__.from_arrays, (tuple(self._keys), self._values))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(zip(self._keys, self._values.tolist()))!r})'
@@ -0,0 +1,216 @@
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
+import sys
+
+from collectionish._attydict import AttyDict
+from collectionish._sentry import Sentry
+from collectionish._uniquetuple import UniqueTuple
+
+
+# stored in place of a value for keys a record doesn't have
+_MISSING = Sentry()
+
+
+class AttyRow(MutableMapping[str, Any]):
+
+    """A single record in an :class:`AttyBatch`.
+
+    Rows are views, they hold nothing but a reference to the batch and their position in it, so
+    changes to a row are changes to the batch. Rows have the same dot access as an
+    :class:`AttyDict` but can only hold the keys of their batch.
+    """
+
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: 'AttyBatch', index: int):
+        object.__setattr__(self, '_batch', batch)
+        object.__setattr__(self, '_index', index)
+
+    def _column(self, key: str) -> List[Any]:
+        try:
+            return self._batch._columns[self._batch.keys.index_by_key(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._column(key)[self._index]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self._column(key)[self._index] = self._batch._dict_cls._attrify(value)
+
+    def __delitem__(self, key: str):
+        column = self._column(key)
+        if column[self._index] is _MISSING:
+            raise KeyError(key)
+        column[self._index] = _MISSING
+
+    def __getattr__(self, key: str) -> Any:
+        if key in AttyRow.__slots__:
+            raise AttributeError(key)
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key: str, value: Any):
+        self[key] = value
+
+    def __iter__(self) -> Iterator[str]:
+        i, batch = self._index, self._batch
+        return (k for k, col in zip(batch.keys, batch._columns) if col[i] is not _MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+
+class AttyBatch(Sequence[AttyRow]):
+
+    """A compact batch of :class:`AttyDict` style records which share the same keys.
+
+    Rather than every record carrying its own hash table, the keys are stored once (as a
+    :class:`UniqueTuple`) and the values are stored in a list per key. Records are handed out as
+    :class:`AttyRow` views with the same dot access as an ``AttyDict``, so a batch of records
+    costs about a pointer per value instead of a whole dict per record.
+
+    A record may leave out some of the batch keys, but can't have keys outside of them. Keys
+    are validated once when the batch is created and values are converted just as an
+    ``AttyDict`` would convert them.
+
+    Example:
+
+        >>> from collectionish import AttyBatch
+        >>>
+        >>> batch = AttyBatch.from_records([{'id': 1, 'tags': ['a']}, {'id': 2}])
+        >>> batch.keys
+        UniqueTuple('id', 'tags')
+        >>> batch[0].id
+        1
+        >>> batch[1]
+        AttyRow({'id': 2})
+        >>> batch[1].tags = ['b']
+        >>> batch.column('tags')
+        [['a'], ['b']]
+    """
+
+    def __init__(self, keys: Iterable[str], dict_cls: Type[AttyDict] = AttyDict):
+        self._dict_cls = dict_cls
+        self._keys: UniqueTuple[str] = UniqueTuple.from_iterable(keys)
+        for k in self._keys:
+            dict_cls._validate_key(k)
+        self._columns: List[List[Any]] = [[] for _ in self._keys]
+        self._len = 0
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        keys: Optional[Iterable[str]] = None,
+        dict_cls: Type[AttyDict] = AttyDict,
+    ) -> 'AttyBatch':
+        """create a batch from an iterable of mappings.
+
+        if ``keys`` aren't given they're taken from the first record.
+        """
+        records = iter(records)
+        if keys is None:
+            first = next(records, None)
+            if first is None:
+                return cls((), dict_cls=dict_cls)
+            batch = cls(first, dict_cls=dict_cls)
+            batch.append(first)
+        else:
+            batch = cls(keys, dict_cls=dict_cls)
+        batch.extend(records)
+        return batch
+
+    @property
+    def keys(self) -> UniqueTuple[str]:
+        """the keys shared by all the records."""
+        return self._keys
+
+    def append(self, record: Mapping[str, Any]):
+        """add a record to the end of the batch."""
+        positions = self._keys._positions()
+        extra = [k for k in record if k not in positions]
+        if extra:
+            raise ValueError(f'keys {extra} are not in this {self.__class__.__name__}')
+        attrify = self._dict_cls._attrify
+        # convert everything before touching the columns so a value which can't be converted
+        # doesn't leave some columns a record longer than others.
+        values = [record.get(k, _MISSING) for k in self._keys]
+        values = [v if v is _MISSING else attrify(v) for v in values]
+        for column, value in zip(self._columns, values):
+            column.append(value)
+        self._len += 1
+
+    def extend(self, records: Iterable[Mapping[str, Any]]):
+        """add records to the end of the batch."""
+        for record in records:
+            self.append(record)
+
+    def column(self, key: str) -> List[Any]:
+        """a list of the values of ``key`` for each record, ``Sentry()`` where it's missing."""
+        return list(self._columns[self._keys.index_by_key(key)])
+
+    def to_records(self) -> List[AttyDict]:
+        """convert each record to an ``AttyDict``."""
+        return [self._dict_cls._from_valid_items(row.items()) for row in self]
+
+    @property
+    def nbytes(self) -> int:
+        """bytes used to store the layout and columns (not counting the values themselves)."""
+        return (
+            sys.getsizeof(self._keys)
+            + sys.getsizeof(self._keys._positions())
+            + sum(map(sys.getsizeof, self._columns))
+        )
+
+    @overload
+    def __getitem__(self, i: int) -> AttyRow:
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> 'AttyBatch':
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[AttyRow, 'AttyBatch']:
+        if isinstance(i, slice):
+            new = self.__class__(self._keys, dict_cls=self._dict_cls)
+            new._columns = [column[i] for column in self._columns]
+            new._len = len(range(*i.indices(self._len)))
+            return new
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        return AttyRow(self, i)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(keys={self._keys!r}, len={self._len})'
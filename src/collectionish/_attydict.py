@@ -1,14 +1,32 @@
-from typing import Dict, TypeVar, Iterable, Mapping, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    TypeVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    IO,
+    List,
+    Tuple,
+    Union,
+)
+import json
 
 from collectionish.utils import is_valid_identifier
+from collectionish._sentry import Sentry
 
 T = TypeVar('T')
 InitFromT = Union[Mapping[str, T], Iterable[Tuple[str, T]]]
+Path = Tuple[str, ...]
+# the changed paths (shared by all the dicts being tracked) and the path to a dict
+_Tracker = Tuple[Dict[Path, None], Path]
 
 
 def _unpack_args(iterable_or_mapping: Optional[InitFromT] = None, **kwargs):
     if iterable_or_mapping:
-        if isinstance(iterable_or_mapping, dict):
+        if isinstance(iterable_or_mapping, Mapping):
             yield from iterable_or_mapping.items()
         else:
             yield from iterable_or_mapping
@@ -83,23 +101,597 @@ class AttyDict(Dict[str, T]):
         for k, v in _unpack_args(iterable_or_mapping, **kwargs):
             self.__setitem__(k, v)
 
-    def _validate_key(self, s: str):
+    @classmethod
+    def _from_valid_items(cls, items: Iterable[Tuple[str, Any]]) -> 'AttyDict':
+        # keys must already be validated and values converted, nothing is checked here.
+        new = cls()
+        dict.update(new, items)
+        return new
+
+    @classmethod
+    def _json_decoder(cls, **kwargs) -> json.JSONDecoder:
+        # objects are built bottom up so values are already converted and each distinct key
+        # only needs validating the first time it's seen.
+        valid = set()
+
+        def from_pairs(pairs):
+            for k, _ in pairs:
+                if k not in valid:
+                    cls._validate_key(k)
+                    valid.add(k)
+            return cls._from_valid_items(pairs)
+
+        return json.JSONDecoder(object_pairs_hook=from_pairs, **kwargs)
+
+    @classmethod
+    def _decode(cls, decoder: json.JSONDecoder, s: Union[str, bytes, bytearray]):
+        if isinstance(s, (bytes, bytearray)):
+            s = s.decode(json.detect_encoding(s), 'surrogatepass')
+        decoded = decoder.decode(s)
+        if not isinstance(decoded, cls):
+            raise TypeError(f'expected a JSON object to load into {cls.__name__}')
+        return decoded
+
+    @classmethod
+    def from_json(cls, s: Union[str, bytes, bytearray], **kwargs) -> 'AttyDict':
+        """parse a JSON object straight into an ``AttyDict``.
+
+        nested objects are built as ``AttyDict`` while parsing so the data is never walked
+        twice. Any extra keyword arguments are passed on to :py:class:`json.JSONDecoder`.
+
+        Example:
+            >>> from collectionish import AttyDict
+            >>>
+            >>> AttyDict.from_json('{"a": {"b": [1, {"c": 2}]}}').a.b[1].c
+            2
+        """
+        return cls._decode(cls._json_decoder(**kwargs), s)
+
+    @classmethod
+    def load_json(cls, fp: IO, **kwargs) -> 'AttyDict':
+        """like :meth:`AttyDict.from_json` but reads from a text or binary file object."""
+        return cls.from_json(fp.read(), **kwargs)
+
+    @classmethod
+    def iter_json_lines(cls, lines: Iterable[Union[str, bytes]], **kwargs) -> Iterator['AttyDict']:
+        """lazily parse JSON Lines yielding an ``AttyDict`` per line, blank lines are skipped.
+
+        ``lines`` can be a text or binary file object or any other iterable of lines.
+
+        Example:
+            >>> from collectionish import AttyDict
+            >>>
+            >>> [d.a for d in AttyDict.iter_json_lines(['{"a": 1}', '', '{"a": 2}'])]
+            [1, 2]
+        """
+        decoder = cls._json_decoder(**kwargs)
+        for line in lines:
+            if line.strip():
+                yield cls._decode(decoder, line)
+
+    @classmethod
+    def schema(cls, *keys: str, name: str = 'AttyRecord') -> type:
+        """create a record class with a slot for each of ``keys``.
+
+        Instances of the record class behave like this ``AttyDict`` type but dot access to
+        ``keys`` is a plain attribute lookup and they use a lot less memory. Keys outside the
+        schema are still allowed, they are kept in a dict on the side. See
+        :class:`AttyRecord`.
+
+        calling ``schema`` again with the same keys returns the same class.
+
+        Example:
+            >>> from collectionish import AttyDict
+            >>>
+            >>> Point = AttyDict.schema('x', 'y')
+            >>> Point(x=1, y=2).y
+            2
+        """
+        from collectionish._attyrecord import _make_schema
+
+        return _make_schema(cls, keys, name)
+
+    @classmethod
+    def schema_of(cls, sample: Mapping[str, Any], name: str = 'AttyRecord') -> type:
+        """like :meth:`AttyDict.schema` using the keys of ``sample``."""
+        return cls.schema(*sample, name=name)
+
+    def derive(
+        self, changes: Optional[Mapping[Union[str, Tuple[str, ...]], Any]] = None, **kwargs
+    ) -> 'AttyDict[T]':
+        """return a copy with some values changed which shares everything else with this one.
+
+        ``changes`` maps keys to new values, nested values can be changed with a dotted path
+        (or a tuple of keys). Only the dicts along a changed path are copied, any other nested
+        values are shared between the original and the result rather than copied. So rather
+        than changing a shared nested value in place you should ``derive`` the change.
+
+        Example:
+            >>> from collectionish import AttyDict
+            >>>
+            >>> base = AttyDict(db={'host': 'localhost', 'port': 5432}, cache={'size': 10})
+            >>> tenant = base.derive({'db.host': 'tenant.db'}, name='tenant')
+            >>> tenant
+            {'db': {'host': 'tenant.db', 'port': 5432}, 'cache': {'size': 10}, 'name': 'tenant'}
+            >>> base.db.host
+            'localhost'
+            >>> tenant.cache is base.cache
+            True
+        """
+        top: Dict[str, Any] = {}
+        nested: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+        # keys can be tuple paths here, which _unpack_args passes through untouched
+        for path, value in _unpack_args(changes, **kwargs):  # type: ignore[arg-type]
+            first, *rest = path.split('.') if isinstance(path, str) else path
+            if rest:
+                nested.setdefault(first, {})[tuple(rest)] = value
+            else:
+                top[first] = value
+        for first, sub in nested.items():
+            base = top[first] if first in top else dict.get(self, first, {})
+            if not isinstance(base, Mapping):
+                raise TypeError(f'cannot derive {first!r}, it is not a mapping')
+            if not isinstance(base, AttyDict):
+                base = self.__class__(base)
+            top[first] = base.derive(sub)
+        # the constructor would copy nested lists and tuples, only the changes need converting
+        derived = self.__class__()
+        dict.update(derived, self)
+        dict.update(derived, self.__class__(top))
+        return derived
+
+    def to_dict(self) -> Dict[str, Any]:
+        """return this (and everything nested in it) as plain ``dict``, ``list`` and ``tuple``.
+
+        This isn't a deep copy: lists, dicts and tuples which are already plain are shared with
+        the original rather than copied, so changing them in the result changes this too. See
+        :func:`collectionish.ops.to_plain`.
+
+        Example:
+            >>> from collectionish import AttyDict
+            >>>
+            >>> d = AttyDict(a={'b': [{'c': 1}]}).to_dict()
+            >>> type(d['a']['b'][0])
+            <class 'dict'>
+        """
+        from collectionish.ops import to_plain
+
+        return to_plain(self)
+
+    @classmethod
+    def _validate_key(cls, s: str):
         if not isinstance(s, str):
-            raise TypeError(f'{self.__class__.__name__} keys must be strings.')
+            raise TypeError(f'{cls.__name__} keys must be strings.')
         if not is_valid_identifier(s):
-            raise SyntaxError(f'{self.__class__.__name__} keys must be valid python identifiers.')
+            raise SyntaxError(f'{cls.__name__} keys must be valid python identifiers.')
+
+    # change tracking
+
+    __changes: Optional[_Tracker] = None
+
+    def _track(self, changes: Optional[Dict[Path, None]], path: Path = ()):
+        # attach (or with changes=None detach) this and any nested AttyDicts to a tracker
+        object.__setattr__(self, '_AttyDict__changes', None if changes is None else (changes, path))
+        for k, v in dict.items(self):
+            if isinstance(v, AttyDict):
+                v._track(changes, path + (k,))
+
+    def _record_change(self, key: str, value: Any, old: Any = None):
+        # call before ``value`` replaces ``old`` under key, value is Sentry() for deletions
+        changes, path = self.__changes  # type: ignore
+        if isinstance(old, AttyDict) and old is not value and old.__changes is not None:
+            if old.__changes[0] is changes:
+                old._track(None)
+        path = path + (key,)
+        if isinstance(value, AttyDict):
+            value._track(changes, path)
+        changes.pop(path, None)
+        changes[path] = None
+
+    def _tracked(self) -> _Tracker:
+        if self.__changes is None:
+            raise ValueError(f'changes to this {self.__class__.__name__} are not being tracked')
+        return self.__changes
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # copies and unpickled dicts aren't tracked, sharing the tracker would record their
+        # changes (including the copying itself) as changes to this dict.
+        state = dict(self.__dict__)
+        state.pop('_AttyDict__changes', None)
+        return state
+
+    def track_changes(self, enabled: bool = True):
+        """start (or with ``enabled=False`` stop) recording which paths are set or deleted.
+
+        changes are recorded for this dict and the ``AttyDict`` values nested in it, changes made
+        inside lists aren't tracked. See :meth:`AttyDict.dirty_paths`, :meth:`AttyDict.patch`
+        and :meth:`AttyDict.checkpoint`. When changes aren't being tracked there's next to no
+        overhead.
+
+        Example:
+            >>> from collectionish import AttyDict
+            >>>
+            >>> state = AttyDict(user={'name': 'ada', 'visits': 1}, theme='dark')
+            >>> state.track_changes()
+            >>> state.user.visits += 1
+            >>> del state['theme']
+            >>> state.dirty_paths()
+            ('user.visits', 'theme')
+            >>> state.checkpoint()
+            {'user.visits': 2, 'theme': Sentry()}
+            >>> state.dirty_paths()
+            ()
+        """
+        self._track({} if enabled else None)
+
+    def _dirty(self) -> List[Path]:
+        changes, path = self._tracked()
+        n = len(path)
+        return [p[n:] for p in changes if p[:n] == path and len(p) > n]
+
+    def dirty_paths(self) -> Tuple[str, ...]:
+        """the dotted paths set or deleted since the last checkpoint, in the order they changed."""
+        return tuple('.'.join(p) for p in self._dirty())
+
+    def patch(self) -> Dict[str, Any]:
+        """the changes since the last checkpoint as a dict of dotted paths to new values.
+
+        deleted paths map to ``Sentry()``. Paths nested in another changed path are left out
+        since the value of the outer path already includes them. Values aren't copied.
+        """
+        dirty = self._dirty()
+        dirty_set = set(dirty)
+        patch: Dict[str, Any] = {}
+        for path in dirty:
+            if any(path[:i] in dirty_set for i in range(1, len(path))):
+                continue
+            value: Any = self
+            for k in path:
+                if not isinstance(value, Mapping) or k not in value:
+                    value = Sentry()
+                    break
+                value = value[k]
+            patch['.'.join(path)] = value
+        return patch
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """return the :meth:`AttyDict.patch` since the last checkpoint and start a new one."""
+        patch = self.patch()
+        changes, path = self._tracked()
+        n = len(path)
+        for p in [p for p in changes if p[:n] == path]:
+            del changes[p]
+        return patch
+
+    def apply_patch(self, patch: Mapping[str, Any]):
+        """apply a :meth:`AttyDict.patch` made from another ``AttyDict``.
+
+        missing dicts along a path are created and deleting a missing path does nothing.
+        """
+        for dotted, value in patch.items():
+            *parents, last = dotted.split('.')
+            target: Any = self
+            for k in parents:
+                if k not in target:
+                    if value is Sentry():
+                        break
+                    target[k] = {}
+                target = target[k]
+            else:
+                if value is not Sentry():
+                    target[last] = value
+                elif last in target:
+                    del target[last]
+
+    # mutation
 
     def __setitem__(self, key: str, value: T):
         if key not in self:
             self._validate_key(key)
-        dict.__setitem__(self, key, self._attrify(value))
+        value = self._attrify(value)
+        if self.__changes is not None:
+            self._record_change(key, value, dict.get(self, key))
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str):
+        old = dict.pop(self, key)
+        if self.__changes is not None:
+            self._record_change(key, Sentry(), old)
+
+    def pop(self, key: str, *default: Any) -> T:
+        if self.__changes is not None and key in self:
+            self._record_change(key, Sentry(), dict.get(self, key))
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Tuple[str, T]:
+        key, value = dict.popitem(self)
+        if self.__changes is not None:
+            self._record_change(key, Sentry(), value)
+        return key, value
 
-    def update(self, **kwargs):
-        for k, v in kwargs.items():
+    def setdefault(self, key: str, default: Any = None) -> T:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        if self.__changes is not None:
+            for k, v in dict.items(self):
+                self._record_change(k, Sentry(), v)
+        dict.clear(self)
+
+    def update(  # type: ignore[override]
+        self, iterable_or_mapping: Optional[InitFromT] = None, **kwargs
+    ):
+        """update from a mapping or iterable of key value pairs and/or keyword arguments.
+
+        updating from another instance of the same type is done in bulk since its keys are
+        already valid and its values already converted, so its nested values are shared rather
+        than copied as they are when creating a new ``AttyDict`` from it.
+        """
+        if type(iterable_or_mapping) is type(self) and self.__changes is None:
+            dict.update(self, iterable_or_mapping)  # type: ignore
+            iterable_or_mapping = None
+        for k, v in _unpack_args(iterable_or_mapping, **kwargs):
             self[k] = v
 
+    def __ior__(self, other: Any):  # type: ignore[misc]
+        # dict's |= would skip __setitem__, so values wouldn't be converted or changes tracked
+        self.update(other)
+        return self
+
     def __getattr__(self, key: str) -> T:
         try:
             return self[key]  # type:ignore
         except KeyError:
             raise AttributeError(key)
+
+
+class FrozenAttyDict(AttyDict[T]):
+
+    """An immutable and hashable :class:`AttyDict`.
+
+    Nested values are frozen too: dicts become ``FrozenAttyDict``, lists become tuples and sets
+    become frozensets. The hash is worked out the first time it's needed and then cached, and
+    comparing two ``FrozenAttyDict`` with different hashes doesn't look at their items.
+
+    Freezing an existing ``AttyDict`` doesn't validate its keys again.
+
+    Example:
+
+        >>> from collectionish import AttyDict, FrozenAttyDict
+        >>>
+        >>> config = FrozenAttyDict(AttyDict(db={'hosts': ['a', 'b']}))
+        >>> config.db.hosts
+        ('a', 'b')
+        >>> {config: 'cached'}[FrozenAttyDict(db={'hosts': ['a', 'b']})]
+        'cached'
+        >>> config.db.port = 80
+        Traceback (most recent call last):
+        ...
+        TypeError: FrozenAttyDict is immutable
+    """
+
+    __hash: Optional[int] = None
+
+    def __init__(self, iterable_or_mapping: Optional[InitFromT] = None, **kwargs):
+        if type(iterable_or_mapping) is type(self):
+            dict.update(self, iterable_or_mapping)  # type: ignore
+            iterable_or_mapping = None
+        elif isinstance(iterable_or_mapping, AttyDict):
+            dict.update(self, self._frozen_items(iterable_or_mapping.items()))
+            iterable_or_mapping = None
+        for k, v in _unpack_args(iterable_or_mapping, **kwargs):
+            self._validate_key(k)
+            dict.__setitem__(self, k, self._attrify(v))
+
+    @classmethod
+    def _frozen_items(cls, items: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        for k, v in items:
+            yield k, cls._attrify(v)
+
+    @classmethod
+    def _from_valid_items(cls, items: Iterable[Tuple[str, Any]]) -> 'FrozenAttyDict':
+        new = cls()
+        dict.update(new, cls._frozen_items(items))
+        return new
+
+    @classmethod
+    def _attrify(cls, value):
+        if isinstance(value, dict):
+            if isinstance(value, cls):
+                return value
+            if isinstance(value, AttyDict):
+                return cls._from_valid_items(value.items())
+            return cls(value)
+        if isinstance(value, list):
+            return tuple(map(cls._attrify, value))
+        if isinstance(value, tuple):
+            return type(value)(cls._attrify(v) for v in value)
+        if isinstance(value, set):
+            return frozenset(value)
+        return value
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f'{self.__class__.__name__} is immutable')
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = _immutable  # type: ignore
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore
+
+    def __ior__(self, other):  # type: ignore[misc]
+        self._immutable()
+
+    def _track(self, changes: Optional[Dict[Path, None]], path: Path = ()):
+        # nothing in here can change
+        pass
+
+    def __hash__(self) -> int:  # type: ignore
+        h = self.__hash
+        if h is None:
+            h = hash(frozenset(self.items()))
+            object.__setattr__(self, '_FrozenAttyDict__hash', h)
+        return h
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, FrozenAttyDict):
+            try:
+                if hash(self) != hash(other):
+                    return False
+            except TypeError:
+                # some values aren't hashable, compare them one by one
+                pass
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __reduce__(self):
+        return (self.__class__._from_valid_items, (tuple(dict.items(self)),))
+
+
+class _LazyList(list):
+
+    """A list whose items are converted by ``convert`` the first time they're accessed."""
+
+    __slots__ = ('_convert',)
+
+    def __init__(self, iterable: Iterable = (), convert: Optional[Callable[[Any], Any]] = None):
+        super().__init__(iterable)
+        self._convert = convert
+
+    def _get(self, i: int):
+        value = list.__getitem__(self, i)
+        if self._convert is not None and isinstance(value, (dict, list, tuple)):
+            converted = self._convert(value)
+            if converted is not value:
+                list.__setitem__(self, i, converted)
+            return converted
+        return value
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._get(j) for j in range(*i.indices(len(self)))]
+        return self._get(i)
+
+    def __iter__(self) -> Iterator:
+        return map(self._get, range(len(self)))
+
+    def __reversed__(self) -> Iterator:
+        return map(self._get, reversed(range(len(self))))
+
+    def pop(self, i: int = -1):  # type: ignore[override]
+        value = self._get(i)
+        list.pop(self, i)
+        return value
+
+
+class LazyAttyDict(AttyDict[T]):
+
+    """An :class:`AttyDict` which converts nested values on first access.
+
+    A regular ``AttyDict`` converts every nested ``dict``, ``list`` and ``tuple`` as soon as
+    it's set, which means copying the whole tree up front. ``LazyAttyDict`` stores nested
+    values as they are and only converts them (one level at a time) when they're first
+    accessed. The converted value is cached back in the parent so it's only converted once and
+    changes to it stick.
+
+    Keys of nested dicts are validated when they're converted rather than on construction.
+    The containers you pass in are never modified.
+
+    Example:
+
+        >>> from collectionish import LazyAttyDict
+        >>>
+        >>> raw = {'a': {'b': {'c': 1}}, 'd': [{'e': 2}]}
+        >>> lazy = LazyAttyDict(raw)
+        >>> type(dict.__getitem__(lazy, 'a'))
+        <class 'dict'>
+
+        >>> lazy.a.b.c
+        1
+        >>> type(dict.__getitem__(lazy, 'a'))
+        <class 'collectionish._attydict.LazyAttyDict'>
+
+        >>> lazy.d[0].e
+        2
+    """
+
+    __converted: Dict[str, Any]
+
+    def __init__(self, iterable_or_mapping: Optional[InitFromT] = None, **kwargs):
+        # the converted value for each key that has been accessed, if the stored value is
+        # still that object it doesn't need converting again.
+        object.__setattr__(self, '_LazyAttyDict__converted', {})
+        super().__init__(iterable_or_mapping, **kwargs)
+
+    @classmethod
+    def _attrify(cls, value):
+        return value
+
+    @classmethod
+    def _convert(cls, value):
+        # convert a single level, anything below this one is left for its own first access
+        if isinstance(value, dict):
+            return value if isinstance(value, cls) else cls(value)
+        if isinstance(value, list):
+            return value if isinstance(value, _LazyList) else _LazyList(value, cls._convert)
+        if isinstance(value, tuple):
+            return type(value)(cls._convert(v) for v in value)
+        return value
+
+    def __getitem__(self, key: str) -> T:
+        value = dict.__getitem__(self, key)
+        if isinstance(value, (dict, list, tuple)) and self.__converted.get(key) is not value:
+            value = self._convert(value)
+            dict.__setitem__(self, key, value)
+            self.__converted[key] = value
+            tracker: Optional[_Tracker] = self._AttyDict__changes  # type: ignore
+            if tracker is not None and isinstance(value, AttyDict):
+                value._track(tracker[0], tracker[1] + (key,))
+        return value
+
+    def get(self, key: str, default: Optional[T] = None) -> Optional[T]:  # type: ignore
+        return self[key] if key in self else default
+
+    # converted values are dropped along with their keys so they aren't kept alive
+
+    def __setitem__(self, key: str, value: T):
+        super().__setitem__(key, value)
+        self.__converted.pop(key, None)
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self.__converted.pop(key, None)
+
+    def pop(self, key: str, *default: Any) -> T:
+        if key not in self:
+            return dict.pop(self, key, *default)
+        value = self[key]
+        super().pop(key)
+        self.__converted.pop(key, None)
+        return value
+
+    def popitem(self) -> Tuple[str, T]:
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def clear(self):
+        super().clear()
+        self.__converted.clear()
+
+    def _convert_all(self):
+        for k in self:
+            self[k]
+
+    def values(self):  # type: ignore
+        self._convert_all()
+        return super().values()
+
+    def items(self):  # type: ignore
+        self._convert_all()
+        return super().items()
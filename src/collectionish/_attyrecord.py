@@ -0,0 +1,157 @@
+from typing import Any, ClassVar, Dict, FrozenSet, Iterator, MutableMapping, Optional, Tuple, Type
+from functools import lru_cache
+
+from collectionish._attydict import AttyDict, InitFromT, T, _unpack_args
+
+
+class AttyRecord(MutableMapping[str, T]):
+
+    """The base class for :meth:`AttyDict.schema` record classes.
+
+    A record class has a slot for each key in its schema, so reading one with dot access is a
+    plain attribute lookup and an instance takes a fraction of the memory of a dict. Otherwise
+    it behaves like the :class:`AttyDict` it was made from: nested values get dot access too,
+    keys must be valid identifiers and keys outside the schema (or keys which clash with
+    mapping methods, like ``items``) are kept in a dict on the side.
+
+    A schema key which hasn't been set is simply missing from the mapping.
+
+    Example:
+
+        >>> from collectionish import AttyDict
+        >>>
+        >>> Point = AttyDict.schema('x', 'y')
+        >>> p = Point(x=1, y=2)
+        >>> p.x
+        1
+        >>> p.label = 'origin'
+        >>> dict(p)
+        {'x': 1, 'y': 2, 'label': 'origin'}
+        >>> p == {'x': 1, 'y': 2, 'label': 'origin'}
+        True
+    """
+
+    __slots__ = ('_extra',)
+
+    _extra: Optional[Dict[str, T]]
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _fieldset: ClassVar[FrozenSet[str]] = frozenset()
+    _dict_cls: ClassVar[Type[AttyDict]] = AttyDict
+    _attrify = AttyDict._attrify
+    # the arguments to _make_schema which made this class
+    _schema: ClassVar[Optional[Tuple[Type[AttyDict], Tuple[str, ...], str]]] = None
+
+    def __init__(self, iterable_or_mapping: Optional[InitFromT] = None, **kwargs):
+        object.__setattr__(self, '_extra', None)
+        for k, v in _unpack_args(iterable_or_mapping, **kwargs):
+            self[k] = v
+
+    def _extras(self) -> Dict[str, T]:
+        if self._extra is None:
+            object.__setattr__(self, '_extra', {})
+        return self._extra  # type: ignore
+
+    def __getitem__(self, key: str) -> T:
+        if key in self._fieldset:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: T):
+        if key in self._fieldset:
+            object.__setattr__(self, key, self._attrify(value))
+            return
+        extra = self._extras()
+        if key not in extra:
+            self._dict_cls._validate_key(key)
+        extra[key] = self._attrify(value)
+
+    def __delitem__(self, key: str):
+        if key in self._fieldset:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __setattr__(self, key: str, value: T):
+        self[key] = value
+
+    def __getattr__(self, key: str) -> T:
+        # only called when normal lookup fails, so for extra keys and unset fields.
+        if key == '_extra':
+            raise AttributeError(key)
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for k in self._fields:
+            try:
+                object.__getattribute__(self, k)
+            except AttributeError:
+                continue
+            yield k
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def copy(self) -> 'AttyRecord[T]':
+        return self.__class__(self)
+
+    def __reduce__(self):
+        if self._schema is None:
+            return (self.__class__, (dict(self),))
+        # schema classes are made on the fly so can't be pickled by name, they're made again
+        return (_restore, (*self._schema, dict(self)))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+
+@lru_cache(maxsize=None)
+def _make_schema(
+    dict_cls: Type[AttyDict], keys: Tuple[str, ...], name: str
+) -> Type[AttyRecord]:
+    reserved = set(dir(AttyRecord))
+    for k in keys:
+        dict_cls._validate_key(k)
+    # private names would be mangled as slots, so they go with the reserved ones
+    fields = tuple(
+        k for k in dict.fromkeys(keys) if k not in reserved and not k.startswith('__')
+    )
+    namespace = {
+        '__slots__': fields,
+        '_fields': fields,
+        '_fieldset': frozenset(fields),
+        '_dict_cls': dict_cls,
+        # lazy dicts convert a level at a time rather than not at all
+        '_attrify': getattr(dict_cls, '_convert', dict_cls._attrify),
+        '_schema': (dict_cls, keys, name),
+        '__module__': AttyRecord.__module__,
+    }
+    return type(name, (AttyRecord,), namespace)
+
+
+def _restore(
+    dict_cls: Type[AttyDict], keys: Tuple[str, ...], name: str, items: Dict[str, Any]
+) -> AttyRecord:
+    return _make_schema(dict_cls, keys, name)(items)
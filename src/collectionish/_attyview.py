@@ -0,0 +1,136 @@
+from typing import Any, Iterator, Mapping, MutableMapping, MutableSequence, Sequence, Union
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return AttyView(value)
+    if isinstance(value, (list, tuple)):
+        return _SequenceView(value)
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, (AttyView, _SequenceView)):
+        return value._data
+    return value
+
+
+class _SequenceView(MutableSequence):
+
+    """A view over a list or tuple which wraps nested dicts and lists as they're accessed."""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Sequence):
+        self._data = data
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            return [_wrap(v) for v in self._data[i]]
+        return _wrap(self._data[i])
+
+    def __setitem__(self, i: Union[int, slice], value: Any):
+        if isinstance(i, slice):
+            self._data[i] = [_unwrap(v) for v in value]  # type: ignore
+        else:
+            self._data[i] = _unwrap(value)  # type: ignore
+
+    def __delitem__(self, i: Union[int, slice]):
+        del self._data[i]  # type: ignore
+
+    def insert(self, i: int, value: Any):
+        self._data.insert(i, _unwrap(value))  # type: ignore
+
+    def __iter__(self) -> Iterator:
+        return map(_wrap, self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._data == _unwrap(other)
+
+    def __reduce__(self):
+        return (self.__class__, (self._data,))
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+
+class AttyView(MutableMapping[str, Any]):
+
+    """Dot access over an existing mapping without copying it.
+
+    ``AttyView`` is for when you want :class:`AttyDict` style access to a dict you don't own.
+    Nothing is copied or converted up front: nested dicts and lists are wrapped in views as
+    they are accessed and any changes (through attributes or items) are made to the
+    underlying data. Views only have a single slot so creating them is cheap.
+
+    Unlike :class:`AttyDict`, keys aren't validated since the mapping belongs to someone else.
+    Keys which aren't valid identifiers (or clash with mapping methods) are still available
+    through item access.
+
+    Example:
+
+        >>> from collectionish import AttyView
+        >>>
+        >>> data = {'user': {'name': 'ada', 'roles': [{'name': 'admin'}]}}
+        >>> view = AttyView(data)
+        >>> view.user.roles[0].name
+        'admin'
+
+        writes go through to the original dict:
+
+        >>> view.user.name = 'grace'
+        >>> data['user']['name']
+        'grace'
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Mapping[str, Any]):
+        object.__setattr__(self, '_data', data)
+
+    def __getitem__(self, key: str) -> Any:
+        return _wrap(self._data[key])
+
+    def __setitem__(self, key: str, value: Any):
+        self._data[key] = _unwrap(value)
+
+    def __delitem__(self, key: str):
+        del self._data[key]
+
+    def __getattr__(self, key: str) -> Any:
+        if key == '_data':
+            raise AttributeError(key)
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __setattr__(self, key: str, value: Any):
+        self[key] = value
+
+    def __delattr__(self, key: str):
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: Any) -> bool:
+        return self._data == _unwrap(other)
+
+    def __reduce__(self):
+        return (self.__class__, (self._data,))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._data!r})'
@@ -0,0 +1,194 @@
+from typing import Any, List, Optional, Tuple
+from heapq import heapify, heappop, heappush
+import math
+
+from collectionish._numdict import NumDict, NumT, _neumaier_add
+from collectionish._sentry import Sentry
+
+
+_MISSING = Sentry()
+
+# stale heap entries are only cleared out when popped, once a heap is this many times larger
+# than the dict (plus a little slack for small dicts) it's rebuilt from scratch.
+_HEAP_GROWTH = 2
+_HEAP_SLACK = 32
+
+_Heap = List[Tuple[Any, str]]
+
+
+class IncrementalNumDict(NumDict):
+
+    """A :class:`NumDict` which keeps its aggregates up to date as it changes.
+
+    The sum is updated on every change (including in place operators) rather than computed
+    on demand, so ``sum`` and ``mean`` are constant time. The running sum is compensated
+    (Neumaier summation) so float error doesn't build up however many times values change.
+
+    ``min`` and ``max`` use heaps which are only built the first time they're asked for and
+    after that are kept up to date on every change. Replaced and deleted values aren't removed
+    from the heaps straight away, they're dropped when they reach the top (or when the heap
+    gets too big), so ``min`` and ``max`` are amortized ``O(log n)``.
+
+    ``inf``, ``-inf`` and ``nan`` are counted rather than added to the running sum, so ``sum``
+    gives ``inf`` or ``nan`` while they're in the dict and goes back to the sum of the other
+    values once they're replaced. ``min`` and ``max`` are ``nan`` whenever a value is ``nan``.
+
+    Example:
+        >>> from collectionish import IncrementalNumDict
+        >>>
+        >>> counters = IncrementalNumDict(a=1, b=5, c=3)
+        >>> counters.max()
+        5
+        >>> counters['b'] = 0
+        >>> counters += 1
+        >>> counters.sum(), counters.max(), counters.min()
+        (7, 4, 1)
+    """
+
+    def __init__(self, *args: Any, **kwargs: NumT):
+        super().__init__(*args, **kwargs)
+        self._reset()
+
+    def _reset(self):
+        # the compensated sum of the finite values, None when it's overflowed and has to be
+        # worked out from scratch. inf, -inf and nan are counted instead as subtracting them
+        # back out of a running sum can only give nan. typed Any as NumT includes Number,
+        # which has no arithmetic.
+        self._sum: Optional[Any] = 0
+        self._compensation: Any = 0
+        self._inf = self._neg_inf = self._nan = 0
+        self._min_heap: Optional[_Heap] = None
+        self._max_heap: Optional[_Heap] = None
+        for v in self.values():
+            self._add_to_sum(v, 1)
+
+    def _add_to_sum(self, value: Any, sign: int):
+        if isinstance(value, float) and not math.isfinite(value):
+            if value != value:
+                self._nan += sign
+            elif value > 0:
+                self._inf += sign
+            else:
+                self._neg_inf += sign
+        elif self._sum is not None:
+            self._sum, self._compensation = _neumaier_add(
+                self._sum, self._compensation, sign * value
+            )
+            if isinstance(self._sum, float) and not math.isfinite(self._sum):
+                self._sum = None
+
+    def _finite_sum(self) -> NumT:
+        if self._sum is None:
+            total: Any = 0
+            compensation: Any = 0
+            for v in self.values():
+                total, compensation = _neumaier_add(total, compensation, v)
+            if isinstance(total, float) and not math.isfinite(total):
+                # still overflows, it'll be worked out again next time
+                return total
+            self._sum, self._compensation = total, compensation
+        return self._sum + self._compensation
+
+    def _push(self, key: str, value: Any):
+        if value != value:
+            # nan doesn't order so it's kept out of the heaps, it's counted instead
+            return
+        if self._min_heap is not None:
+            heappush(self._min_heap, (value, key))
+            if len(self._min_heap) > _HEAP_GROWTH * len(self) + _HEAP_SLACK:
+                self._min_heap = None
+        if self._max_heap is not None:
+            heappush(self._max_heap, (-value, key))
+            if len(self._max_heap) > _HEAP_GROWTH * len(self) + _HEAP_SLACK:
+                self._max_heap = None
+
+    def _changed(self, key: str, old: Any, new: Any):
+        if old is not _MISSING:
+            self._add_to_sum(old, -1)
+        if new is not _MISSING:
+            self._add_to_sum(new, 1)
+            self._push(key, new)
+
+    def _top(self, heap: _Heap, sign: int) -> NumT:
+        while heap:
+            value, key = heap[0]
+            if dict.get(self, key, _MISSING) == sign * value:
+                return sign * value
+            heappop(heap)
+        raise ValueError(f'{"min" if sign == 1 else "max"}() of an empty {self.__class__.__name__}')
+
+    # mutation
+
+    def __setitem__(self, key: str, value: NumT):
+        old = dict.get(self, key, _MISSING)
+        super().__setitem__(key, value)
+        self._changed(key, old, value)
+
+    def __delitem__(self, key: str):
+        old = self[key]
+        super().__delitem__(key)
+        self._changed(key, old, _MISSING)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        old = dict.get(self, key, _MISSING)
+        value = super().pop(key, *default)
+        if old is not _MISSING:
+            self._changed(key, old, _MISSING)
+        return value
+
+    def popitem(self) -> Tuple[str, NumT]:
+        key, value = super().popitem()
+        self._changed(key, value, _MISSING)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: NumT):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def __ior__(self, other: Any):  # type: ignore[misc]
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._reset()
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    # special aggregation ops
+
+    def min(self):
+        """return the minimum value in this numdict."""
+        if self._nan:
+            return math.nan
+        if self._min_heap is None:
+            self._min_heap = [(v, k) for k, v in self.items() if v == v]
+            heapify(self._min_heap)
+        return self._top(self._min_heap, 1)
+
+    def max(self):
+        """return the maximum value in this numdict."""
+        if self._nan:
+            return math.nan
+        if self._max_heap is None:
+            self._max_heap = [(-v, k) for k, v in self.items() if v == v]
+            heapify(self._max_heap)
+        return self._top(self._max_heap, -1)
+
+    def sum(self):
+        """return the sum of the values in this numdict."""
+        if self._nan or (self._inf and self._neg_inf):
+            return math.nan
+        if self._inf or self._neg_inf:
+            return math.inf if self._inf else -math.inf
+        return self._finite_sum()
+
+    def mean(self):
+        """return the mean (average) of the values in this numdict."""
+        return self.sum() / len(self)
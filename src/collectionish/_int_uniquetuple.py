@@ -0,0 +1,243 @@
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union, overload
+from array import array
+from bisect import bisect_left
+import sys
+
+from collectionish._uniquetuple import UniqueTuple
+from collectionish import _vectorized
+
+
+# when the range of values is at most this many bits per value we use a bitmap for lookups
+_MAX_BITS_PER_VALUE = 64
+
+
+def _as_int(value: Any) -> Optional[int]:
+    if isinstance(value, int):
+        return value
+    try:
+        as_int = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return as_int if as_int == value else None
+
+
+class _Bitmap:
+
+    __slots__ = ('lo', 'bits')
+
+    def __init__(self, lo: int, hi: int):
+        self.lo = lo
+        self.bits = bytearray(((hi - lo) >> 3) + 1)
+
+    def add(self, value: int) -> bool:
+        """set the bit for value returning False if it was already set."""
+        i = value - self.lo
+        byte, bit = i >> 3, 1 << (i & 7)
+        bits = self.bits
+        if bits[byte] & bit:
+            return False
+        bits[byte] |= bit
+        return True
+
+    def __contains__(self, value: int) -> bool:
+        i = value - self.lo
+        if i < 0 or (i >> 3) >= len(self.bits):
+            return False
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.bits)
+
+
+class _SortedLookup:
+
+    __slots__ = ('values',)
+
+    def __init__(self, values: array):
+        self.values = array(values.typecode, sorted(values))
+
+    def __contains__(self, value: int) -> bool:
+        values = self.values
+        i = bisect_left(values, value)
+        return i < len(values) and values[i] == value
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.values)
+
+
+def _fits_int64(dtype) -> bool:
+    return dtype.kind in 'bi' or (dtype.kind == 'u' and dtype.itemsize < 8)
+
+
+def _is_dense(lo: int, hi: int, n: int) -> bool:
+    return hi - lo < _MAX_BITS_PER_VALUE * n
+
+
+class IntUniqueTuple(Sequence[int]):
+
+    """A compact :class:`UniqueTuple` for 64 bit integers.
+
+    Values are stored in an :py:class:`array.array` of signed 64 bit integers (8 bytes each)
+    rather than as a tuple of boxed ints. Duplicates are dropped using a bitmap over the range
+    of values when the values are reasonably dense, so no temporary ``dict`` is needed. Sparse
+    values fall back to a ``dict`` to dedupe and a sorted copy of the values for lookups.
+
+    Iteration, indexing, slicing and equality behave just like a ``UniqueTuple`` holding the
+    same values. Membership tests are constant time for dense values and logarithmic for
+    sparse ones. ``index`` checks membership first and then scans the underlying array.
+
+    Large numpy integer arrays are deduped with numpy and copied straight into the buffer.
+
+    The underlying buffer can be handed off without copying through :meth:`view` (or directly
+    via ``memoryview(...)`` on python 3.12 and above).
+
+    Example:
+
+        >>> from collectionish import IntUniqueTuple, UniqueTuple
+        >>>
+        >>> ids = IntUniqueTuple(3, 2, 3, 1)
+        >>> ids
+        IntUniqueTuple(3, 2, 1)
+        >>> 2 in ids
+        True
+        >>> ids == UniqueTuple(3, 2, 1)
+        True
+        >>> ids.view().tolist()
+        [3, 2, 1]
+    """
+
+    __slots__ = ('_values', '_lookup', '_hash')
+
+    _values: array
+    _lookup: Optional[Union[_Bitmap, _SortedLookup]]
+    _hash: Optional[int]
+
+    typecode = 'q'
+
+    def __init__(self, *args: int):
+        self._set_from(args)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[int]) -> 'IntUniqueTuple':
+        """create a new ``IntUniqueTuple`` from any iterable of ints in a single pass."""
+        new = cls.__new__(cls)
+        new._set_from(iterable)
+        return new
+
+    @classmethod
+    def _from_unique(cls, values: array, lookup=None) -> 'IntUniqueTuple':
+        new = cls.__new__(cls)
+        new._values = values
+        new._lookup = lookup
+        new._hash = None
+        return new
+
+    def _set_from(self, iterable: Iterable[int]):
+        self._hash = None
+        if isinstance(iterable, IntUniqueTuple):
+            # immutable, so we can share everything
+            self._values = iterable._values
+            self._lookup = iterable._lookup
+            return
+        # is_numeric_array means it's an ndarray, which mypy can't narrow it to
+        arr: Any = iterable
+        if _vectorized.is_numeric_array(arr) and _fits_int64(arr.dtype):
+            if _vectorized.use_numpy_unique(arr):
+                unique = _vectorized.unique_in_order(arr).astype('int64')
+                self._values, self._lookup = array(self.typecode, unique.tobytes()), None
+                return
+            iterable = arr.tolist()
+        raw = array(self.typecode, iterable)
+        if isinstance(iterable, UniqueTuple) or len(raw) < 2:
+            self._values, self._lookup = raw, None
+            return
+        lo, hi = min(raw), max(raw)
+        if _is_dense(lo, hi, len(raw)):
+            bitmap = _Bitmap(lo, hi)
+            self._values = array(self.typecode, filter(bitmap.add, raw))
+            self._lookup = bitmap
+        else:
+            self._values = array(self.typecode, dict.fromkeys(raw))
+            self._lookup = None
+
+    def _get_lookup(self):
+        if self._lookup is None:
+            values = self._values
+            if values and _is_dense(min(values), max(values), len(values)):
+                lookup = _Bitmap(min(values), max(values))
+                for v in values:
+                    lookup.add(v)
+            else:
+                lookup = _SortedLookup(values)
+            self._lookup = lookup
+        return self._lookup
+
+    def view(self) -> memoryview:
+        """return a read only :py:class:`memoryview` over the underlying values."""
+        return memoryview(self._values).toreadonly()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.view()
+
+    def __contains__(self, value: Any) -> bool:
+        as_int = _as_int(value)
+        return as_int is not None and as_int in self._get_lookup()
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        as_int = _as_int(value)
+        if as_int is None or as_int not in self._get_lookup():
+            raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+        i = self._values.index(as_int)
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if not start <= i < stop:
+            raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+        return i
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    @overload
+    def __getitem__(self, i: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> 'IntUniqueTuple':
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[int, 'IntUniqueTuple']:
+        if isinstance(i, slice):
+            return self._from_unique(self._values[i])
+        return self._values[i]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, IntUniqueTuple):
+            return self._values == other._values
+        if isinstance(other, tuple):
+            return len(self) == len(other) and tuple(self._values) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self._values))
+        return self._hash
+
+    def __sizeof__(self) -> int:
+        size = object.__sizeof__(self) + sys.getsizeof(self._values)
+        if self._lookup is not None:
+            size += sys.getsizeof(self._lookup)
+        return size
+
+    def __reduce__(self):
+        return (self.__class__.from_iterable, (self._values,))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({", ".join(map(str, self._values))})'
@@ -1,9 +1,68 @@
-from typing import Dict, Union, Any, Optional
+from typing import Dict, Iterable, Mapping, Tuple, Union, Any, Optional
 from numbers import Number
 import operator
 
 NumT = Union[int, float, Number]
 
+_JOINS = ('left', 'outer')
+
+
+def _neumaier_add(total: Any, compensation: Any, value: Any) -> Tuple[Any, Any]:
+    # one step of Neumaier's compensated summation, the sum is total + compensation. the
+    # running values are typed Any as NumT includes Number, which has no arithmetic.
+    new = total + value
+    if new - new != 0:
+        # inf or nan (including overflow), compensating would only turn it into nan.
+        return new, compensation
+    if abs(total) >= abs(value):
+        compensation += (total - new) + value
+    else:
+        compensation += (value - new) + total
+    return new, compensation
+
+
+def _sum_into(totals: Dict[str, Any], numdict: Mapping[str, Any], outer: bool):
+    for k, v in numdict.items():
+        if k in totals:
+            totals[k] += v
+        elif outer:
+            totals[k] = v
+
+
+def _compensated_sum_into(
+    totals: Dict[str, Any],
+    compensations: Dict[str, Any],
+    numdict: Mapping[str, Any],
+    outer: bool,
+):
+    # _neumaier_add inlined, this is the hot loop
+    for k, v in numdict.items():
+        if k in totals:
+            total = totals[k]
+            new = totals[k] = total + v
+            if new - new != 0:
+                # inf or nan, just as in _neumaier_add
+                continue
+            if abs(total) >= abs(v):
+                compensations[k] += (total - new) + v
+            else:
+                compensations[k] += (v - new) + total
+        elif outer:
+            totals[k], compensations[k] = v, 0
+
+
+def _minmax_into(
+    lo: Dict[str, Any], hi: Dict[str, Any], numdict: Mapping[str, Any], outer: bool
+):
+    for k, v in numdict.items():
+        if k in lo:
+            if v < lo[k]:
+                lo[k] = v
+            if v > hi[k]:
+                hi[k] = v
+        elif outer:
+            lo[k] = hi[k] = v
+
 
 class NumDict(Dict[str, NumT]):
     """A dictionary that you can do basic math with as though it was a number.
@@ -163,6 +222,23 @@ class NumDict(Dict[str, NumT]):
 
         return NotImplemented
 
+    def lazy(self):
+        """return a :class:`NumExpr` over this numdict.
+
+        arithmetic on the result builds an expression which is only computed, in a single pass
+        over the keys, when you call :meth:`NumExpr.evaluate`.
+
+        Example:
+            >>> from collectionish import NumDict
+            >>>
+            >>> a, b, c = NumDict(x=1, y=2), NumDict(x=3, y=4), NumDict(x=2)
+            >>> ((a.lazy() + b) * c - 1).evaluate()
+            NumDict({'x': 7, 'y': 5})
+        """
+        from collectionish._numexpr import NumExpr
+
+        return NumExpr(self)
+
     # comparison ops
 
     def __eq__(self, other: Any):
@@ -277,6 +353,111 @@ class NumDict(Dict[str, NumT]):
         """return the mean (average) of the values in this numdict."""
         return self.sum() / len(self)
 
+    # streaming aggregation
+
+    @staticmethod
+    def _start(numdicts: Iterable[Mapping[str, NumT]], join: str):
+        # an iterator over numdicts along with the first one (or None if there aren't any)
+        if join not in _JOINS:
+            raise ValueError(f'join must be one of {_JOINS} not {join!r}')
+        iterator = iter(numdicts)
+        return next(iterator, None), iterator
+
+    @classmethod
+    def _sum_and_count(
+        cls, numdicts: Iterable[Mapping[str, NumT]], join: str, compensated: bool
+    ) -> Tuple[Dict[str, Any], int]:
+        first, rest = cls._start(numdicts, join)
+        if first is None:
+            return {}, 0
+        outer, totals, count = join == 'outer', dict(first), 1
+        if compensated:
+            compensations: Dict[str, Any] = dict.fromkeys(totals, 0)
+            for numdict in rest:
+                _compensated_sum_into(totals, compensations, numdict, outer)
+                count += 1
+            for k, compensation in compensations.items():
+                totals[k] += compensation
+            return totals, count
+        for numdict in rest:
+            _sum_into(totals, numdict, outer)
+            count += 1
+        return totals, count
+
+    @classmethod
+    def sum_many(
+        cls, numdicts: Iterable[Mapping[str, NumT]], join: str = 'left', compensated: bool = False
+    ) -> 'NumDict':
+        """sum any number of numdicts without building a new one for every step.
+
+        this gives the same result as ``functools.reduce(operator.add, numdicts)`` but adds
+        each numdict into a single running total so memory doesn't depend on how many there
+        are, ``numdicts`` can be any iterable (including a generator).
+
+        Args:
+            numdicts: an iterable of numdicts (or any mapping of keys to numbers).
+            join: ``'left'`` (the default) to keep only the keys of the first numdict, just like
+                ``+`` does, or ``'outer'`` for every key in any of them. Either way a missing
+                value counts as 0.
+            compensated: use Neumaier's compensated summation so float error doesn't build up
+                over long streams, this is a little slower.
+
+        Example:
+            >>> from collectionish import NumDict
+            >>>
+            >>> stream = (NumDict(a=i, b=1) for i in range(4))
+            >>> NumDict.sum_many(stream)
+            NumDict({'a': 6, 'b': 4})
+
+            >>> NumDict.sum_many([NumDict(a=1), NumDict(a=1, b=2)], join='outer')
+            NumDict({'a': 2, 'b': 2})
+
+            >>> NumDict.sum_many([NumDict(a=0.1)] * 10, compensated=True)
+            NumDict({'a': 1.0})
+        """
+        return cls(cls._sum_and_count(numdicts, join, compensated)[0])
+
+    @classmethod
+    def mean_many(
+        cls, numdicts: Iterable[Mapping[str, NumT]], join: str = 'left', compensated: bool = False
+    ) -> 'NumDict':
+        """the mean of any number of numdicts, the same as ``sum_many`` divided by how many.
+
+        takes the same arguments as :meth:`NumDict.sum_many`, so a key missing from some of the
+        numdicts counts as 0 for those.
+
+        Example:
+            >>> from collectionish import NumDict
+            >>>
+            >>> NumDict.mean_many(NumDict(a=i, b=1) for i in range(4))
+            NumDict({'a': 1.5, 'b': 1.0})
+        """
+        totals, count = cls._sum_and_count(numdicts, join, compensated)
+        return cls({k: v / count for k, v in totals.items()})
+
+    @classmethod
+    def minmax_many(
+        cls, numdicts: Iterable[Mapping[str, NumT]], join: str = 'left'
+    ) -> Tuple['NumDict', 'NumDict']:
+        """the smallest and largest value of each key over any number of numdicts.
+
+        ``join`` picks the keys just like :meth:`NumDict.sum_many`, but here missing values
+        are ignored rather than counted as anything.
+
+        Example:
+            >>> from collectionish import NumDict
+            >>>
+            >>> NumDict.minmax_many([NumDict(a=3, b=1), NumDict(a=-1), NumDict(a=2, b=5)])
+            (NumDict({'a': -1, 'b': 1}), NumDict({'a': 3, 'b': 5}))
+        """
+        first, rest = cls._start(numdicts, join)
+        if first is None:
+            return cls(), cls()
+        lo, hi, outer = dict(first), dict(first), join == 'outer'
+        for numdict in rest:
+            _minmax_into(lo, hi, numdict, outer)
+        return cls(lo), cls(hi)
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({dict.__repr__(self)})'
 
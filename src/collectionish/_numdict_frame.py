@@ -0,0 +1,342 @@
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from collectionish._array_numdict import (
+    ArrayNumDict,
+    _SCALARS,
+    _aligned,
+    _apply,
+    _as_values,
+    _positions_in,
+)
+from collectionish._numdict import NumDict, NumT
+from collectionish._uniquetuple import UniqueTuple
+from collectionish._vectorized import np
+
+
+class NumDictFrame(Sequence[ArrayNumDict]):
+
+    """A batch of numdicts with the same keys stored as the rows of one 2d numpy array.
+
+    The keys are stored once in a :class:`UniqueTuple` shared by every row. Rows are handed
+    out as :class:`ArrayNumDict` views of the array, nothing is copied, so changing a row
+    (setting an existing key or an in place operator) changes the frame. A row can't change
+    the type of the frame's values, so on an int frame ``row /= 2`` or setting a float raises
+    ``TypeError``. Adding or removing keys on a row detaches it from the frame.
+
+    Arithmetic with a number, a ``NumDict``, an ``ArrayNumDict`` or another frame of the same
+    length is broadcast over every row with the usual numdict semantics: keys come from the
+    frame and keys missing from the other operand are treated as the identity for the
+    operation. Comparisons give a frame of bools which, reduced with :meth:`NumDictFrame.any`
+    or :meth:`NumDictFrame.all`, can be used to select rows.
+
+    Aggregations take an ``axis``: ``0`` aggregates each key over the rows, giving an
+    ``ArrayNumDict``, ``1`` aggregates each row over the keys, giving an array with a value per
+    row.
+
+    ``NumDictFrame`` requires numpy.
+
+    Example:
+        >>> from collectionish import NumDict, NumDictFrame
+        >>>
+        >>> frame = NumDictFrame([NumDict(a=1, b=2), NumDict(a=3, b=4), NumDict(a=5, b=0)])
+        >>> frame.sum()
+        ArrayNumDict({'a': 9, 'b': 6})
+        >>> frame.sum(axis=1)
+        array([3, 7, 5])
+
+        >>> frame * NumDict(a=10)
+        NumDictFrame(keys=UniqueTuple('a', 'b'), rows=3)
+        >>> (frame * NumDict(a=10))[1]
+        ArrayNumDict({'a': 30, 'b': 4})
+
+        select rows with a mask:
+
+        >>> big = frame[(frame >= 3).any(axis=1)]
+        >>> big.to_numdicts()
+        [NumDict({'a': 3, 'b': 4}), NumDict({'a': 5, 'b': 0})]
+
+        rows are views:
+
+        >>> row = frame[0]
+        >>> row += 1
+        >>> frame[0]
+        ArrayNumDict({'a': 2, 'b': 3})
+    """
+
+    __slots__ = ('_keys', '_values')
+
+    def __init__(
+        self,
+        rows: Iterable[Mapping[str, NumT]],
+        keys: Optional[Iterable[str]] = None,
+        fill: Optional[NumT] = None,
+    ):
+        """
+        Args:
+            rows: numdicts (or any mappings of keys to numbers).
+            keys: the keys of the frame, taken from the first row if not given.
+            fill: value for keys missing from a row, if not given every row needs every key.
+                keys which aren't in the frame are always an error.
+        """
+        if np is None:
+            raise ImportError(f'{self.__class__.__name__} requires numpy')
+        rows = list(rows)
+        if keys is None:
+            keys = rows[0] if rows else ()
+        self._keys: UniqueTuple[str] = UniqueTuple.from_iterable(keys)
+        self._values = _as_values(
+            np.array([self._row_values(row, fill) for row in rows]).reshape(
+                len(rows), len(self._keys)
+            )
+        )
+
+    def _row_values(self, row: Mapping[str, NumT], fill: Optional[NumT]) -> List[NumT]:
+        keys = self._keys
+        missing = [k for k in keys if k not in row]
+        if len(row) + len(missing) > len(keys) or (missing and fill is None):
+            extra = [k for k in row if k not in keys]
+            raise ValueError(f'row has extra keys {extra} and is missing keys {missing}')
+        # fill is only used for missing keys, which there aren't any of if it's None
+        return [row.get(k, fill) for k in keys]  # type: ignore[arg-type]
+
+    @classmethod
+    def from_array(cls, keys: Iterable[str], values: Any) -> 'NumDictFrame':
+        """create a frame from keys and a 2d array with a column for each key.
+
+        the array is used as is where possible, not copied.
+        """
+        keys = UniqueTuple.from_iterable(keys)
+        values = _as_values(values)
+        if values.ndim != 2 or values.shape[1] != len(keys):
+            raise ValueError(f'expected an array of shape (n, {len(keys)}) got {values.shape}')
+        return cls._from_index(keys, values)
+
+    @classmethod
+    def _from_index(cls, keys: UniqueTuple, values: 'np.ndarray') -> 'NumDictFrame':
+        # nothing is checked or copied here
+        new = cls.__new__(cls)
+        new._keys = keys
+        new._values = values
+        return new
+
+    @property
+    def keys(self) -> UniqueTuple:
+        """the keys shared by every row."""
+        return self._keys
+
+    @property
+    def array(self) -> 'np.ndarray':
+        """a read only view of the values, one row per numdict and a column per key."""
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def column(self, key: str) -> 'np.ndarray':
+        """a read only view of the values of ``key`` in every row."""
+        return self.array[:, self._keys.index_by_key(key)]
+
+    def to_numdicts(self) -> List[NumDict]:
+        """copy every row into a plain :class:`NumDict`."""
+        keys = self._keys
+        return [NumDict(zip(keys, row)) for row in self._values.tolist()]
+
+    # arithmetic
+
+    def _operand(self, other: Any, noop: NumT) -> Any:
+        if isinstance(other, _SCALARS):
+            return other
+        if isinstance(other, (ArrayNumDict, NumDict)):
+            return _aligned(self._keys, other, noop)
+        if isinstance(other, NumDictFrame):
+            if len(other) != len(self):
+                raise ValueError(f'cannot combine frames of {len(self)} and {len(other)} rows')
+            take = _positions_in(self._keys, other._keys)
+            if take is None:
+                return other._values
+            padding = np.full((len(other), 1), noop, dtype=other._values.dtype)
+            return np.concatenate((other._values, padding), axis=1)[:, take]
+        return NotImplemented
+
+    def _apply_with_other(self, ufunc: Callable, other: Any, noop: NumT):
+        right = self._operand(other, noop)
+        if right is NotImplemented:
+            return NotImplemented
+        return self._from_index(self._keys, _apply(ufunc, self._values, right))
+
+    def _iapply_with_other(self, ufunc: Callable, other: Any, noop: NumT):
+        right = self._operand(other, noop)
+        if right is NotImplemented:
+            return NotImplemented
+        result = _apply(ufunc, self._values, right)
+        if result.dtype == self._values.dtype:
+            self._values[...] = result
+        else:
+            self._values = result
+        return self
+
+    def _rapply_with_other(self, ufunc: Callable, other: Any):
+        if isinstance(other, _SCALARS):
+            return self._from_index(self._keys, _apply(ufunc, other, self._values))
+        return NotImplemented
+
+    def _apply_comparison_with_other(self, ufunc: Callable, other: Any):
+        if isinstance(other, (ArrayNumDict, NumDict, NumDictFrame)):
+            other_keys = other._keys if isinstance(other, (ArrayNumDict, NumDictFrame)) else other
+            if set(other_keys) != set(self._keys):
+                raise RuntimeError(
+                    f'cannot compare {self.__class__.__name__}'
+                    f' to {other.__class__.__name__} when keys do not match!'
+                )
+        # keys match so noop is never used
+        return self._apply_with_other(ufunc, other, 0)
+
+    # comparison ops
+
+    def __ge__(self, other: Any):
+        return self._apply_comparison_with_other(np.greater_equal, other)
+
+    def __le__(self, other: Any):
+        return self._apply_comparison_with_other(np.less_equal, other)
+
+    def __gt__(self, other: Any):
+        return self._apply_comparison_with_other(np.greater, other)
+
+    def __lt__(self, other: Any):
+        return self._apply_comparison_with_other(np.less, other)
+
+    # standard numeric modifiers
+
+    def __abs__(self):
+        return self._from_index(self._keys, np.abs(self._values))
+
+    def __neg__(self):
+        values = self._values
+        if values.dtype.kind == 'b':
+            values = values.astype(np.int64)
+        return self._from_index(self._keys, -values)
+
+    # arithmetic ops
+
+    def __add__(self, other: Any):
+        return self._apply_with_other(np.add, other, noop=0)
+
+    def __iadd__(self, other: Any):
+        return self._iapply_with_other(np.add, other, noop=0)
+
+    def __radd__(self, other: Any):
+        return self._rapply_with_other(np.add, other)
+
+    def __sub__(self, other: Any):
+        return self._apply_with_other(np.subtract, other, noop=0)
+
+    def __isub__(self, other: Any):
+        return self._iapply_with_other(np.subtract, other, noop=0)
+
+    def __rsub__(self, other: Any):
+        return self._rapply_with_other(np.subtract, other)
+
+    def __mul__(self, other: Any):
+        return self._apply_with_other(np.multiply, other, noop=1)
+
+    def __imul__(self, other: Any):
+        return self._iapply_with_other(np.multiply, other, noop=1)
+
+    def __rmul__(self, other: Any):
+        return self._rapply_with_other(np.multiply, other)
+
+    def __truediv__(self, other: Any):
+        return self._apply_with_other(np.true_divide, other, noop=1)
+
+    def __itruediv__(self, other: Any):
+        return self._iapply_with_other(np.true_divide, other, noop=1)
+
+    def __rtruediv__(self, other: Any):
+        return self._rapply_with_other(np.true_divide, other)
+
+    def __pow__(self, other: Any):
+        return self._apply_with_other(np.power, other, noop=1)
+
+    def __ipow__(self, other: Any):
+        return self._iapply_with_other(np.power, other, noop=1)
+
+    def __rpow__(self, other: Any):
+        return self._rapply_with_other(np.power, other)
+
+    def __mod__(self, other: Any):
+        return self._apply_with_other(np.remainder, other, noop=1)
+
+    def __imod__(self, other: Any):
+        return self._iapply_with_other(np.remainder, other, noop=1)
+
+    def __rmod__(self, other: Any):
+        return self._rapply_with_other(np.remainder, other)
+
+    def __floordiv__(self, other: Any):
+        return self._apply_with_other(np.floor_divide, other, noop=1)
+
+    def __ifloordiv__(self, other: Any):
+        return self._iapply_with_other(np.floor_divide, other, noop=1)
+
+    def __rfloordiv__(self, other: Any):
+        return self._rapply_with_other(np.floor_divide, other)
+
+    # aggregation ops
+
+    def _aggregate(self, method: str, axis: int) -> Union[ArrayNumDict, 'np.ndarray']:
+        if axis not in (0, 1):
+            raise ValueError('axis must be 0 (over rows) or 1 (over keys)')
+        if not self._values.size and method in ('min', 'max', 'mean'):
+            raise ValueError(f'{method} of an empty {self.__class__.__name__}')
+        result = getattr(self._values, method)(axis=axis)
+        if axis == 0:
+            return ArrayNumDict._from_index(self._keys, _as_values(result))
+        return result
+
+    def sum(self, axis: int = 0):
+        """sum each key over the rows (``axis=0``) or each row over the keys (``axis=1``)."""
+        return self._aggregate('sum', axis)
+
+    def mean(self, axis: int = 0):
+        """mean of each key over the rows (``axis=0``) or each row over the keys (``axis=1``)."""
+        return self._aggregate('mean', axis)
+
+    def min(self, axis: int = 0):
+        """min of each key over the rows (``axis=0``) or each row over the keys (``axis=1``)."""
+        return self._aggregate('min', axis)
+
+    def max(self, axis: int = 0):
+        """max of each key over the rows (``axis=0``) or each row over the keys (``axis=1``)."""
+        return self._aggregate('max', axis)
+
+    def any(self, axis: int = 1):
+        """True for each row (``axis=1``) or key (``axis=0``) with any truthy value."""
+        return self._aggregate('any', axis)
+
+    def all(self, axis: int = 1):
+        """True for each row (``axis=1``) or key (``axis=0``) where every value is truthy."""
+        return self._aggregate('all', axis)
+
+    # sequence
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return self._from_index(self._keys, self._values[i])
+        if isinstance(i, (np.ndarray, list)):
+            # a boolean mask or positions, these give a copy just as they would in numpy
+            return self._from_index(self._keys, self._values[np.asarray(i)])
+        if not -len(self) <= i < len(self):
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        return ArrayNumDict._from_index(self._keys, self._values[i])
+
+    def __iter__(self) -> Iterator[ArrayNumDict]:
+        keys = self._keys
+        return (ArrayNumDict._from_index(keys, row) for row in self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __reduce__(self):
+        return (self.__class__.from_array, (tuple(self._keys), self._values))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(keys={self._keys!r}, rows={len(self)})'
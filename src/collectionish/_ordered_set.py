@@ -0,0 +1,147 @@
+from typing import Any, Dict, Iterable, Iterator, List, MutableSet, TypeVar, Hashable
+from collections.abc import Set
+
+from collectionish._uniquetuple import UniqueTuple
+
+
+T = TypeVar('T', bound=Hashable)
+
+# marks the slot of a discarded item until the next compaction
+_TOMBSTONE = object()
+
+
+class OrderedSet(MutableSet[T]):
+
+    """A mutable set of hashable items ordered by first appearance.
+
+    ``OrderedSet`` is the mutable sibling of :class:`UniqueTuple`. ``add``, ``discard``,
+    ``remove``, ``pop`` and membership tests are all constant time (amortized). Removed items
+    leave a tombstone behind which is compacted away lazily once they make up half the
+    underlying storage.
+
+    Example:
+
+        >>> from collectionish import OrderedSet
+        >>>
+        >>> tags = OrderedSet(3, 2, 3, 1)
+        >>> tags
+        OrderedSet(3, 2, 1)
+
+        >>> tags.add(4)
+        >>> tags.discard(2)
+        >>> tags
+        OrderedSet(3, 1, 4)
+
+        re-adding something puts it at the end:
+
+        >>> tags.add(2)
+        >>> tags
+        OrderedSet(3, 1, 4, 2)
+
+        and you can freeze it into a :class:`UniqueTuple` without rehashing anything:
+
+        >>> tags.freeze()
+        UniqueTuple(3, 1, 4, 2)
+    """
+
+    def __init__(self, *args: T):
+        self._items: List[Any] = []
+        self._positions: Dict[T, int] = {}
+        self._tombstones = 0
+        for v in args:
+            self.add(v)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> 'OrderedSet[T]':
+        """create a new ``OrderedSet`` from any iterable, consuming it in a single pass."""
+        new = cls()
+        if isinstance(iterable, UniqueTuple) and iterable._key is None:
+            # a keyed UniqueTuple's positions are by key, not by item, so it can't be reused
+            new._items = list(iterable)
+            new._positions = dict(iterable._positions())
+        else:
+            for v in iterable:
+                new.add(v)
+        return new
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[T]) -> 'OrderedSet[T]':  # type: ignore[override]
+        # used by the mixin methods of MutableSet to create new instances
+        return cls.from_iterable(iterable)
+
+    def _compact(self):
+        self._items = [v for v in self._items if v is not _TOMBSTONE]
+        self._positions = {v: i for i, v in enumerate(self._items)}
+        self._tombstones = 0
+
+    def add(self, value: T):
+        """add an item to the end of the set if it isn't already present."""
+        if value not in self._positions:
+            self._positions[value] = len(self._items)
+            self._items.append(value)
+
+    def discard(self, value: T):
+        """remove an item from the set if it is present."""
+        i = self._positions.pop(value, None)
+        if i is not None:
+            self._items[i] = _TOMBSTONE
+            self._tombstones += 1
+            if self._tombstones > len(self._positions):
+                self._compact()
+
+    def pop(self) -> T:
+        """remove and return the most recently added item."""
+        if not self._positions:
+            raise KeyError('pop from an empty set')
+        items = self._items
+        value = items.pop()
+        while value is _TOMBSTONE:
+            self._tombstones -= 1
+            value = items.pop()
+        del self._positions[value]
+        return value
+
+    def clear(self):
+        self._items = []
+        self._positions = {}
+        self._tombstones = 0
+
+    def freeze(self) -> UniqueTuple[T]:
+        """return a :class:`UniqueTuple` of the current items in order."""
+        if self._tombstones:
+            self._compact()
+        frozen = UniqueTuple._from_unique(self._items)
+        frozen._position_index = dict(self._positions)  # type: ignore
+        return frozen
+
+    def copy(self) -> 'OrderedSet[T]':
+        return self.from_iterable(self)
+
+    def __and__(self, other: Any):
+        # the mixin version orders the result by ``other``, we want it ordered by ``self``
+        if isinstance(other, Set):
+            return self._from_iterable(v for v in self if v in other)
+        return super().__and__(other)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            return value in self._positions
+        except TypeError:
+            return False
+
+    def __iter__(self) -> Iterator[T]:
+        if self._tombstones:
+            return (v for v in self._items if v is not _TOMBSTONE)
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[T]:
+        return (v for v in reversed(self._items) if v is not _TOMBSTONE)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __reduce__(self):
+        return (self.__class__, tuple(self))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({", ".join(map(repr, self))})'
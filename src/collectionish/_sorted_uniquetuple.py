@@ -0,0 +1,179 @@
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from bisect import bisect_left
+from itertools import chain
+import sys
+
+
+T = TypeVar('T', covariant=True)
+
+
+def _merge_unique(*sorted_items: Sequence) -> List:
+    # timsort finds the already sorted runs so this is a linear merge of them, dict.fromkeys
+    # then drops the (adjacent) duplicates without changing the order.
+    return list(dict.fromkeys(sorted(chain(*sorted_items))))
+
+
+def _intersect(a: Sequence, b: Sequence) -> List:
+    result = []
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if x < y:
+            i += 1
+        elif y < x:
+            j += 1
+        else:
+            result.append(x)
+            i += 1
+            j += 1
+    return result
+
+
+def _subtract(a: Sequence, b: Sequence) -> List:
+    result = []
+    j = 0
+    len_b = len(b)
+    for x in a:
+        while j < len_b and b[j] < x:
+            j += 1
+        if j == len_b or x < b[j]:
+            result.append(x)
+    return result
+
+
+class SortedUniqueTuple(Tuple[T, ...]):
+
+    """An immutable sequence of unique items kept in sorted order.
+
+    ``SortedUniqueTuple`` is like :class:`UniqueTuple` except that items are ordered by value
+    rather than by first appearance, so they need to be orderable as well as hashable. Since
+    items are sorted ``in``, ``index`` and ``count`` use binary search (O(log n)), and you can
+    slice by value with :meth:`between`.
+
+    ``union`` (``|``), ``intersection`` (``&``) and ``difference`` (``-``) with other
+    ``SortedUniqueTuple`` instances are linear merges, nothing gets re-sorted.
+
+    Example:
+
+        >>> from collectionish import SortedUniqueTuple
+        >>>
+        >>> st = SortedUniqueTuple(3, 1, 2, 3, 10)
+        >>> st
+        SortedUniqueTuple(1, 2, 3, 10)
+
+        >>> 3 in st
+        True
+
+        >>> st.between(2, 10)
+        SortedUniqueTuple(2, 3)
+
+        >>> st | SortedUniqueTuple(0, 2, 4)
+        SortedUniqueTuple(0, 1, 2, 3, 4, 10)
+
+        >>> st & SortedUniqueTuple(0, 2, 3)
+        SortedUniqueTuple(2, 3)
+    """
+
+    def __new__(cls, *args: T):
+        return cls._from_sorted(sorted(set(args)))  # type: ignore[type-var]
+
+    @classmethod
+    def _from_sorted(cls, items: Iterable[T]) -> 'SortedUniqueTuple[T]':
+        # items must already be sorted and unique, nothing is checked here.
+        return super().__new__(cls, items)  # type: ignore
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> 'SortedUniqueTuple[T]':
+        """create a new ``SortedUniqueTuple`` from any iterable.
+
+        if ``iterable`` is already a ``SortedUniqueTuple`` it is not sorted again.
+        """
+        if isinstance(iterable, SortedUniqueTuple):
+            if type(iterable) is cls:
+                return iterable
+            return cls._from_sorted(iterable)
+        return cls._from_sorted(sorted(set(iterable)))  # type: ignore[type-var]
+
+    def _bisect(self, value: Any, lo: int = 0, hi: Optional[int] = None) -> Optional[int]:
+        hi = len(self) if hi is None else hi
+        try:
+            i = bisect_left(self, value, lo, hi)
+            if i < hi and self[i] == value:
+                return i
+        except TypeError:
+            # can't be compared to our items so it can't be one of them
+            pass
+        return None
+
+    def __contains__(self, value: Any) -> bool:
+        return self._bisect(value) is not None
+
+    def index(  # type: ignore[override]
+        self, value: Any, start: int = 0, stop: int = sys.maxsize
+    ) -> int:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        i = self._bisect(value, start, max(start, stop))
+        if i is None:
+            raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+        return i
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    def between(self, lo: Any = None, hi: Any = None) -> 'SortedUniqueTuple[T]':
+        """return the items ``x`` where ``lo <= x < hi``.
+
+        either bound may be ``None`` to leave that side open.
+        """
+        start = 0 if lo is None else bisect_left(self, lo)
+        stop = len(self) if hi is None else bisect_left(self, hi)
+        return self._from_sorted(self[start:stop])
+
+    # set operations
+
+    def _sorted(self, other: Iterable) -> Sequence:
+        if isinstance(other, SortedUniqueTuple):
+            return other
+        return sorted(set(other))
+
+    def union(self, *others: Iterable[T]) -> 'SortedUniqueTuple[T]':
+        """return a new ``SortedUniqueTuple`` with items from this and all ``others``."""
+        if not others:
+            return self
+        return self._from_sorted(_merge_unique(self, *map(self._sorted, others)))
+
+    def intersection(self, *others: Iterable[T]) -> 'SortedUniqueTuple[T]':
+        """return a new ``SortedUniqueTuple`` with items common to this and all ``others``."""
+        result: Sequence = self
+        for other in others:
+            result = _intersect(result, self._sorted(other))
+        return self._from_sorted(result)
+
+    def difference(self, *others: Iterable[T]) -> 'SortedUniqueTuple[T]':
+        """return a new ``SortedUniqueTuple`` with items in this but not in any of ``others``."""
+        result: Sequence = self
+        for other in others:
+            result = _subtract(result, self._sorted(other))
+        return self._from_sorted(result)
+
+    def __or__(self, other: Any):
+        if not isinstance(other, SortedUniqueTuple):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: Any):
+        if not isinstance(other, SortedUniqueTuple):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: Any):
+        if not isinstance(other, SortedUniqueTuple):
+            return NotImplemented
+        return self.difference(other)
+
+    def __reduce__(self):
+        return (self.__class__, tuple(self))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}{super().__repr__()}'
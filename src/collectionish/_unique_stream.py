@@ -0,0 +1,157 @@
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional, TypeVar
+from collections import OrderedDict
+import math
+import sys
+
+
+T = TypeVar('T')
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(x: int) -> int:
+    # splitmix64 finalizer, spreads python's (often sequential) hashes over all 64 bits.
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+class _BloomFilter:
+
+    """A fixed size bloom filter over hashable items using double hashing."""
+
+    __slots__ = ('nbits', 'nhashes', 'bits')
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1')
+        self.nbits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.nhashes = max(1, round(self.nbits / capacity * math.log(2)))
+        self.bits = bytearray((self.nbits + 7) // 8)
+
+    def add(self, item: Hashable) -> bool:
+        """add item to the filter returning True if it (probably) wasn't already there."""
+        h1 = _mix(hash(item) & _MASK)
+        h2 = _mix(h1) | 1
+        nbits, bits = self.nbits, self.bits
+        added = False
+        for i in range(self.nhashes):
+            pos = (h1 + i * h2) % nbits
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                added = True
+        return added
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.bits)
+
+
+class UniqueStream(Iterator[T]):
+
+    """Lazily yield the items of an iterable the first time they are seen.
+
+    This is the streaming version of :class:`UniqueTuple`, first appearance wins but nothing
+    except what's needed to recognise duplicates is held in memory. There are three modes:
+
+    - exact (the default): remembers every key seen, so memory grows with the number of
+      unique keys.
+    - exact with a ``window``: only the ``window`` most recently seen keys are remembered, so
+      memory is bounded but a key that falls out of the window will be yielded again.
+    - approximate (see :meth:`UniqueStream.approximate`): keys are recorded in a bloom filter
+      with a fixed size. Memory is bounded, duplicates are never yielded but some unique items
+      (about ``error_rate`` of them once ``capacity`` keys have been seen) will be dropped.
+
+    :attr:`UniqueStream.nbytes` reports the memory used to track seen keys.
+
+    Example:
+
+        >>> from collectionish import UniqueStream
+        >>>
+        >>> list(UniqueStream([3, 2, 3, 1, 2]))
+        [3, 2, 1]
+
+        dedupe on a key:
+
+        >>> list(UniqueStream(['a', 'B', 'A', 'b', 'c'], key=str.lower))
+        ['a', 'B', 'c']
+
+        remember only the last couple of keys:
+
+        >>> list(UniqueStream([1, 2, 1, 3, 4, 1], window=2))
+        [1, 2, 3, 4, 1]
+    """
+
+    def __init__(
+        self,
+        iterable: Iterable[T],
+        key: Optional[Callable[[T], Hashable]] = None,
+        window: Optional[int] = None,
+    ):
+        self._iterator = iter(iterable)
+        self._key = key
+        if window is None:
+            seen: set = set()
+            self._seen: Any = seen
+            self._is_new: Callable[[Hashable], bool] = self._add_to_set
+        else:
+            if window < 1:
+                raise ValueError('window must be at least 1')
+            self._window = window
+            self._seen = OrderedDict()
+            self._is_new = self._add_to_window
+
+    @classmethod
+    def approximate(
+        cls,
+        iterable: Iterable[T],
+        capacity: int,
+        error_rate: float = 0.01,
+        key: Optional[Callable[[T], Hashable]] = None,
+    ) -> 'UniqueStream[T]':
+        """create a ``UniqueStream`` which tracks seen keys in a bloom filter.
+
+        Args:
+            iterable: the items to dedupe.
+            capacity: the number of unique keys you expect to see.
+            error_rate: the rate at which unique items are wrongly dropped once ``capacity``
+                keys have been seen. Defaults to 0.01.
+            key: optional function to get the key to dedupe on for each item.
+        """
+        new = cls(iterable, key=key)
+        new._seen = _BloomFilter(capacity, error_rate)
+        new._is_new = new._seen.add
+        return new
+
+    def _add_to_set(self, key: Hashable) -> bool:
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def _add_to_window(self, key: Hashable) -> bool:
+        seen = self._seen
+        if key in seen:
+            seen.move_to_end(key)
+            return False
+        seen[key] = None
+        if len(seen) > self._window:
+            seen.popitem(last=False)
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        """bytes used to track seen keys (not counting the keys themselves)."""
+        return sys.getsizeof(self._seen)
+
+    def __iter__(self) -> 'UniqueStream[T]':
+        return self
+
+    def __next__(self) -> T:
+        key, is_new = self._key, self._is_new
+        for item in self._iterator:
+            if is_new(item if key is None else key(item)):
+                return item
+        raise StopIteration
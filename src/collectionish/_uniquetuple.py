@@ -1,9 +1,36 @@
-from typing import Tuple, TypeVar, Hashable, Sequence
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Container,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from collections.abc import Set
+from itertools import chain
+import sys
+
+from collectionish._lru import CacheInfo, LRUCache
+from collectionish import _vectorized
 
 
 T = TypeVar('T', bound=Hashable, covariant=True)
 
 
+def _typed(value: Any) -> Hashable:
+    # 1, 1.0 and True are equal (and hash the same) so values are tagged with their types,
+    # including inside tuples and frozensets, to tell them apart in the intern cache.
+    if isinstance(value, tuple):
+        return type(value), tuple(map(_typed, value))
+    if isinstance(value, frozenset):
+        return type(value), frozenset(map(_typed, value))
+    return type(value), value
+
+
 class UniqueTuple(Tuple[T, ...]):
 
     """An immutable sequence of unique and hashable items ordered by first appearance.
@@ -14,6 +41,21 @@ class UniqueTuple(Tuple[T, ...]):
     It orders by will be ordered by first appearance.
     - finally ``UniqueTuple`` may be initilized with an unpacked iterable.
 
+    membership tests, ``index`` and ``count`` are constant time. The position index backing
+    them is built lazily on first use so construction costs no more than it would otherwise.
+
+    ``UniqueTuple`` also supports the set operations you'd get on a ``frozenset`` (``union``,
+    ``intersection``, ``difference``, ``symmetric_difference``, ``issubset``, ``issuperset`` and
+    ``isdisjoint``) along with the ``|``, ``&``, ``-`` and ``^`` operators. Results keep the
+    order of first appearance and run in linear time.
+
+    Items that aren't hashable themselves (or that should be deduped on something other than
+    equality) can be deduped with a ``key`` function like the one you'd pass to ``sorted``. The
+    first item for each key is kept and lookups, including set operations, go by key.
+
+    if you create the same ``UniqueTuple`` over and over use :meth:`UniqueTuple.intern` to get
+    back a shared instance instead of building a new one every time.
+
     Example:
 
         >>> from collectionish import UniqueTuple
@@ -21,14 +63,299 @@ class UniqueTuple(Tuple[T, ...]):
         >>> UniqueTuple(3, 2, 3, 1)
         UniqueTuple(3, 2, 1)
 
+        >>> ut = UniqueTuple('a', 'b', 'c')
+        >>> 'b' in ut
+        True
+        >>> ut.index('c')
+        2
+
+        set operations preserve order:
+
+        >>> UniqueTuple(3, 2, 1) | UniqueTuple(4, 1)
+        UniqueTuple(3, 2, 1, 4)
+        >>> UniqueTuple(3, 2, 1) & UniqueTuple(1, 3)
+        UniqueTuple(3, 1)
+        >>> UniqueTuple(3, 2, 1).difference([1], [2])
+        UniqueTuple(3,)
+
+        dedupe by key:
+
+        >>> records = UniqueTuple({'id': 1, 'v': 'a'}, {'id': 2, 'v': 'b'}, {'id': 1, 'v': 'c'},
+        ...                       key=lambda r: r['id'])
+        >>> records
+        UniqueTuple({'id': 1, 'v': 'a'}, {'id': 2, 'v': 'b'})
+        >>> records.get_by_key(2)
+        {'id': 2, 'v': 'b'}
+
     """
 
-    def __new__(cls, *args: Sequence[T]):
+    _intern_cache: ClassVar[LRUCache] = LRUCache(maxsize=1024)
+    _key: Optional[Callable[[Any], Hashable]] = None
+
+    def __new__(  # type: ignore[misc]
+        cls, *args: T, key: Optional[Callable[[Any], Hashable]] = None
+    ):
+        if key is not None:
+            return cls._from_keyed(args, key)
         # since dict remembers insertion order we can just use that with no values
-        return super().__new__(cls, dict({arg: None for arg in args}))  # type: ignore
+        return cls._from_unique(dict.fromkeys(args))
+
+    @classmethod
+    def _from_keyed(cls, iterable: Iterable, key: Callable[[Any], Hashable]) -> 'UniqueTuple':
+        firsts: Dict[Hashable, Any] = {}
+        keep_first = firsts.setdefault
+        for item in iterable:
+            keep_first(key(item), item)
+        new = cls._from_unique(firsts.values())
+        new._key = key
+        new._position_index = dict(zip(firsts, range(len(firsts))))  # type: ignore
+        return new
+
+    def _derive(self, items: Iterable[T]) -> 'UniqueTuple[T]':
+        # a new instance from unique items using the same key as this one
+        new = self._from_unique(items)
+        if self._key is not None:
+            new._key = self._key
+        return new
+
+    @classmethod
+    def _from_unique(cls, items: Iterable[T]) -> 'UniqueTuple[T]':
+        # items must already be unique, nothing is checked here.
+        return super().__new__(cls, items)  # type: ignore
+
+    @classmethod
+    def from_iterable(
+        cls, iterable: Iterable[T], key: Optional[Callable[[Any], Hashable]] = None
+    ) -> 'UniqueTuple[T]':
+        """create a new ``UniqueTuple`` from any iterable, consuming it in a single pass.
+
+        Unlike ``UniqueTuple(*iterable)`` generators are never unpacked into an intermediate
+        tuple. If ``iterable`` is already a ``UniqueTuple`` with the same ``key`` nothing is
+        rehashed.
+
+        One dimensional numeric numpy arrays are converted to python scalars and large ones are
+        deduped with numpy rather than one item at a time.
+
+        Example:
+            >>> from collectionish import UniqueTuple
+            >>>
+            >>> UniqueTuple.from_iterable(x % 3 for x in range(10))
+            UniqueTuple(0, 1, 2)
+        """
+        if isinstance(iterable, UniqueTuple) and iterable._key is key:
+            if type(iterable) is cls:
+                return iterable
+            new = cls._from_unique(iterable)
+            if key is not None:
+                new._key = key
+            if '_position_index' in iterable.__dict__:
+                new._position_index = iterable._position_index  # type: ignore
+            return new
+        if key is not None:
+            return cls._from_keyed(iterable, key)
+        if _vectorized.is_numeric_array(iterable):
+            return cls._from_unique(_vectorized.unique_list(iterable))  # type: ignore[arg-type]
+        return cls._from_unique(dict.fromkeys(iterable))
+
+    @classmethod
+    def intern(cls, *args: T) -> 'UniqueTuple[T]':  # type: ignore[misc]
+        """like ``UniqueTuple(*args)`` but returns a cached instance for repeated arguments.
+
+        instances are held in a bounded least recently used cache shared by all
+        ``UniqueTuple`` types, see :meth:`UniqueTuple.intern_cache_info`.
+
+        Example:
+            >>> from collectionish import UniqueTuple
+            >>>
+            >>> UniqueTuple.intern('a', 'b', 'a') is UniqueTuple.intern('a', 'b', 'a')
+            True
+        """
+        key = (cls, _typed(args))
+        cached = cls._intern_cache.get(key)
+        if cached is None:
+            cached = cls(*args)
+            cls._intern_cache.put(key, cached)
+        return cached
+
+    @classmethod
+    def intern_cache_info(cls) -> CacheInfo:
+        """return hits, misses, maxsize and current size of the intern cache."""
+        return cls._intern_cache.info()
+
+    @classmethod
+    def intern_cache_clear(cls):
+        """empty the intern cache and reset its statistics."""
+        cls._intern_cache.clear()
+
+    @property
+    def key(self) -> Optional[Callable[[Any], Hashable]]:
+        """the key function items were deduped with, if any."""
+        return self._key
+
+    def _positions(self) -> Dict[Any, int]:
+        # maps the key of each item (or the item itself if there's no key) to its position
+        try:
+            return self._position_index  # type: ignore
+        except AttributeError:
+            positions: Dict[Any, int]
+            if self._key is None:
+                positions = {v: i for i, v in enumerate(self)}
+            else:
+                key = self._key
+                positions = {key(v): i for i, v in enumerate(self)}
+            self._position_index = positions
+            return positions
+
+    def _index_key(self, value: Any) -> Hashable:
+        return value if self._key is None else self._key(value)
+
+    def _index_keys(self) -> Iterable[Hashable]:
+        # the key of each item in order
+        return self if self._key is None else self._positions()
+
+    def _find(self, value: Any) -> Optional[int]:
+        try:
+            i = self._positions().get(self._index_key(value))
+        except (TypeError, LookupError, AttributeError):
+            # unhashable things, and things the key function can't handle, can't be in here
+            return None
+        if i is None or (self._key is not None and self[i] != value):
+            return None
+        return i
+
+    def __contains__(self, value: Any) -> bool:
+        if self._key is None:
+            try:
+                return value in self._positions()
+            except TypeError:
+                return False
+        return self._find(value) is not None
+
+    def index(  # type: ignore[override]
+        self, value: Any, start: int = 0, stop: int = sys.maxsize
+    ) -> int:
+        i = self._find(value)
+        if i is None:
+            raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if not start <= i < stop:
+            raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+        return i
 
     def count(self, value) -> int:
         return int(value in self)
 
+    def index_by_key(self, key: Hashable) -> int:
+        """return the position of the item with the given ``key``.
+
+        without a key function this is the same as ``index``.
+        """
+        try:
+            return self._positions()[key]
+        except (KeyError, TypeError):
+            raise KeyError(key)
+
+    def get_by_key(self, key: Hashable, default: Any = None) -> Any:
+        """return the item with the given ``key`` or ``default`` if there isn't one."""
+        try:
+            return self[self.index_by_key(key)]
+        except KeyError:
+            return default
+
+    # set operations
+
+    def _lookup(self, other: Iterable) -> Container:
+        # a container of the keys of ``other`` according to our key function
+        if isinstance(other, UniqueTuple) and other._key is self._key:
+            return other._positions()
+        if self._key is None:
+            return other if isinstance(other, (Set, dict)) else set(other)
+        return set(map(self._key, other))
+
+    def union(self, *others: Iterable[T]) -> 'UniqueTuple[T]':
+        """return a new ``UniqueTuple`` with items from this and all ``others``."""
+        if not others:
+            return self
+        return self.from_iterable(chain(self, *others), key=self._key)
+
+    def intersection(self, *others: Iterable[T]) -> 'UniqueTuple[T]':
+        """return a new ``UniqueTuple`` with items common to this and all ``others``."""
+        lookups = [self._lookup(other) for other in others]
+        return self._derive(
+            [v for k, v in zip(self._index_keys(), self) if all(k in lkp for lkp in lookups)]
+        )
+
+    def difference(self, *others: Iterable[T]) -> 'UniqueTuple[T]':
+        """return a new ``UniqueTuple`` with items in this that are not in any of ``others``."""
+        lookups = [self._lookup(other) for other in others]
+        return self._derive(
+            [v for k, v in zip(self._index_keys(), self) if not any(k in lkp for lkp in lookups)]
+        )
+
+    def symmetric_difference(self, *others: Iterable[T]) -> 'UniqueTuple[T]':
+        """return a new ``UniqueTuple`` with items found in an odd number of the operands.
+
+        with a single other this is just the items in either but not both. Items are ordered
+        by first appearance across all operands.
+        """
+        counts: Dict[Hashable, int] = {}
+        items: Dict[Hashable, Any] = {}
+        for operand in (self, *others):
+            operand = self.from_iterable(operand, key=self._key)
+            for k, v in zip(operand._index_keys(), operand):
+                if k in counts:
+                    counts[k] += 1
+                else:
+                    counts[k] = 1
+                    items[k] = v
+        return self._derive([items[k] for k, n in counts.items() if n % 2])
+
+    def issubset(self, other: Iterable) -> bool:
+        """return True if every item in this ``UniqueTuple`` is also in ``other``."""
+        lookup = self._lookup(other)
+        return all(k in lookup for k in self._index_keys())
+
+    def issuperset(self, other: Iterable) -> bool:
+        """return True if every item in ``other`` is also in this ``UniqueTuple``."""
+        lookup = self._positions()
+        return all(self._index_key(v) in lookup for v in other)
+
+    def isdisjoint(self, other: Iterable) -> bool:
+        """return True if this ``UniqueTuple`` has no items in common with ``other``."""
+        lookup = self._positions()
+        return not any(self._index_key(v) in lookup for v in other)
+
+    def __or__(self, other: Any):
+        if not isinstance(other, UniqueTuple):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: Any):
+        if not isinstance(other, UniqueTuple):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: Any):
+        if not isinstance(other, UniqueTuple):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other: Any):
+        if not isinstance(other, UniqueTuple):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash  # type: ignore
+        except AttributeError:
+            h = self._hash = super().__hash__()
+            return h
+
+    def __reduce__(self):
+        if self._key is not None:
+            return (self.__class__._from_keyed, (tuple(self), self._key))
+        return (self.__class__, tuple(self))
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}{super().__repr__()}'
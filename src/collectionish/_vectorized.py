@@ -0,0 +1,50 @@
+"""optional numpy accelerated helpers.
+
+numpy is never required, everything in here checks for it and callers fall back to pure python
+when it isn't installed.
+"""
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+# above this many items numpy's sort based unique beats hashing python scalars, see the
+# ``UniqueTuple.numpy`` benchmarks for where this comes from.
+UNIQUE_THRESHOLD = 100_000
+
+
+def is_numeric_array(obj: Any) -> bool:
+    """True if ``obj`` is a one dimensional numpy array of bools, ints or floats."""
+    return (
+        np is not None
+        and isinstance(obj, np.ndarray)
+        and obj.ndim == 1
+        and obj.dtype.kind in 'biuf'
+    )
+
+
+def unique_in_order(arr: 'np.ndarray') -> 'np.ndarray':
+    """return the unique values of a 1d array ordered by first appearance."""
+    _, first = np.unique(arr, return_index=True)
+    first.sort()
+    return arr[first]
+
+
+def use_numpy_unique(arr: 'np.ndarray') -> bool:
+    """True if ``arr`` is large enough to be deduped with numpy.
+
+    float arrays containing ``nan`` never are, since ``nan`` is never equal to itself numpy and
+    python disagree on what it means for one to be unique.
+    """
+    return len(arr) >= UNIQUE_THRESHOLD and not (arr.dtype.kind == 'f' and np.isnan(arr).any())
+
+
+def unique_list(arr: 'np.ndarray') -> list:
+    """return the unique values of a 1d numeric array as python scalars in order of first
+    appearance."""
+    if use_numpy_unique(arr):
+        return unique_in_order(arr).tolist()
+    return list(dict.fromkeys(arr.tolist()))
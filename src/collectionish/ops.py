@@ -1,6 +1,19 @@
-from typing import Any, Iterable, Sequence, Hashable, MutableMapping, Mapping, Union, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Hashable,
+    MutableMapping,
+    Mapping,
+    Union,
+    Tuple,
+)
+from collections import abc
 from functools import reduce
-from collectionish import AttyDict
+from collectionish import AttyDict, Sentry
+from collectionish._attyview import AttyView, _SequenceView, _unwrap
 
 
 def rgetattr(obj: Any, *keys: Iterable[str]):
@@ -197,3 +210,116 @@ def flatten_mapping(mapping: Mapping, delimiter: str = '.', keep_type: bool = Fa
     if keep_type:
         return mapping.__class__(result)  # type: ignore
     return result
+
+
+# builtins first so they don't go through the abc check
+_CONTAINERS = (dict, list, tuple, abc.Mapping)
+# common leaf types which can be skipped without a (slower) abc instance check
+_SCALARS = frozenset({int, float, str, bool, bytes, type(None)})
+_PLAIN = (dict, list, tuple)
+# exact types since views are abcs, subclasses are still converted (as other mappings)
+_VIEWS = frozenset({AttyView, _SequenceView})
+_IN_PROGRESS = Sentry()
+_Expanded = Tuple[List[Any], bool]
+
+
+def _values(node: Any) -> Iterable[Any]:
+    # plain dict and list access so lazy values aren't converted on the way out
+    if isinstance(node, dict):
+        return dict.values(node)
+    if isinstance(node, list):
+        return list.__iter__(node)
+    if isinstance(node, abc.Mapping):
+        return node.values()
+    return node
+
+
+def _items(node: Any) -> Iterable[Tuple[Any, Any]]:
+    return dict.items(node) if isinstance(node, dict) else node.items()
+
+
+def _expand(node: Any) -> _Expanded:
+    # the nested containers in a container and whether it needs rebuilding regardless of
+    # what they're converted to.
+    changed = type(node) not in _PLAIN
+    nested = []
+    for v in _values(node):
+        if type(v) in _SCALARS:
+            continue
+        if type(v) in _VIEWS:
+            v = v._data
+            changed = True
+        if isinstance(v, _CONTAINERS):
+            nested.append(v)
+    return nested, changed
+
+
+def _rebuild(node: Any, expanded: _Expanded, done: Dict[int, Tuple[Any, Any]]) -> Any:
+    nested, changed = expanded
+    if not changed:
+        changed = any(done[id(v)][1] is not v for v in nested)
+        if not changed:
+            return node
+
+    def convert(v):
+        if type(v) in _VIEWS:
+            v = v._data
+        seen = done.get(id(v))
+        return v if seen is None else seen[1]
+
+    if isinstance(node, abc.Mapping):
+        return {k: convert(v) for k, v in _items(node)}
+    if isinstance(node, list):
+        return [convert(v) for v in _values(node)]
+    return tuple(convert(v) for v in node)
+
+
+def to_plain(obj: Any) -> Any:
+    """convert any nest of mappings, lists and tuples into plain ``dict``, ``list`` and ``tuple``.
+
+    This is the inverse of the conversion done by :class:`collectionish.AttyDict`. It's
+    iterative rather than recursive so there's no limit on how deeply things can be nested.
+    Anything that's already a plain container holding only plain values is returned as it is
+    rather than copied, and a subtree which appears in several places is converted once and
+    shared in the result as well. Other values are left alone.
+
+    Raises:
+        ValueError: if ``obj`` contains itself.
+
+    Example:
+        >>> from collectionish import AttyDict, Sentry
+        >>> from collectionish.ops import to_plain
+        >>>
+        >>> plain = {'b': [1, 2]}
+        >>> converted = to_plain([AttyDict(a={'b': (1, 2)}), plain])
+        >>> converted
+        [{'a': {'b': (1, 2)}}, {'b': [1, 2]}]
+        >>> type(converted[0]['a'])
+        <class 'dict'>
+        >>> converted[1] is plain
+        True
+    """
+    obj = _unwrap(obj)
+    if not isinstance(obj, _CONTAINERS):
+        return obj
+    # id of each container seen -> (original, converted), the original is kept so the id stays
+    # valid. Containers still being converted map to _IN_PROGRESS.
+    done: Dict[int, Tuple[Any, Any]] = {}
+    stack: List[Tuple[Any, Any]] = [(obj, None)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded is None:
+            seen = done.get(id(node))
+            if seen is not None:
+                if seen[1] is _IN_PROGRESS:
+                    raise ValueError('cannot convert a structure which contains itself')
+                continue
+            expanded = _expand(node)
+            nested = expanded[0]
+            if nested:
+                done[id(node)] = (node, _IN_PROGRESS)
+                stack.append((node, expanded))
+                stack.extend([(v, None) for v in nested])
+                continue
+        done[id(node)] = (node, _rebuild(node, expanded, done))
+    return done[id(obj)][1]
@@ -0,0 +1,223 @@
+import math
+import operator
+import pickle
+
+import pytest
+
+from hypothesis import given, assume
+from hypothesis import strategies as st
+
+from collectionish import ArrayNumDict, NumDict
+
+from tests.utils import param, mark_params
+
+np = pytest.importorskip('numpy')
+
+
+keys = st.sampled_from('abcdef')
+ints = st.dictionaries(keys, st.integers(-1000, 1000))
+floats = st.dictionaries(keys, st.floats(-1e6, 1e6))
+nonzero = st.dictionaries(keys, st.integers(-1000, 1000).filter(bool))
+
+
+def assert_matches(result, expected):
+    assert isinstance(result, ArrayNumDict)
+    assert list(result) == list(expected)
+    for k, v in expected.items():
+        assert result[k] == pytest.approx(v)
+
+
+ops = [
+    param(tag='add', op=operator.add, right=floats),
+    param(tag='sub', op=operator.sub, right=ints),
+    param(tag='mul', op=operator.mul, right=floats),
+    param(tag='truediv', op=operator.truediv, right=nonzero),
+    param(tag='floordiv', op=operator.floordiv, right=nonzero),
+    param(tag='mod', op=operator.mod, right=nonzero),
+]
+
+
+def with_ops(f):
+    for p in ops:
+        f = p(f)
+    return mark_params(f)
+
+
+@with_ops
+@given(left=ints, data=st.data())
+def test_ops_match_numdict(op, right, left, data):
+    right = data.draw(right)
+    expected = op(NumDict(left), NumDict(right))
+    assert_matches(op(ArrayNumDict(left), ArrayNumDict(right)), expected)
+    assert_matches(op(ArrayNumDict(left), NumDict(right)), expected)
+    assert_matches(op(NumDict(left), ArrayNumDict(right)), expected)
+
+
+@with_ops
+@given(left=ints, data=st.data())
+def test_inplace_ops_match_numdict(op, right, left, data):
+    right = data.draw(right)
+    expected = NumDict(left)
+    expected = getattr(operator, f'i{op.__name__}')(expected, NumDict(right))
+    result = ArrayNumDict(left)
+    original = result
+    result = getattr(operator, f'i{op.__name__}')(result, ArrayNumDict(right))
+    assert result is original
+    assert_matches(result, expected)
+
+
+@with_ops
+@given(left=nonzero, value=st.integers(1, 10))
+def test_scalar_ops_match_numdict(op, right, left, value):
+    assert_matches(op(ArrayNumDict(left), value), op(NumDict(left), value))
+    assert_matches(op(value, ArrayNumDict(left)), op(value, NumDict(left)))
+
+
+@given(
+    left=st.dictionaries(keys, st.integers(-5, 5)),
+    right=st.dictionaries(keys, st.integers(-3, 3)),
+)
+def test_pow_matches_numdict(left, right):
+    assume(not any(left.get(k) == 0 and v < 0 for k, v in right.items()))
+    assert_matches(ArrayNumDict(left) ** ArrayNumDict(right), NumDict(left) ** NumDict(right))
+
+
+@mark_params
+@param(tag='add', op=operator.add, expected=int)
+@param(tag='floordiv', op=operator.floordiv, expected=int)
+@param(tag='truediv', op=operator.truediv, expected=float)
+@param(tag='negative_pow', op=lambda x, y: x ** -y, expected=float)
+def test_int_values_stay_ints(op, expected):
+    result = op(ArrayNumDict(a=4, b=6), ArrayNumDict(a=2, b=3))
+    assert all(type(v) is expected for v in result.values())
+
+
+def test_missing_keys_use_identity():
+    x = ArrayNumDict(a=-3.5, b=6.5)
+    y = ArrayNumDict(a=2, extra=6)
+    assert x * y == {'a': -7.0, 'b': 6.5}
+    assert x + y == {'a': -1.5, 'b': 6.5}
+    assert x - y == {'a': -5.5, 'b': 6.5}
+    assert x / y == {'a': -1.75, 'b': 6.5}
+
+
+@mark_params
+@param(tag='ge', op=operator.ge)
+@param(tag='gt', op=operator.gt)
+@param(tag='le', op=operator.le)
+@param(tag='lt', op=operator.lt)
+def test_comparisons(op):
+    x, y = dict(a=1, b=2, c=3), dict(c=1, b=2, a=3)
+    assert_matches(op(ArrayNumDict(x), ArrayNumDict(y)), op(NumDict(x), NumDict(y)))
+    assert_matches(op(ArrayNumDict(x), 2), op(NumDict(x), 2))
+    with pytest.raises(RuntimeError):
+        op(ArrayNumDict(x), ArrayNumDict(a=1))
+
+
+def test_eq():
+    x = ArrayNumDict(a=1, b=2.5)
+    assert x == {'a': 1, 'b': 2.5}
+    assert x == NumDict(b=2.5, a=1)
+    assert x == ArrayNumDict(x)
+    assert x != ArrayNumDict(a=1)
+    assert (x == 1).to_numdict() == NumDict(a=True, b=False)
+    assert (x != 1).to_numdict() == NumDict(a=False, b=True)
+
+
+@mark_params
+@param(tag='abs', f=abs)
+@param(tag='neg', f=operator.neg)
+@param(tag='round', f=round)
+@param(tag='round_places', f=lambda x: round(x, 1))
+def test_unary(f):
+    values = dict(a=-3.56, b=3.1, c=6.44, d=2.5)
+    assert_matches(f(ArrayNumDict(values)), f(NumDict(values)))
+
+
+def test_round_places_uses_numpy():
+    # numpy scales by 10 ** places so decimal ties aren't always rounded like python does
+    assert round(ArrayNumDict(a=6.45), 1) == {'a': 6.4}
+    assert round(NumDict(a=6.45), 1) == {'a': 6.5}
+
+
+@mark_params
+@param(tag='sum', method='sum')
+@param(tag='min', method='min')
+@param(tag='max', method='max')
+@param(tag='mean', method='mean')
+def test_aggregations(method):
+    values = dict(a=-3.56, b=3.1, c=6.4, d=2)
+    result = getattr(ArrayNumDict(values), method)()
+    assert type(result) is float
+    assert math.isclose(result, getattr(NumDict(values), method)())
+
+
+def test_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        ArrayNumDict(a=1, b=2) / ArrayNumDict(a=0)
+    with pytest.raises(ZeroDivisionError):
+        ArrayNumDict(a=1.5) // 0
+    with pytest.raises(ZeroDivisionError):
+        1 % ArrayNumDict(a=0)
+
+
+def test_shares_key_index():
+    x = ArrayNumDict(a=1, b=2)
+    assert (x + 1)._keys is x._keys
+    assert (x * ArrayNumDict(b=3))._keys is x._keys
+    assert ArrayNumDict.from_arrays(x._keys, [3, 4])._keys is x._keys
+
+
+def test_alignment_is_cached():
+    x, y = ArrayNumDict(a=1, b=2), ArrayNumDict(b=3, c=4)
+    x + y
+    hits = ArrayNumDict.alignment_cache_info().hits
+    x * y
+    assert ArrayNumDict.alignment_cache_info().hits == hits + 1
+
+
+def test_mutation():
+    x = ArrayNumDict(a=1, b=2)
+    x['a'] = 5
+    assert x == {'a': 5, 'b': 2}
+    x['b'] = 2.5
+    assert x == {'a': 5, 'b': 2.5}
+    x['c'] = 1
+    assert list(x) == ['a', 'b', 'c']
+    del x['a']
+    assert x == {'b': 2.5, 'c': 1}
+    with pytest.raises(KeyError):
+        del x['a']
+    with pytest.raises(KeyError):
+        x['a']
+    with pytest.raises(TypeError):
+        x['d'] = 'nope'
+
+
+def test_array_is_read_only():
+    x = ArrayNumDict(a=1, b=2)
+    with pytest.raises(ValueError):
+        x.array[0] = 10
+    assert x.array.tolist() == [1, 2]
+
+
+def test_from_arrays():
+    x = ArrayNumDict.from_arrays(['a', 'b'], np.array([1, 2], dtype='int8'))
+    assert x == {'a': 1, 'b': 2}
+    assert x.array.dtype == np.int64
+    with pytest.raises(ValueError):
+        ArrayNumDict.from_arrays(['a'], [1, 2])
+    with pytest.raises(TypeError):
+        ArrayNumDict.from_arrays(['a'], ['x'])
+
+
+def test_copy_and_pickle():
+    x = ArrayNumDict(a=1, b=2.5)
+    for y in (x.copy(), pickle.loads(pickle.dumps(x)), ArrayNumDict(x)):
+        assert y == x
+        y['a'] = 10
+        assert x['a'] == 1
+
+
+def test_repr():
+    assert repr(ArrayNumDict(a=1, b=2)) == "ArrayNumDict({'a': 1, 'b': 2})"
@@ -0,0 +1,145 @@
+import string
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import AttyBatch, AttyDict, AttyRow, FrozenAttyDict, Sentry, UniqueTuple
+from collectionish.utils import is_valid_identifier
+
+from tests.utils import param, mark_params
+
+
+valid_keys = st.text(string.ascii_lowercase + '_', min_size=1).filter(is_valid_identifier)
+
+
+@given(
+    keys=st.lists(valid_keys, max_size=5, unique=True),
+    data=st.data(),
+)
+def test_rows_match_attydict(keys, data):
+    records = data.draw(
+        st.lists(st.dictionaries(st.sampled_from(keys), st.integers()) if keys else st.just({}))
+    )
+    batch = AttyBatch.from_records(records, keys=keys)
+    assert len(batch) == len(records)
+    for row, record in zip(batch, records):
+        assert row == AttyDict(record)
+        assert dict(row) == record
+        assert len(row) == len(record)
+        for k, v in record.items():
+            assert k in row
+            if not hasattr(AttyRow, k):
+                assert getattr(row, k) == v
+
+
+def test_keys_from_first_record():
+    batch = AttyBatch.from_records([{'b': 1, 'a': 2}, {'a': 3}])
+    assert batch.keys == UniqueTuple('b', 'a')
+    assert isinstance(batch.keys, UniqueTuple)
+    assert dict(batch[1]) == {'a': 3}
+
+
+def test_empty():
+    batch = AttyBatch.from_records([])
+    assert len(batch) == 0
+    assert batch.keys == ()
+
+
+def test_extra_keys():
+    batch = AttyBatch(['a'])
+    with pytest.raises(ValueError):
+        batch.append({'a': 1, 'b': 2})
+    assert len(batch) == 0
+    assert batch.column('a') == []
+
+
+def test_failed_append_leaves_batch_unchanged():
+    batch = AttyBatch(['a', 'b'])
+    with pytest.raises(SyntaxError):
+        batch.append({'a': 1, 'b': {'bad key': 2}})
+    assert len(batch) == 0
+    assert batch.column('a') == batch.column('b') == []
+    batch.append({'a': 3, 'b': 4})
+    assert dict(batch[0]) == {'a': 3, 'b': 4}
+
+
+def test_invalid_key():
+    with pytest.raises(SyntaxError):
+        AttyBatch(['not valid'])
+    with pytest.raises(TypeError):
+        AttyBatch([1])
+
+
+def test_nested_values_are_converted():
+    batch = AttyBatch.from_records([{'a': {'b': {'c': 1}}}])
+    assert isinstance(batch[0].a, AttyDict)
+    assert batch[0].a.b.c == 1
+    frozen = AttyBatch.from_records([{'a': {'b': [1]}}], dict_cls=FrozenAttyDict)
+    assert frozen[0].a == FrozenAttyDict(b=(1,))
+
+
+def test_row_writes_through():
+    batch = AttyBatch.from_records([{'a': 1, 'b': 2}, {'a': 3, 'b': 4}])
+    row = batch[1]
+    row.a = 5
+    row['b'] = {'c': 1}
+    assert batch.column('a') == [1, 5]
+    assert batch[1].b.c == 1
+    del row['a']
+    assert dict(batch[1]) == {'b': {'c': 1}}
+    assert batch.column('a') == [1, Sentry()]
+    with pytest.raises(KeyError):
+        del row['a']
+
+
+def test_row_cant_add_keys():
+    row = AttyBatch.from_records([{'a': 1}])[0]
+    with pytest.raises(KeyError):
+        row['b'] = 1
+    with pytest.raises(KeyError):
+        row.b = 1
+
+
+@mark_params
+@param(tag='getitem', get=lambda row: row['b'], err=KeyError)
+@param(tag='getattr', get=lambda row: row.b, err=AttributeError)
+@param(tag='missing getitem', get=lambda row: row['a'], err=KeyError)
+@param(tag='missing getattr', get=lambda row: row.a, err=AttributeError)
+def test_row_missing(get, err):
+    row = AttyBatch.from_records([{}], keys=['a'])[0]
+    with pytest.raises(err):
+        get(row)
+
+
+def test_row_has_no_dict():
+    row = AttyBatch.from_records([{'a': 1}])[0]
+    assert not hasattr(row, '__dict__')
+    assert isinstance(row, AttyRow)
+
+
+def test_indexing():
+    batch = AttyBatch.from_records({'a': i} for i in range(5))
+    assert batch[-1].a == 4
+    with pytest.raises(IndexError):
+        batch[5]
+    with pytest.raises(IndexError):
+        batch[-6]
+    sliced = batch[1:4:2]
+    assert isinstance(sliced, AttyBatch)
+    assert [row.a for row in sliced] == [1, 3]
+    sliced[0].a = 10
+    assert batch[1].a == 1
+
+
+def test_to_records():
+    records = [{'a': 1, 'b': {'c': 2}}, {'a': 3}]
+    batch = AttyBatch.from_records(records)
+    assert batch.to_records() == records
+    assert all(type(r) is AttyDict for r in batch.to_records())
+
+
+def test_nbytes():
+    records = [{'a': i, 'b': i} for i in range(1000)]
+    assert AttyBatch.from_records(records).nbytes < sum(map(AttyDict.__sizeof__, records))
@@ -1,5 +1,8 @@
 from typing import Union, Mapping
-from copy import deepcopy
+from copy import copy, deepcopy
+import io
+import json
+import pickle
 import string
 
 import pytest
@@ -16,7 +19,7 @@ from hypothesis.stateful import (
 )
 
 
-from collectionish import AttyDict
+from collectionish import AttyDict, FrozenAttyDict, LazyAttyDict, Sentry
 from collectionish import ops
 
 from collectionish.utils import is_valid_identifier
@@ -181,3 +184,501 @@ def test_from_zip():
 
     for k, v in expected_dict.items():
         assert getattr(attydict, k) == attydict[k] == v
+
+
+def walk(value):
+    # access every nested value through __getitem__ returning a plain copy
+    if isinstance(value, Mapping):
+        return {k: walk(value[k]) for k in value}
+    if isinstance(value, (list, tuple)):
+        return type(value)(walk(v) for v in value)
+    return value
+
+
+@given(st.dictionaries(valid_keys, nested_values, max_size=5))
+def test_lazy_matches_eager(inp):
+    before = deepcopy(inp)
+    lazy = LazyAttyDict(inp)
+    assert lazy == AttyDict(inp)
+    assert walk(lazy) == walk(AttyDict(inp))
+    assert valid_values(*lazy.values())
+    assert inp == before
+
+
+def test_lazy_converts_on_access():
+    lazy = LazyAttyDict(a={'b': {'c': 1}}, d=[{'e': 2}])
+    assert type(dict.__getitem__(lazy, 'a')) is dict
+    assert type(lazy.a) is LazyAttyDict
+    assert type(dict.__getitem__(lazy.a, 'b')) is dict
+    assert lazy.a.b.c == 1
+    assert lazy.d[0].e == 2
+
+
+def test_lazy_caches_converted_values():
+    lazy = LazyAttyDict(a={'b': 1}, c=[{'d': 2}])
+    assert lazy.a is lazy.a
+    assert lazy.c is lazy.c
+    lazy.a.b = 3
+    lazy.c.append(4)
+    assert lazy == {'a': {'b': 3}, 'c': [{'d': 2}, 4]}
+
+
+def test_lazy_validates_nested_keys_on_access():
+    lazy = LazyAttyDict(a={'not valid': 1})
+    with pytest.raises(SyntaxError):
+        lazy.a
+
+
+def test_lazy_pop():
+    lazy = LazyAttyDict(a={'b': 1}, c={'d': 2}, e=[{'f': 3}])
+    lazy.a
+    assert type(lazy.pop('a')) is LazyAttyDict
+    assert lazy.pop('a', None) is None
+    with pytest.raises(KeyError):
+        lazy.pop('a')
+    key, value = lazy.popitem()
+    assert key == 'e' and value[0].f == 3
+    assert type(lazy.pop('c')) is LazyAttyDict
+    with pytest.raises(KeyError):
+        lazy.popitem()
+
+
+@mark_params
+@param(tag='del', remove=lambda d: d.__delitem__('a'))
+@param(tag='pop', remove=lambda d: d.pop('a'))
+@param(tag='popitem', remove=lambda d: d.popitem())
+@param(tag='clear', remove=lambda d: d.clear())
+@param(tag='set', remove=lambda d: d.__setitem__('a', 1))
+def test_lazy_forgets_removed_values(remove):
+    lazy = LazyAttyDict(a={'b': 1})
+    lazy.a
+    remove(lazy)
+    assert lazy._LazyAttyDict__converted == {}
+
+
+def test_lazy_pop_is_tracked():
+    lazy = LazyAttyDict(a={'b': 1}, c=1)
+    lazy.track_changes()
+    lazy.pop('a')
+    lazy.popitem()
+    assert lazy.dirty_paths() == ('a', 'c')
+
+
+def test_lazy_get():
+    lazy = LazyAttyDict(a={'b': 1})
+    assert lazy.get('a').b == 1
+    assert lazy.get('z', 0) == 0
+
+
+def test_lazy_lists():
+    lazy = LazyAttyDict(a=[[{'b': 1}], {'c': 2}, 3])
+    assert lazy.a[0][0].b == 1
+    assert lazy.a[0] is lazy.a[0]
+    assert [type(v) for v in lazy.a[1:]] == [LazyAttyDict, int]
+    assert list(reversed(lazy.a))[1].c == 2
+    assert lazy.a.pop(1).c == 2
+    assert lazy == {'a': [[{'b': 1}], 3]}
+
+
+@given(st.dictionaries(valid_keys, nested_values, max_size=5))
+def test_from_json(inp):
+    loaded = AttyDict.from_json(json.dumps(inp))
+    assert loaded == AttyDict(inp)
+    assert valid_values(*loaded.values())
+
+
+@mark_params
+@param(tag='str', inp='{"a": {"b": 1}}')
+@param(tag='bytes', inp=b'{"a": {"b": 1}}')
+@param(tag='utf16', inp='{"a": {"b": 1}}'.encode('utf-16'))
+def test_from_json_types(inp):
+    assert AttyDict.from_json(inp).a.b == 1
+
+
+@mark_params
+@param(tag='text', fp=io.StringIO('{"a": [{"b": 1}]}'))
+@param(tag='binary', fp=io.BytesIO(b'{"a": [{"b": 1}]}'))
+def test_load_json(fp):
+    assert AttyDict.load_json(fp).a[0].b == 1
+
+
+@mark_params
+@param(tag='invalid_key', inp='{"a": {"not valid": 1}}', err=SyntaxError)
+@param(tag='keyword', inp='{"class": 1}', err=SyntaxError)
+@param(tag='not_an_object', inp='[{"a": 1}]', err=TypeError)
+def test_from_json_errors(inp, err):
+    with pytest.raises(err):
+        AttyDict.from_json(inp)
+
+
+def test_from_json_error_names_class():
+    with pytest.raises(SyntaxError, match='^FrozenAttyDict keys must be valid'):
+        FrozenAttyDict.from_json('{"not valid": 1}')
+
+
+def test_from_json_kwargs():
+    assert type(AttyDict.from_json('{"a": 1.5}', parse_float=str).a) is str
+
+
+@mark_params
+@param(tag='text', lines=io.StringIO('{"a": 1}\n\n{"a": {"b": 2}}\n'))
+@param(tag='binary', lines=io.BytesIO(b'{"a": 1}\n\n{"a": {"b": 2}}\n'))
+@param(tag='list', lines=['{"a": 1}', ' ', '{"a": {"b": 2}}'])
+def test_iter_json_lines(lines):
+    first, second = AttyDict.iter_json_lines(lines)
+    assert first.a == 1
+    assert second.a.b == 2
+
+
+def test_iter_json_lines_is_lazy():
+    def lines():
+        yield '{"a": 1}'
+        raise AssertionError('read too far')
+
+    assert next(AttyDict.iter_json_lines(lines())).a == 1
+
+
+def test_lazy_from_json():
+    loaded = LazyAttyDict.from_json('{"a": [{"b": 1}]}')
+    assert type(loaded) is LazyAttyDict
+    assert loaded.a[0].b == 1
+
+
+def thaw(value):
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+def is_frozen(value) -> bool:
+    if isinstance(value, Mapping):
+        return isinstance(value, FrozenAttyDict) and all(map(is_frozen, value.values()))
+    if isinstance(value, list):
+        return False
+    if isinstance(value, tuple):
+        return all(map(is_frozen, value))
+    return True
+
+
+@given(st.dictionaries(valid_keys, nested_values, max_size=5))
+def test_frozen(inp):
+    frozen = FrozenAttyDict(inp)
+    assert is_frozen(frozen)
+    assert thaw(frozen) == thaw(inp)
+    assert FrozenAttyDict(AttyDict(inp)) == frozen
+    assert hash(FrozenAttyDict(AttyDict(inp))) == hash(frozen)
+
+
+@mark_params
+@param(tag='setitem', f=lambda d: d.__setitem__('a', 2))
+@param(tag='setattr', f=lambda d: setattr(d, 'a', 2))
+@param(tag='delitem', f=lambda d: d.__delitem__('a'))
+@param(tag='delattr', f=lambda d: delattr(d, 'a'))
+@param(tag='update', f=lambda d: d.update(a=2))
+@param(tag='ior', f=lambda d: d.__ior__({'a': 2}))
+@param(tag='pop', f=lambda d: d.pop('a'))
+@param(tag='popitem', f=lambda d: d.popitem())
+@param(tag='setdefault', f=lambda d: d.setdefault('b', 2))
+@param(tag='clear', f=lambda d: d.clear())
+@param(tag='nested', f=lambda d: setattr(d.b, 'c', 2))
+def test_frozen_is_immutable(f):
+    frozen = FrozenAttyDict(a=1, b={'c': 1})
+    with pytest.raises(TypeError):
+        f(frozen)
+    assert frozen == {'a': 1, 'b': {'c': 1}}
+
+
+def test_frozen_hash_is_cached():
+    frozen = FrozenAttyDict(a=1)
+    assert frozen._FrozenAttyDict__hash is None
+    h = hash(frozen)
+    assert frozen._FrozenAttyDict__hash == h
+    assert hash(frozen) == h
+
+
+def test_frozen_eq():
+    assert FrozenAttyDict(a=1, b=2) == FrozenAttyDict(b=2, a=1)
+    assert FrozenAttyDict(a=1) != FrozenAttyDict(a=2)
+    assert FrozenAttyDict(a=1) == {'a': 1}
+    assert FrozenAttyDict(a=1) != {'a': 2}
+
+
+def test_frozen_eq_unhashable_values():
+    value = bytearray(b'x')
+    assert FrozenAttyDict(a=value) == FrozenAttyDict(a=value)
+    with pytest.raises(TypeError):
+        hash(FrozenAttyDict(a=value))
+
+
+def test_frozen_skips_validating_attydict_keys(monkeypatch):
+    atty = AttyDict(a={'b': 1})
+
+    def fail(self, key):
+        raise AssertionError('validated again')
+
+    monkeypatch.setattr(FrozenAttyDict, '_validate_key', fail)
+    assert FrozenAttyDict(atty).a.b == 1
+
+
+@mark_params
+@param(tag='bad_key', inp={'not valid': 1}, err=SyntaxError)
+@param(tag='nested_bad_key', inp={'a': {'class': 1}}, err=SyntaxError)
+@param(tag='not_str', inp={1: 1}, err=TypeError)
+def test_frozen_validates_keys(inp, err):
+    with pytest.raises(err):
+        FrozenAttyDict(inp)
+
+
+@mark_params
+@param(tag='copy', f=copy)
+@param(tag='deepcopy', f=deepcopy)
+@param(tag='pickle', f=lambda d: pickle.loads(pickle.dumps(d)))
+def test_frozen_copy(f):
+    frozen = FrozenAttyDict(a=[{'b': 1}], c={2})
+    copied = f(frozen)
+    assert type(copied) is FrozenAttyDict
+    assert copied == frozen
+    assert hash(copied) == hash(frozen)
+
+
+def test_frozen_from_json():
+    frozen = FrozenAttyDict.from_json('{"a": [[1], {"b": 2}]}')
+    assert is_frozen(frozen)
+    assert frozen.a == ((1,), {'b': 2})
+
+
+@mark_params
+@param(tag='dict', args=({'b': {'c': 1}},), kwargs={})
+@param(tag='pairs', args=([('b', {'c': 1})],), kwargs={})
+@param(tag='attydict', args=(AttyDict(b={'c': 1}),), kwargs={})
+@param(tag='kwargs', args=(), kwargs={'b': {'c': 1}})
+@param(tag='both', args=({'b': {'c': 0}},), kwargs={'b': {'c': 1}})
+def test_update_signature(args, kwargs):
+    atty = AttyDict(a=1)
+    atty.update(*args, **kwargs)
+    assert atty == {'a': 1, 'b': {'c': 1}}
+    assert atty.b.c == 1
+
+
+def test_update_from_attydict_skips_validation(monkeypatch):
+    source = AttyDict(a={'b': 1}, c=[{'d': 2}])
+    target = AttyDict()
+
+    def fail(*args):
+        raise AssertionError('converted again')
+
+    monkeypatch.setattr(AttyDict, '_validate_key', fail)
+    monkeypatch.setattr(AttyDict, '_attrify', fail)
+    target.update(source)
+    assert target == source
+    assert target.a is source.a
+    assert target.c is source.c
+
+
+def test_init_from_attydict_copies_containers():
+    source = AttyDict(l=[1], t=({'a': 1},))
+    copied = AttyDict(source)
+    assert copied == source
+    copied.l.append(2)
+    assert source.l == [1]
+    assert copied.t is not source.t
+
+
+def test_update_validates_keys():
+    with pytest.raises(SyntaxError):
+        AttyDict().update({'not valid': 1})
+
+
+def shares_unchanged(derived, base, changed: set) -> bool:
+    # compares what's stored, without converting anything lazily
+    return all(dict.__getitem__(derived, k) is v for k, v in dict.items(base) if k not in changed)
+
+
+@mark_params
+@param(tag='attydict', cls=AttyDict)
+@param(tag='lazy', cls=LazyAttyDict)
+@param(tag='frozen', cls=FrozenAttyDict)
+def test_derive(cls):
+    base = cls(a={'b': {'c': 1}, 'd': (1,)}, e={'f': 2}, g=3)
+    before = deepcopy(base)
+    derived = base.derive({'a.b.c': 2, ('a', 'x'): {'y': 1}}, g=4)
+    assert type(derived) is cls
+    assert derived == {'a': {'b': {'c': 2}, 'd': (1,), 'x': {'y': 1}}, 'e': {'f': 2}, 'g': 4}
+    assert base == before
+    assert shares_unchanged(derived, base, {'a', 'g'})
+    assert shares_unchanged(derived.a, base.a, {'b', 'x'})
+    assert type(derived.a) is type(derived.a.x) is cls
+
+
+def test_derive_missing_path():
+    assert AttyDict().derive({'a.b': 1}) == {'a': {'b': 1}}
+
+
+def test_derive_replaced_value():
+    derived = AttyDict(a={'b': 1}).derive({'a': {'c': 2}, 'a.d': 3})
+    assert derived == {'a': {'c': 2, 'd': 3}}
+
+
+def test_derive_no_changes():
+    base = AttyDict(a={'b': 1})
+    derived = base.derive()
+    assert derived == base
+    assert derived is not base
+    assert derived.a is base.a
+
+
+@mark_params
+@param(tag='not_a_mapping', changes={'a.b': 1}, err=TypeError)
+@param(tag='bad_key', changes={'c.not valid': 1}, err=SyntaxError)
+def test_derive_errors(changes, err):
+    with pytest.raises(err):
+        AttyDict(a=1).derive(changes)
+
+
+short_keys = st.sampled_from(['a', 'b', 'c'])
+change_ops = st.lists(
+    st.tuples(
+        st.sampled_from(['set', 'delete', 'pop', 'update', 'setdefault']),
+        st.lists(short_keys, min_size=1, max_size=3),
+        st.one_of(st.integers(), st.dictionaries(short_keys, st.integers(), max_size=2)),
+    ),
+    max_size=10,
+)
+
+
+ops_by_name = {
+    'set': lambda d, k, v: setattr(d, k, v),
+    'delete': lambda d, k, v: d.__delitem__(k) if k in d else None,
+    'pop': lambda d, k, v: d.pop(k, None),
+    'update': lambda d, k, v: d.update({k: v}),
+    'setdefault': lambda d, k, v: d.setdefault(k, v),
+}
+
+
+def apply_op(atty, op, path, value):
+    *parents, last = path
+    target = atty
+    for k in parents:
+        if not isinstance(target.get(k), AttyDict):
+            target[k] = {}
+        target = target[k]
+    ops_by_name[op](target, last, value)
+
+
+@given(start=st.dictionaries(short_keys, nested_values, max_size=3), ops=change_ops)
+def test_patch_replays_changes(start, ops):
+    state = AttyDict(start)
+    replica = deepcopy(state)
+    state.track_changes()
+    for op in ops:
+        apply_op(state, *op)
+    replica.apply_patch(state.checkpoint())
+    assert replica == state
+    assert state.dirty_paths() == ()
+
+
+def test_dirty_paths():
+    state = AttyDict(a={'b': {'c': 1}}, d=1, e=2)
+    state.track_changes()
+    state.a.b.c = 2
+    state.d = 3
+    state.a.x = 1
+    del state.a.b['c']
+    state.pop('e')
+    assert state.dirty_paths() == ('d', 'a.x', 'a.b.c', 'e')
+    assert state.a.dirty_paths() == ('x', 'b.c')
+    assert state.patch() == {'d': 3, 'a.x': 1, 'a.b.c': Sentry(), 'e': Sentry()}
+
+
+def test_patch_skips_nested_paths():
+    state = AttyDict(a={'b': 1})
+    state.track_changes()
+    state.a.b = 2
+    state.a = {'c': 3}
+    state.a.d = 4
+    assert state.patch() == {'a': {'c': 3, 'd': 4}}
+
+
+def test_replaced_values_are_not_tracked():
+    state = AttyDict(a={'b': 1})
+    state.track_changes()
+    old = state.a
+    state.a = {'c': 2}
+    state.checkpoint()
+    old.b = 2
+    assert state.dirty_paths() == ()
+
+
+def test_checkpoint_on_nested():
+    state = AttyDict(a={'b': 1}, c=1)
+    state.track_changes()
+    state.a.b = 2
+    state.c = 2
+    assert state.a.checkpoint() == {'b': 2}
+    assert state.dirty_paths() == ('c',)
+
+
+@mark_params
+@param(tag='popitem', f=lambda d: d.popitem())
+@param(tag='clear', f=lambda d: d.clear())
+def test_removing_everything_is_tracked(f):
+    state = AttyDict(a=1)
+    state.track_changes()
+    f(state)
+    assert state.patch() == {'a': Sentry()}
+
+
+def test_lazy_tracking():
+    state = LazyAttyDict(a={'b': {'c': 1}})
+    state.track_changes()
+    state.a.b.c = 2
+    assert state.dirty_paths() == ('a.b.c',)
+
+
+def test_update_is_tracked():
+    state = AttyDict(a=1)
+    state.track_changes()
+    state.update(AttyDict(b=2))
+    state |= {'c': {'d': 1}}
+    assert state.dirty_paths() == ('b', 'c')
+    assert state.c.d == 1
+
+
+def test_stop_tracking():
+    state = AttyDict(a={'b': 1})
+    state.track_changes()
+    state.track_changes(False)
+    state.a.b = 2
+    with pytest.raises(ValueError):
+        state.dirty_paths()
+    with pytest.raises(ValueError):
+        state.a.patch()
+
+
+@mark_params
+@param(tag='copy', f=copy)
+@param(tag='deepcopy', f=deepcopy)
+@param(tag='pickle', f=lambda x: pickle.loads(pickle.dumps(x)))
+def test_copies_are_not_tracked(f):
+    state = AttyDict(a=1, b={'c': 2})
+    state.track_changes()
+    copied = f(state)
+    assert copied == state
+    copied['a'] = 5
+    copied['d'] = 6
+    assert state.dirty_paths() == ()
+    with pytest.raises(ValueError):
+        copied.dirty_paths()
+
+
+def test_apply_patch_deleting_missing_paths():
+    state = AttyDict(a=1)
+    state.apply_patch({'b.c': Sentry(), 'd': Sentry(), 'e.f': 1})
+    assert state == {'a': 1, 'e': {'f': 1}}
+
+
+def test_setdefault_validates():
+    with pytest.raises(SyntaxError):
+        AttyDict().setdefault('not valid', 1)
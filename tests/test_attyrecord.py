@@ -0,0 +1,130 @@
+import copy
+import pickle
+import string
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import AttyDict, AttyRecord, LazyAttyDict
+from collectionish.utils import is_valid_identifier
+
+from tests.utils import param, mark_params
+
+
+valid_keys = st.text(string.ascii_lowercase + '_', min_size=1).filter(is_valid_identifier)
+
+
+@given(
+    fields=st.lists(valid_keys, max_size=5),
+    inp=st.dictionaries(valid_keys, st.integers(), max_size=8),
+)
+def test_matches_attydict(fields, inp):
+    Record = AttyDict.schema(*fields)
+    record = Record(inp)
+    assert record == AttyDict(inp)
+    assert dict(record) == inp
+    assert len(record) == len(inp)
+    for k, v in inp.items():
+        assert k in record
+        assert record[k] == v
+        if not hasattr(Record, k):
+            assert getattr(record, k) == v
+
+
+def test_is_record():
+    Record = AttyDict.schema('a', 'b')
+    assert issubclass(Record, AttyRecord)
+    assert Record.__slots__ == ('a', 'b')
+
+
+def test_schema_is_cached():
+    assert AttyDict.schema('a', 'b') is AttyDict.schema('a', 'b')
+    assert AttyDict.schema('a', 'b') is not AttyDict.schema('b', 'a')
+
+
+def test_schema_of():
+    sample = {'a': 1, 'b': {'c': 2}}
+    assert AttyDict.schema_of(sample) is AttyDict.schema('a', 'b')
+
+
+def test_name():
+    assert AttyDict.schema('a', name='Thing').__name__ == 'Thing'
+
+
+def test_no_instance_dict():
+    record = AttyDict.schema('a')(a=1)
+    assert not hasattr(record, '__dict__')
+
+
+@mark_params
+@param(tag='field', key='a')
+@param(tag='extra', key='z')
+@param(tag='reserved', key='items')
+def test_set_get_delete(key):
+    record = AttyDict.schema('a', 'items')()
+    record[key] = 1
+    assert record[key] == 1
+    assert list(record) == [key]
+    del record[key]
+    assert key not in record
+    with pytest.raises(KeyError):
+        record[key]
+    with pytest.raises(KeyError):
+        del record[key]
+
+
+def test_reserved_names_use_item_access():
+    record = AttyDict.schema('items', 'a')(items=1, a=2)
+    assert record['items'] == 1
+    assert callable(record.items)
+    assert dict(record.items()) == {'items': 1, 'a': 2}
+
+
+def test_unset_field():
+    record = AttyDict.schema('a', 'b')(a=1)
+    assert 'b' not in record
+    with pytest.raises(AttributeError):
+        record.b
+    record.b = 2
+    assert record.b == 2
+
+
+def test_nested_values_have_dot_access():
+    record = AttyDict.schema('a', 'b')(a={'x': 1}, b=[{'y': 2}], c={'z': 3})
+    assert record.a.x == 1
+    assert record.b[0].y == 2
+    assert record.c.z == 3
+
+
+def test_nested_values_use_dict_class():
+    record = LazyAttyDict.schema('a')(a={'x': 1})
+    assert type(record.a) is LazyAttyDict
+
+
+@mark_params
+@param(tag='schema', keys=('not valid',), extra={})
+@param(tag='keyword', keys=('class',), extra={})
+@param(tag='extra', keys=('a',), extra={'not valid': 1})
+def test_invalid_keys(keys, extra):
+    with pytest.raises(SyntaxError, match='^AttyDict keys must be valid'):
+        AttyDict.schema(*keys)(extra)
+
+
+@mark_params
+@param(tag='copy', f=copy.copy)
+@param(tag='deepcopy', f=copy.deepcopy)
+@param(tag='method', f=lambda r: r.copy())
+@param(tag='pickle', f=lambda r: pickle.loads(pickle.dumps(r)))
+def test_copy(f):
+    record = AttyDict.schema('a')(a={'x': 1}, b=2)
+    copied = f(record)
+    assert type(copied) is type(record)
+    assert copied == record
+    copied.b = 3
+    assert record.b == 2
+
+
+def test_repr():
+    assert repr(AttyDict.schema('a')(a=1, b=2)) == "AttyRecord({'a': 1, 'b': 2})"
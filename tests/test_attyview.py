@@ -0,0 +1,115 @@
+import copy
+import pickle
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import AttyDict, AttyView
+
+from tests.utils import param, mark_params
+from tests.test_attydict import valid_keys, nested_values
+
+
+@given(st.dictionaries(valid_keys, nested_values, max_size=5))
+def test_matches_attydict(inp):
+    view = AttyView(inp)
+    atty = AttyDict(inp)
+    assert view == inp
+    assert dict(view) == atty
+    for k in inp:
+        assert view[k] == atty[k]
+        if not hasattr(AttyView, k) and not hasattr(AttyDict, k):
+            assert getattr(view, k) == getattr(atty, k)
+
+
+def test_nothing_is_copied():
+    data = {'a': {'b': [{'c': 1}]}}
+    view = AttyView(data)
+    assert view.a._data is data['a']
+    assert view.a.b._data is data['a']['b']
+    assert view.a.b[0]._data is data['a']['b'][0]
+
+
+def test_views_are_slotted():
+    view = AttyView({'a': [1]})
+    assert not hasattr(view, '__dict__')
+    assert not hasattr(view.a, '__dict__')
+
+
+def test_writes_go_through():
+    data = {'a': {'b': [{'c': 1}]}}
+    view = AttyView(data)
+    view.a.b[0].c = 2
+    view.a.d = 3
+    view['e'] = 4
+    view.a.b.append({'f': 5})
+    del view.a.b[0]
+    assert data == {'a': {'b': [{'f': 5}], 'd': 3}, 'e': 4}
+
+
+def test_assigning_views_stores_the_underlying_data():
+    data = {'a': {'b': 1}, 'c': [1, 2]}
+    view = AttyView(data)
+    view.d = view.a
+    view.c[0:1] = [view.a]
+    assert data['d'] is data['a']
+    assert data['c'][0] is data['a']
+
+
+def test_delete():
+    data = {'a': 1, 'b': 2}
+    view = AttyView(data)
+    del view.a
+    del view['b']
+    assert data == {}
+    with pytest.raises(AttributeError):
+        del view.a
+    with pytest.raises(KeyError):
+        del view['a']
+
+
+def test_missing():
+    view = AttyView({})
+    with pytest.raises(AttributeError):
+        view.a
+    with pytest.raises(KeyError):
+        view['a']
+
+
+def test_any_keys_through_items():
+    view = AttyView({'not valid': {'items': 1}})
+    assert view['not valid']['items'] == 1
+
+
+@mark_params
+@param(tag='list', seq=[{'a': 1}, [2]])
+@param(tag='tuple', seq=({'a': 1}, [2]))
+def test_sequences(seq):
+    view = AttyView({'s': seq})
+    assert view.s[0].a == 1
+    assert [type(v) for v in view.s[:]] == [AttyView, type(view.s[1])]
+    assert list(view.s) == list(seq)
+    assert len(view.s) == 2
+    assert view.s == seq
+
+
+def test_tuples_are_read_only():
+    view = AttyView({'s': (1, 2)})
+    with pytest.raises(TypeError):
+        view.s[0] = 3
+
+
+@mark_params
+@param(tag='copy', f=copy.copy)
+@param(tag='pickle', f=lambda v: pickle.loads(pickle.dumps(v)))
+def test_copy(f):
+    view = AttyView({'a': {'b': 1}})
+    copied = f(view)
+    assert type(copied) is AttyView
+    assert copied == view
+
+
+def test_repr():
+    assert repr(AttyView({'a': 1})) == "AttyView({'a': 1})"
@@ -1,6 +1,12 @@
+import operator
 import random
+import sys
+import tracemalloc
+from functools import lru_cache, reduce
 
-from collectionish import UniqueTuple
+import pytest
+
+from collectionish import UniqueTuple, IntUniqueTuple
 
 n = 1000
 unique_unordered_ints = list(range(n))
@@ -8,6 +14,17 @@ random.shuffle(unique_unordered_ints)
 repeated_unordered_ints = [random.choice(unique_unordered_ints[:100]) for i in range(n)]
 
 
+def memory_usage(f) -> dict:
+    """the retained and peak memory allocated while calling f, in bytes."""
+    tracemalloc.start()
+    try:
+        result = f()  # noqa: F841
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'retained_bytes': retained, 'peak_bytes': peak}
+
+
 def test_benchmark_uniquetuple1(benchmark):
 
     benchmark.group = 'UniqueTuple.unique_unordered'
@@ -26,3 +43,572 @@ def test_benchmark_uniquetuple2(benchmark):
         return UniqueTuple(*repeated_unordered_ints)
 
     return benchmark(f)
+
+
+@lru_cache(maxsize=None)
+def large_uniquetuple(size: int) -> UniqueTuple:
+    return UniqueTuple(*range(size))
+
+
+@pytest.mark.parametrize('size,', [1_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('lookup,', ['tuple', 'uniquetuple'])
+def test_benchmark_uniquetuple_contains(benchmark, size, lookup):
+
+    benchmark.group = f'UniqueTuple.contains[{size}]'
+    ut = large_uniquetuple(size)
+    ut.index(0)  # build the position index outside of the timed bit
+    contains = tuple.__contains__ if lookup == 'tuple' else UniqueTuple.__contains__
+
+    # worst case for a linear scan
+    assert benchmark(contains, ut, size - 1)
+
+
+@pytest.mark.parametrize('size,', [1_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('lookup,', ['tuple', 'uniquetuple'])
+def test_benchmark_uniquetuple_index(benchmark, size, lookup):
+
+    benchmark.group = f'UniqueTuple.index[{size}]'
+    ut = large_uniquetuple(size)
+    ut.index(0)
+    index = tuple.index if lookup == 'tuple' else UniqueTuple.index
+
+    assert benchmark(index, ut, size - 1) == size - 1
+
+
+@pytest.mark.parametrize('construct,', ['unpacked', 'from_iterable'])
+def test_benchmark_uniquetuple_from_generator(benchmark, construct):
+
+    benchmark.group = 'UniqueTuple.from_generator'
+
+    if construct == 'unpacked':
+
+        def f():
+            return UniqueTuple(*(i % 1000 for i in range(100_000)))
+
+    else:
+
+        def f():
+            return UniqueTuple.from_iterable(i % 1000 for i in range(100_000))
+
+    assert len(benchmark(f)) == 1000
+
+
+@pytest.mark.parametrize('method,', ['comprehension', 'intersection'])
+def test_benchmark_uniquetuple_intersection(benchmark, method):
+
+    benchmark.group = 'UniqueTuple.intersection'
+    a = UniqueTuple.from_iterable(unique_unordered_ints)
+    b = tuple(repeated_unordered_ints)
+
+    if method == 'comprehension':
+
+        def f():
+            return UniqueTuple(*[x for x in a if x in b])
+
+    else:
+
+        def f():
+            return a.intersection(b)
+
+    assert len(benchmark(f)) == len(set(b))
+
+
+column_names = [f'column_{i}' for i in range(50)]
+
+
+@pytest.mark.parametrize('construct,', ['init', 'intern'])
+def test_benchmark_uniquetuple_intern(benchmark, construct):
+
+    benchmark.group = 'UniqueTuple.intern'
+    make = UniqueTuple if construct == 'init' else UniqueTuple.intern
+
+    def f():
+        return make(*column_names)
+
+    assert len(benchmark(f)) == len(column_names)
+
+
+@pytest.mark.parametrize('cls,', [UniqueTuple, IntUniqueTuple])
+def test_benchmark_int_ids(benchmark, cls):
+
+    benchmark.group = 'UniqueTuple.int_ids'
+
+    def f():
+        return cls.from_iterable(i * 3 % 200_000 for i in range(300_000))
+
+    benchmark.extra_info.update(memory_usage(f))
+    assert len(benchmark(f)) == 200_000
+
+
+@pytest.mark.parametrize('size,', [1_000, 10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize('path,', ['python', 'numpy'])
+def test_benchmark_uniquetuple_numpy(benchmark, size, path):
+    np = pytest.importorskip('numpy')
+    from collectionish import _vectorized
+
+    benchmark.group = f'UniqueTuple.numpy[{size}]'
+    arr = np.random.randint(0, size // 2, size)
+
+    if path == 'python':
+
+        def f():
+            return UniqueTuple._from_unique(dict.fromkeys(arr.tolist()))
+
+    else:
+
+        def f():
+            return UniqueTuple._from_unique(_vectorized.unique_in_order(arr).tolist())
+
+    assert len(benchmark(f)) == len(np.unique(arr))
+
+
+@pytest.mark.parametrize('method,', ['resort', 'merge'])
+def test_benchmark_sorted_uniquetuple_union(benchmark, method):
+    from collectionish import SortedUniqueTuple
+
+    benchmark.group = 'SortedUniqueTuple.union'
+    a = SortedUniqueTuple.from_iterable(f'{i:06d}' for i in range(0, 200_000, 2))
+    b = SortedUniqueTuple.from_iterable(f'{i:06d}' for i in range(0, 200_000, 3))
+
+    if method == 'resort':
+
+        def f():
+            return SortedUniqueTuple(*a, *b)
+
+    else:
+
+        def f():
+            return a | b
+
+    assert benchmark(f) == SortedUniqueTuple(*a, *b)
+
+
+@pytest.mark.parametrize('method,', ['two_pass', 'key'])
+def test_benchmark_uniquetuple_key(benchmark, method):
+
+    benchmark.group = 'UniqueTuple.key'
+    records = [{'id': i % 1000, 'value': i} for i in range(10_000)]
+    key = operator.itemgetter('id')
+
+    if method == 'two_pass':
+
+        def f():
+            firsts = {}
+            for record in records:
+                k = key(record)
+                if k not in firsts:
+                    firsts[k] = record
+            return tuple(firsts.values())
+
+    else:
+
+        def f():
+            return UniqueTuple.from_iterable(records, key=key)
+
+    assert len(benchmark(f)) == 1000
+
+
+@pytest.mark.parametrize('mode,', ['exact', 'window', 'approximate'])
+def test_benchmark_unique_stream(benchmark, mode):
+    from collectionish import UniqueStream
+
+    benchmark.group = 'UniqueStream'
+    items = [i % 50_000 for i in range(200_000)]
+
+    def make():
+        if mode == 'exact':
+            return UniqueStream(items)
+        if mode == 'window':
+            return UniqueStream(items, window=10_000)
+        return UniqueStream.approximate(items, capacity=50_000, error_rate=0.01)
+
+    def f():
+        stream = make()
+        for _ in stream:
+            pass
+        return stream
+
+    benchmark.extra_info['nbytes'] = f().nbytes
+    benchmark(f)
+
+
+def large_document(n: int = 2_000) -> dict:
+    return {
+        'meta': {'version': 1, 'source': 'bench'},
+        'records': [
+            {'id': i, 'name': f'record_{i}', 'tags': ['a', 'b'], 'attrs': {'x': i, 'y': {'z': i}}}
+            for i in range(n)
+        ],
+    }
+
+
+@pytest.mark.parametrize('cls,', ['AttyDict', 'LazyAttyDict', 'AttyView'])
+def test_benchmark_attydict_large_document(benchmark, cls):
+    import collectionish
+
+    benchmark.group = 'AttyDict.large_document'
+    make = getattr(collectionish, cls)
+    document = large_document()
+
+    def f():
+        doc = make(document)
+        # read a handful of fields
+        return doc.meta.version, doc.records[10].name, doc.records[-1].attrs.y.z
+
+    benchmark.extra_info.update(memory_usage(f))
+    assert benchmark(f) == (1, 'record_10', 1999)
+
+
+@pytest.mark.parametrize('method,', ['loads_then_init', 'from_json'])
+def test_benchmark_attydict_from_json(benchmark, method):
+    import json
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.from_json'
+    text = json.dumps(large_document())
+
+    if method == 'loads_then_init':
+
+        def f():
+            return AttyDict(json.loads(text))
+
+    else:
+
+        def f():
+            return AttyDict.from_json(text)
+
+    assert benchmark(f).records[5].attrs.y.z == 5
+
+
+@pytest.mark.parametrize('cls,', ['AttyDict', 'AttyRecord', 'dict'])
+def test_benchmark_attydict_attribute_access(benchmark, cls):
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.attribute_access'
+    fields = {'id': 1, 'name': 'x', 'score': 2.5, 'active': True}
+    if cls == 'AttyDict':
+        record = AttyDict(fields)
+
+        def f():
+            return record.id + record.score
+
+    elif cls == 'AttyRecord':
+        record = AttyDict.schema_of(fields)(fields)
+
+        def f():
+            return record.id + record.score
+
+    else:
+        record = dict(fields)
+
+        def f():
+            return record['id'] + record['score']
+
+    assert benchmark(f) == 3.5
+
+
+@pytest.mark.parametrize('cls,', ['AttyDict', 'AttyRecord'])
+def test_benchmark_attydict_many_records(benchmark, cls):
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.many_records'
+    make = AttyDict if cls == 'AttyDict' else AttyDict.schema('id', 'name', 'score', 'active')
+
+    def f():
+        return [make(id=i, name='x', score=2.5, active=True) for i in range(10_000)]
+
+    benchmark.extra_info.update(memory_usage(f))
+    assert len(benchmark(f)) == 10_000
+
+
+@pytest.mark.parametrize('cls,', ['AttyDict', 'AttyBatch'])
+def test_benchmark_attybatch_many_records(benchmark, cls):
+    from collectionish import AttyBatch, AttyDict
+
+    benchmark.group = 'AttyBatch.many_records'
+    n = 10_000
+    rows = [
+        {'id': i, 'name': 'x', 'score': 2.5, 'active': True, 'count': 0, 'owner': None}
+        for i in range(n)
+    ]
+
+    if cls == 'AttyDict':
+
+        def f():
+            return [AttyDict(row) for row in rows]
+
+    else:
+
+        def f():
+            return AttyBatch.from_records(rows)
+
+    usage = memory_usage(f)
+    usage['bytes_per_record'] = usage['retained_bytes'] / n
+    benchmark.extra_info.update(usage)
+    assert len(benchmark(f)) == n
+
+
+@pytest.mark.parametrize('method,', ['json_key', 'frozen'])
+def test_benchmark_frozen_attydict_memo_key(benchmark, method):
+    import json
+    from collectionish import AttyDict, FrozenAttyDict
+
+    benchmark.group = 'FrozenAttyDict.memo_key'
+    config = AttyDict(large_document(100))
+    cache = {}
+
+    if method == 'json_key':
+
+        def f():
+            return cache.setdefault(json.dumps(config, sort_keys=True), 1)
+
+    else:
+        frozen = FrozenAttyDict(config)
+
+        def f():
+            return cache.setdefault(frozen, 1)
+
+    assert benchmark(f) == 1
+
+
+@pytest.mark.parametrize('method,', ['setitem', 'update'])
+def test_benchmark_attydict_merge_fragments(benchmark, method):
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.merge_fragments'
+    fragments = [
+        AttyDict({f'key_{i}_{j}': {'value': j} for j in range(10)}) for i in range(1000)
+    ]
+
+    if method == 'setitem':
+
+        def f():
+            merged = AttyDict()
+            for fragment in fragments:
+                for k, v in fragment.items():
+                    merged[k] = v
+            return merged
+
+    else:
+
+        def f():
+            merged = AttyDict()
+            for fragment in fragments:
+                merged.update(fragment)
+            return merged
+
+    assert len(benchmark(f)) == 10_000
+
+
+@pytest.mark.parametrize('method,', ['deepcopy', 'derive'])
+def test_benchmark_attydict_derive(benchmark, method):
+    from copy import deepcopy
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.derive'
+    base = AttyDict(large_document(200))
+
+    if method == 'deepcopy':
+
+        def f():
+            tenants = []
+            for i in range(50):
+                tenant = deepcopy(base)
+                tenant.meta.source = f'tenant_{i}'
+                tenants.append(tenant)
+            return tenants
+
+    else:
+
+        def f():
+            return [base.derive({'meta.source': f'tenant_{i}'}) for i in range(50)]
+
+    benchmark.extra_info.update(memory_usage(f))
+    assert benchmark(f)[-1].meta.source == 'tenant_49'
+
+
+@pytest.mark.parametrize('tracking,', [False, True])
+def test_benchmark_attydict_setitem_tracking(benchmark, tracking):
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.setitem_tracking'
+    state = AttyDict(a=0)
+    if tracking:
+        state.track_changes()
+
+    def f():
+        state['a'] = 1
+        return state
+
+    assert benchmark(f).a == 1
+
+
+@pytest.mark.parametrize('method,', ['dump_all', 'dump_patch'])
+def test_benchmark_attydict_reserialize(benchmark, method):
+    import json
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.reserialize'
+    state = AttyDict(large_document(1000))
+    state.track_changes()
+
+    def f():
+        state.meta.version += 1
+        state.meta.source = 'changed'
+        if method == 'dump_all':
+            return json.dumps(state)
+        return json.dumps(state.checkpoint())
+
+    assert benchmark(f)
+
+
+@pytest.mark.parametrize('method,', ['recursive', 'to_dict'])
+def test_benchmark_attydict_to_dict(benchmark, method):
+    from collectionish import AttyDict
+
+    benchmark.group = 'AttyDict.to_dict'
+    doc = AttyDict(large_document(1000))
+
+    def recursive(value):
+        if isinstance(value, dict):
+            return {k: recursive(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(recursive(v) for v in value)
+        return value
+
+    if method == 'recursive':
+
+        def f():
+            return recursive(doc)
+
+    else:
+
+        def f():
+            return doc.to_dict()
+
+    assert benchmark(f) == doc
+
+
+@pytest.mark.parametrize('keys,', ['shared', 'misaligned'])
+@pytest.mark.parametrize('cls,', ['NumDict', 'ArrayNumDict'])
+def test_benchmark_numdict_arithmetic(benchmark, cls, keys):
+    pytest.importorskip('numpy')
+    import collectionish
+
+    benchmark.group = f'NumDict.arithmetic[{keys}]'
+    make = getattr(collectionish, cls)
+    n = 10_000
+    a = make({f'k{i}': i * 0.5 for i in range(n)})
+    if keys == 'shared':
+        b = make(a)
+    else:
+        # drop every tenth key and reverse the order
+        b = make({f'k{i}': i + 1 for i in reversed(range(n)) if i % 10})
+
+    def f():
+        return ((a + b) * b - a / 2).sum()
+
+    benchmark(f)
+
+
+@pytest.mark.parametrize('length,', [4, 16])
+@pytest.mark.parametrize('mode,', ['eager', 'lazy'])
+def test_benchmark_numdict_chain(benchmark, mode, length):
+    from collectionish import NumDict
+
+    benchmark.group = f'NumDict.chain[{length}]'
+    n = 10_000
+    a = NumDict({f'k{i}': i * 0.5 for i in range(n)})
+    b = NumDict({f'k{i}': i + 1 for i in range(0, n, 2)})
+    c = NumDict({f'k{i}': 2 for i in range(n)})
+
+    def chain(x):
+        # ((x + b) * c - x / 2 + b) * c - ... with length operators
+        y = x
+        for i in range(length // 4):
+            y = (y + b) * c - x / 2
+        return y
+
+    if mode == 'eager':
+
+        def f():
+            return chain(a)
+
+    else:
+
+        def f():
+            return chain(a.lazy()).evaluate()
+
+    benchmark.extra_info.update(memory_usage(f))
+    assert len(benchmark(f)) == n
+
+
+@pytest.mark.parametrize('method,', ['numdicts', 'frame'])
+def test_benchmark_numdict_frame(benchmark, method):
+    pytest.importorskip('numpy')
+    from collectionish import NumDict, NumDictFrame
+
+    benchmark.group = 'NumDictFrame.aggregate'
+    keys = [f'k{i}' for i in range(20)]
+    rows = [NumDict(zip(keys, range(i, i + 20))) for i in range(50_000)]
+    limits = NumDict.fromkeys(keys, 25_000)
+
+    if method == 'numdicts':
+
+        def f():
+            total = reduce(operator.add, rows)
+            over = [row for row in rows if any((row > limits).values())]
+            return total / len(rows), len(over)
+
+    else:
+        frame = NumDictFrame(rows)
+        benchmark.extra_info['frame_bytes'] = frame.array.nbytes
+        benchmark.extra_info['numdicts_bytes'] = sum(map(sys.getsizeof, rows))
+
+        def f():
+            return frame.mean(), len(frame[(frame > limits).any()])
+
+    mean, over = benchmark(f)
+    assert over == 25_018
+    assert mean['k0'] == 24_999.5
+
+
+@pytest.mark.parametrize('cls,', ['NumDict', 'IncrementalNumDict'])
+def test_benchmark_numdict_dashboard(benchmark, cls):
+    import collectionish
+
+    benchmark.group = 'NumDict.dashboard_tick'
+    counters = getattr(collectionish, cls)({f'k{i}': i for i in range(10_000)})
+    updates = [(f'k{random.randrange(10_000)}', random.randrange(-5, 5)) for i in range(100)]
+
+    def f():
+        # a tick: a few counters change then every aggregate is read
+        for key, delta in updates[:10]:
+            counters[key] += delta
+        updates.append(updates.pop(0))
+        return counters.sum(), counters.min(), counters.max(), counters.mean()
+
+    benchmark(f)
+
+
+@pytest.mark.parametrize('method,', ['reduce', 'sum_many', 'sum_many_compensated'])
+def test_benchmark_numdict_sum_many(benchmark, method):
+    from collectionish import NumDict
+
+    benchmark.group = 'NumDict.sum_many'
+    # a day of per minute numdicts
+    minutes = [NumDict({f'k{i}': (m * i) % 97 * 0.1 for i in range(500)}) for m in range(1440)]
+
+    if method == 'reduce':
+
+        def f():
+            return reduce(operator.add, iter(minutes))
+
+    else:
+        compensated = method == 'sum_many_compensated'
+
+        def f():
+            return NumDict.sum_many(iter(minutes), compensated=compensated)
+
+    benchmark.extra_info.update(memory_usage(f))
+    assert len(benchmark(f)) == 500
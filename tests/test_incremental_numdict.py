@@ -0,0 +1,205 @@
+import copy
+import math
+import operator
+import pickle
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import IncrementalNumDict, NumDict
+
+from tests.utils import param, mark_params
+
+
+keys = st.sampled_from('abcdefgh')
+values = st.integers(-1000, 1000) | st.floats(-1e6, 1e6)
+changes = st.one_of(
+    st.tuples(st.just('set'), keys, values),
+    st.tuples(st.just('del'), keys),
+    st.tuples(st.just('pop'), keys),
+    st.tuples(st.just('popitem')),
+    st.tuples(st.just('setdefault'), keys, values),
+    st.tuples(st.just('update'), st.dictionaries(keys, values)),
+    st.tuples(st.just('iadd'), values | st.dictionaries(keys, values).map(NumDict)),
+    st.tuples(st.just('imul'), st.integers(-3, 3)),
+    st.tuples(st.just('clear')),
+)
+non_finite_values = values | st.sampled_from([math.inf, -math.inf, math.nan])
+non_finite_changes = st.one_of(
+    changes,
+    st.tuples(st.just('set'), keys, non_finite_values),
+    st.tuples(st.just('update'), st.dictionaries(keys, non_finite_values)),
+)
+
+
+def some_key(d, key):
+    return key if key in d else next(iter(d))
+
+
+def setitem(d, key, value):
+    d[key] = value
+
+
+def delitem(d, key):
+    if d:
+        del d[some_key(d, key)]
+
+
+CHANGES = {
+    'set': setitem,
+    'del': delitem,
+    'pop': lambda d, key: d and d.pop(some_key(d, key)),
+    'popitem': lambda d: d and d.popitem(),
+    'setdefault': lambda d, key, value: d.setdefault(key, value),
+    'update': lambda d, other: d.update(other),
+    'clear': lambda d: d.clear(),
+    'iadd': operator.iadd,
+    'imul': operator.imul,
+}
+
+
+def apply_change(d, change):
+    name, *args = change
+    result = CHANGES[name](d, *args)
+    return result if name in ('iadd', 'imul') else d
+
+
+def same(result, expected):
+    if isinstance(expected, float) and math.isnan(expected):
+        return math.isnan(result)
+    return result == pytest.approx(expected, abs=1e-6)
+
+
+def assert_aggregates(d):
+    values = list(d.values())
+    nan = any(v != v for v in values)
+    if all(map(math.isfinite, values)):
+        total = math.fsum(values)
+    else:
+        # inf and nan give the same result in any order
+        total = sum(values)
+    assert same(d.sum(), total)
+    if values:
+        assert same(d.min(), math.nan if nan else min(values))
+        assert same(d.max(), math.nan if nan else max(values))
+        assert same(d.mean(), total / len(values))
+    else:
+        with pytest.raises(ValueError):
+            d.min()
+        with pytest.raises(ValueError):
+            d.max()
+
+
+@given(initial=st.dictionaries(keys, values), changes=st.lists(changes, max_size=30))
+def test_aggregates_track_changes(initial, changes):
+    d = IncrementalNumDict(initial)
+    assert_aggregates(d)
+    for change in changes:
+        d = apply_change(d, change)
+        assert isinstance(d, IncrementalNumDict)
+        assert_aggregates(d)
+
+
+@given(
+    initial=st.dictionaries(keys, non_finite_values),
+    changes=st.lists(non_finite_changes, max_size=30),
+)
+def test_aggregates_track_non_finite_changes(initial, changes):
+    d = IncrementalNumDict(initial)
+    assert_aggregates(d)
+    for change in changes:
+        d = apply_change(d, change)
+        assert isinstance(d, IncrementalNumDict)
+        assert_aggregates(d)
+
+
+@given(initial=st.dictionaries(keys, values), changes=st.lists(changes, max_size=30))
+def test_behaves_like_numdict(initial, changes):
+    d, expected = IncrementalNumDict(initial), NumDict(initial)
+    for change in changes:
+        d, expected = apply_change(d, change), apply_change(expected, change)
+    assert d == expected
+    assert list(d) == list(expected)
+
+
+def test_compensated_sum():
+    d = IncrementalNumDict(a=1e16, b=1.0, c=-1e16)
+    for _ in range(1000):
+        d['b'] += 0.1
+    assert d.sum() == pytest.approx(101.0, abs=1e-9)
+    del d['a']
+    assert d.sum() == pytest.approx(math.fsum(d.values()))
+
+
+def test_non_finite_values():
+    d = IncrementalNumDict(a=1.0, b=2.0)
+    d['a'] = math.inf
+    assert d.sum() == math.inf
+    d['a'] = 1.0
+    assert d.sum() == 3.0
+    d['c'] = math.nan
+    assert math.isnan(d.sum()) and math.isnan(d.min()) and math.isnan(d.max())
+    del d['c']
+    assert (d.sum(), d.min(), d.max()) == (3.0, 1.0, 2.0)
+
+
+def test_overflow():
+    d = IncrementalNumDict(a=1e308, b=1e308)
+    assert d.sum() == sum(d.values()) == math.inf
+    d['b'] = -1e308
+    assert d.sum() == 0
+    d['b'] = 1.0
+    assert d.sum() == 1e308 + 1.0
+
+
+def test_int_sum_stays_int():
+    d = IncrementalNumDict(a=1, b=2)
+    d['c'] = 10
+    del d['a']
+    assert d.sum() == 12
+    assert type(d.sum()) is int
+
+
+def test_heaps_stay_bounded():
+    d = IncrementalNumDict(a=0, b=0)
+    d.min(), d.max()
+    for i in range(10_000):
+        d['a'] = i
+        assert d.max() == i
+        assert d.min() == 0
+    assert len(d._min_heap or ()) < 100
+    assert len(d._max_heap or ()) < 100
+
+
+@mark_params
+@param(tag='add', op=operator.add)
+@param(tag='mul', op=operator.mul)
+@param(tag='neg', op=lambda x, y: -x)
+@param(tag='round', op=lambda x, y: round(x))
+def test_results_are_incremental(op):
+    result = op(IncrementalNumDict(a=1.5, b=-2.5), NumDict(a=2))
+    assert isinstance(result, IncrementalNumDict)
+    assert_aggregates(result)
+    result['a'] = 100
+    assert_aggregates(result)
+
+
+def test_fromkeys():
+    d = IncrementalNumDict.fromkeys('abc', 2)
+    assert d.sum() == 6
+
+
+@mark_params
+@param(tag='pickle', f=lambda d: pickle.loads(pickle.dumps(d)))
+@param(tag='copy', f=copy.copy)
+@param(tag='deepcopy', f=copy.deepcopy)
+def test_copies(f):
+    d = IncrementalNumDict(a=1, b=5)
+    d.max()
+    copied = f(d)
+    assert isinstance(copied, IncrementalNumDict)
+    copied['b'] = -1
+    assert_aggregates(copied)
+    assert_aggregates(d)
@@ -0,0 +1,115 @@
+import copy
+import pickle
+import sys
+import tracemalloc
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import IntUniqueTuple, UniqueTuple
+
+from tests.utils import param, mark_params
+
+
+int64s = st.integers(-(2 ** 63), 2 ** 63 - 1)
+dense = st.lists(st.integers(-50, 50))
+sparse = st.lists(st.one_of(st.integers(-50, 50), int64s))
+
+
+@given(args=st.one_of(dense, sparse))
+def test_matches_uniquetuple(args):
+    expected = UniqueTuple(*args)
+    for ints in (IntUniqueTuple(*args), IntUniqueTuple.from_iterable(iter(args))):
+        assert ints == expected
+        assert expected == ints
+        assert hash(ints) == hash(expected)
+        assert list(ints) == list(expected)
+        assert list(reversed(ints)) == list(reversed(expected))
+        assert len(ints) == len(expected)
+
+
+@given(args=st.one_of(dense, sparse), data=st.data())
+def test_lookups_match_uniquetuple(args, data):
+    ints = IntUniqueTuple(*args)
+    expected = UniqueTuple(*args)
+    probe = data.draw(st.one_of(st.sampled_from(args or [0]), int64s))
+    assert (probe in ints) == (probe in expected)
+    assert ints.count(probe) == expected.count(probe)
+    if probe in expected:
+        assert ints.index(probe) == expected.index(probe)
+    else:
+        with pytest.raises(ValueError):
+            ints.index(probe)
+
+
+@given(args=st.one_of(dense, sparse), start=st.integers(-5, 5), stop=st.integers(-5, 5))
+def test_slicing(args, start, stop):
+    ints = IntUniqueTuple(*args)
+    sliced = ints[start:stop]
+    assert isinstance(sliced, IntUniqueTuple)
+    assert sliced == UniqueTuple(*args)[start:stop]
+    for v in sliced:
+        assert v in sliced
+
+
+@mark_params
+@param(tag='float', inp=2.0, expected=True)
+@param(tag='fractional', inp=2.5, expected=False)
+@param(tag='str', inp='2', expected=False)
+@param(tag='unhashable', inp=[2], expected=False)
+def test_contains_non_ints(inp, expected):
+    assert (inp in IntUniqueTuple(1, 2, 3)) == expected
+
+
+@mark_params
+@param(tag='float', inp=1.5, error=TypeError)
+@param(tag='too_big', inp=2 ** 64, error=OverflowError)
+def test_invalid_values(inp, error):
+    with pytest.raises(error):
+        IntUniqueTuple(1, inp)
+
+
+def test_view_is_zero_copy_and_readonly():
+    ints = IntUniqueTuple(3, 2, 3, 1)
+    view = ints.view()
+    assert view.format == 'q'
+    assert view.readonly
+    assert view.tolist() == [3, 2, 1]
+    assert view.obj is ints._values
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='buffer protocol needs python 3.12')
+def test_buffer_protocol():
+    assert memoryview(IntUniqueTuple(3, 2, 3, 1)).tolist() == [3, 2, 1]
+
+
+def test_from_iterable_shares_storage():
+    ints = IntUniqueTuple(3, 2, 1)
+    assert IntUniqueTuple.from_iterable(ints)._values is ints._values
+
+
+@mark_params
+@param(tag='pickle', copier=lambda x: pickle.loads(pickle.dumps(x)))
+@param(tag='copy', copier=copy.copy)
+@param(tag='deepcopy', copier=copy.deepcopy)
+def test_copy(copier):
+    ints = IntUniqueTuple(3, 2, 1)
+    assert copier(ints) == ints
+
+
+def retained_memory(make) -> int:
+    tracemalloc.start()
+    try:
+        obj = make()  # noqa: F841
+        assert 3 in obj
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_smaller_than_uniquetuple():
+    ints = retained_memory(lambda: IntUniqueTuple.from_iterable(i * 3 for i in range(10_000)))
+    boxed = retained_memory(lambda: UniqueTuple.from_iterable(i * 3 for i in range(10_000)))
+    assert ints < boxed / 4
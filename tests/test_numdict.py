@@ -1,6 +1,12 @@
+import functools
+import math
+import operator
+
 import pytest
 from copy import deepcopy
-from collectionish import NumDict, NumAttyDict
+from hypothesis import given
+from hypothesis import strategies as st
+from collectionish import NumDict, NumAttyDict, IncrementalNumDict
 
 
 @pytest.mark.parametrize('x,', [NumDict(a=1.54, b=2.1), NumAttyDict(a=1.54, b=2.1)])
@@ -656,3 +662,93 @@ def test_missing_key_raises_attribute_error_if_accessed_from_attr():
     assert nd.a == 1
     with pytest.raises(AttributeError):
         nd.c
+
+
+numdict_streams = st.lists(
+    st.dictionaries(
+        st.sampled_from('abcd'), st.integers(-100, 100) | st.floats(-100, 100)
+    ).map(NumDict),
+    min_size=1,
+)
+
+
+@pytest.mark.parametrize('compensated,', [False, True])
+@given(numdicts=numdict_streams)
+def test_sum_many_matches_reduce(numdicts, compensated):
+    result = NumDict.sum_many(iter(numdicts), compensated=compensated)
+    expected = functools.reduce(operator.add, numdicts)
+    assert list(result) == list(expected)
+    assert result == pytest.approx(expected)
+    if not compensated:
+        assert result == expected
+
+
+@given(numdicts=numdict_streams)
+def test_sum_many_outer(numdicts):
+    result = NumDict.sum_many(numdicts, join='outer', compensated=True)
+    keys = list(dict.fromkeys(k for nd in numdicts for k in nd))
+    assert list(result) == keys
+    for k in keys:
+        assert result[k] == pytest.approx(math.fsum(nd.get(k, 0) for nd in numdicts))
+
+
+@pytest.mark.parametrize('join,', ['left', 'outer'])
+@given(numdicts=numdict_streams)
+def test_mean_many(numdicts, join):
+    result = NumDict.mean_many(numdicts, join=join)
+    assert result == pytest.approx(NumDict.sum_many(numdicts, join=join) / len(numdicts))
+
+
+@pytest.mark.parametrize('join,', ['left', 'outer'])
+@given(numdicts=numdict_streams)
+def test_minmax_many(numdicts, join):
+    lo, hi = NumDict.minmax_many(numdicts, join=join)
+    assert list(lo) == list(hi) == list(NumDict.sum_many(numdicts, join=join))
+    for k in lo:
+        values = [nd[k] for nd in numdicts if k in nd]
+        assert lo[k] == min(values)
+        assert hi[k] == max(values)
+
+
+def test_sum_many_compensated():
+    numdicts = [NumDict(a=1e16), *[NumDict(a=1.0)] * 1000, NumDict(a=-1e16)]
+    assert NumDict.sum_many(numdicts)['a'] != 1000
+    assert NumDict.sum_many(numdicts, compensated=True)['a'] == 1000
+
+
+@pytest.mark.parametrize(
+    'values,',
+    [
+        [math.inf, 1.0],
+        [1.0, -math.inf, 2.0],
+        [math.inf, -math.inf],
+        [math.nan, 1.0],
+        [1e308, 1e308],
+        [1e308, 1e308, -1e308],
+    ],
+)
+def test_sum_many_compensated_non_finite(values):
+    numdicts = [NumDict(a=v) for v in values]
+    expected = functools.reduce(operator.add, numdicts)['a']
+    result = NumDict.sum_many(numdicts, compensated=True)['a']
+    assert result == expected or math.isnan(result) and math.isnan(expected)
+
+
+def test_many_empty():
+    assert NumDict.sum_many([]) == NumDict()
+    assert NumDict.mean_many(iter([])) == NumDict()
+    assert NumDict.minmax_many([]) == (NumDict(), NumDict())
+
+
+def test_many_bad_join():
+    with pytest.raises(ValueError):
+        NumDict.sum_many([NumDict(a=1)], join='inner')
+    with pytest.raises(ValueError):
+        NumDict.minmax_many([], join='inner')
+
+
+@pytest.mark.parametrize('cls,', [NumAttyDict, IncrementalNumDict])
+def test_many_keeps_class(cls):
+    result = cls.sum_many([NumDict(a=1), NumDict(a=2)])
+    assert type(result) is cls
+    assert result.sum() == 3
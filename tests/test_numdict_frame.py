@@ -0,0 +1,183 @@
+import functools
+import operator
+import pickle
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import ArrayNumDict, NumDict, NumDictFrame, UniqueTuple
+
+from tests.utils import param, mark_params
+
+np = pytest.importorskip('numpy')
+
+
+KEYS = ('a', 'b', 'c')
+rows = st.lists(
+    st.fixed_dictionaries({k: st.integers(-100, 100) for k in KEYS}).map(NumDict), min_size=1
+)
+
+
+@pytest.fixture
+def numdicts():
+    return [NumDict(a=1, b=2, c=3), NumDict(a=4, b=-5, c=6), NumDict(a=7, b=8, c=-9)]
+
+
+@pytest.fixture
+def frame(numdicts):
+    return NumDictFrame(numdicts)
+
+
+def test_rows_match(numdicts, frame):
+    assert len(frame) == 3
+    assert frame.keys == UniqueTuple(*KEYS)
+    assert list(frame) == numdicts
+    assert [frame[i] for i in range(-3, 3)] == numdicts * 2
+    assert frame.to_numdicts() == numdicts
+    with pytest.raises(IndexError):
+        frame[3]
+
+
+def test_rows_share_keys(frame):
+    assert all(row._keys is frame.keys for row in frame)
+
+
+def test_rows_are_views(frame):
+    row = frame[1]
+    row['a'] = 40
+    row *= NumDict(b=2)
+    assert frame[1] == NumDict(a=40, b=-10, c=6)
+    assert frame.column('a').tolist() == [1, 40, 7]
+
+
+@mark_params
+@param(tag='setitem', change=lambda row: row.__setitem__('a', 0.5))
+@param(tag='truediv', change=lambda row: row.__itruediv__(2))
+@param(tag='pow', change=lambda row: row.__ipow__(-1))
+def test_rows_cant_change_dtype(frame, change):
+    row = frame[0]
+    with pytest.raises(TypeError):
+        change(row)
+    assert frame[0] == row == NumDict(a=1, b=2, c=3)
+    row //= 2
+    assert frame[0] == NumDict(a=0, b=1, c=1)
+
+
+def test_missing_and_extra_keys():
+    with pytest.raises(ValueError):
+        NumDictFrame([NumDict(a=1, b=2), NumDict(a=1)])
+    with pytest.raises(ValueError):
+        NumDictFrame([NumDict(a=1), NumDict(a=1, b=2)])
+    frame = NumDictFrame([NumDict(a=1, b=2), NumDict(a=1)], fill=0)
+    assert frame.to_numdicts() == [NumDict(a=1, b=2), NumDict(a=1, b=0)]
+    with pytest.raises(ValueError):
+        NumDictFrame([NumDict(a=1, z=2)], keys=['a', 'b'], fill=0)
+
+
+def test_empty():
+    frame = NumDictFrame([], keys=KEYS)
+    assert len(frame) == 0
+    assert frame.sum() == NumDict(a=0, b=0, c=0)
+    with pytest.raises(ValueError):
+        frame.mean()
+
+
+@mark_params
+@param(tag='sum', method='sum', reduce=lambda rows: functools.reduce(operator.add, rows))
+@param(tag='min', method='min', reduce=lambda rows: {k: min(r[k] for r in rows) for k in KEYS})
+@param(tag='max', method='max', reduce=lambda rows: {k: max(r[k] for r in rows) for k in KEYS})
+@param(tag='mean', method='mean', reduce=lambda rows: sum(rows[1:], rows[0]) / len(rows))
+def test_column_aggregation(method, reduce):
+    @given(rows=rows)
+    def check(rows):
+        result = getattr(NumDictFrame(rows), method)()
+        assert isinstance(result, ArrayNumDict)
+        assert result == pytest.approx(reduce(rows))
+
+    check()
+
+
+@mark_params
+@param(tag='sum', method='sum')
+@param(tag='min', method='min')
+@param(tag='max', method='max')
+@param(tag='mean', method='mean')
+def test_row_aggregation(numdicts, frame, method):
+    expected = [getattr(nd, method)() for nd in numdicts]
+    assert getattr(frame, method)(axis=1).tolist() == pytest.approx(expected)
+
+
+@mark_params
+@param(tag='add', op=operator.add)
+@param(tag='sub', op=operator.sub)
+@param(tag='mul', op=operator.mul)
+@param(tag='truediv', op=operator.truediv)
+@param(tag='floordiv', op=operator.floordiv)
+@param(tag='mod', op=operator.mod)
+@param(tag='pow', op=operator.pow)
+def test_broadcasting(numdicts, frame, op):
+    for other in (2, NumDict(b=3, a=2), ArrayNumDict(c=2, z=1)):
+        result = op(frame, other)
+        assert isinstance(result, NumDictFrame)
+        assert result.to_numdicts() == [op(nd, other) for nd in numdicts]
+    assert op(2, frame).to_numdicts() == [op(2, nd) for nd in numdicts]
+
+
+def test_frame_with_frame(numdicts, frame):
+    other = NumDictFrame([NumDict(b=1, a=2)] * 3)
+    assert (frame * other).to_numdicts() == [nd * NumDict(a=2, b=1) for nd in numdicts]
+    assert (frame + frame).to_numdicts() == [nd + nd for nd in numdicts]
+    with pytest.raises(ValueError):
+        frame + frame[:2]
+
+
+def test_inplace(numdicts, frame):
+    original = frame
+    frame += NumDict(a=1)
+    frame /= 2
+    assert frame is original
+    assert frame.to_numdicts() == [(nd + NumDict(a=1)) / 2 for nd in numdicts]
+
+
+def test_comparison_and_masks(frame):
+    mask = (frame > NumDict(a=3, b=0, c=0)).all(axis=1)
+    assert mask.tolist() == [False, False, False]
+    mask = (frame < 0).any(axis=1)
+    assert frame[mask].to_numdicts() == [NumDict(a=4, b=-5, c=6), NumDict(a=7, b=8, c=-9)]
+    assert (frame >= 1).all(axis=0) == NumDict(a=True, b=False, c=False)
+    with pytest.raises(RuntimeError):
+        frame > NumDict(a=1)
+
+
+def test_unary(numdicts, frame):
+    assert abs(frame).to_numdicts() == [abs(nd) for nd in numdicts]
+    assert (-frame).to_numdicts() == [-nd for nd in numdicts]
+
+
+def test_slicing_and_indexing(frame):
+    assert frame[1:].to_numdicts() == frame.to_numdicts()[1:]
+    assert frame[[2, 0]].to_numdicts() == [frame[2], frame[0]]
+    # slices are views, fancy indexing copies
+    frame[1:][0]['a'] = 100
+    frame[[1]][0]['a'] = 200
+    assert frame[1]['a'] == 100
+
+
+def test_from_array():
+    frame = NumDictFrame.from_array(['a', 'b'], np.arange(6).reshape(3, 2))
+    assert frame.to_numdicts()[2] == NumDict(a=4, b=5)
+    with pytest.raises(ValueError):
+        NumDictFrame.from_array(['a'], np.arange(6).reshape(3, 2))
+
+
+def test_array_is_read_only(frame):
+    with pytest.raises(ValueError):
+        frame.array[0, 0] = 1
+    with pytest.raises(ValueError):
+        frame.column('a')[0] = 1
+
+
+def test_pickle(frame):
+    assert pickle.loads(pickle.dumps(frame)).to_numdicts() == frame.to_numdicts()
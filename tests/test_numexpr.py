@@ -0,0 +1,132 @@
+import operator
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import NumAttyDict, NumDict, NumExpr
+
+from tests.utils import param, mark_params
+
+
+numdicts = st.builds(
+    NumDict, st.dictionaries(st.sampled_from('abcd'), st.integers(-5, 5) | st.floats(-5, 5))
+)
+binary_ops = st.sampled_from(
+    [operator.add, operator.sub, operator.mul, operator.truediv, operator.floordiv, operator.mod]
+)
+unary_ops = st.sampled_from([abs, operator.neg, round, lambda x: round(x, 1)])
+
+
+def trees(leaves):
+    # nested tuples describing an expression, leaves index into a pool of numdicts
+    return st.recursive(
+        leaves,
+        lambda children: st.tuples(unary_ops, children)
+        | st.tuples(binary_ops, children, children | st.floats(1, 3).map(str)),
+        max_leaves=8,
+    )
+
+
+def build(tree, pool, lazy):
+    if isinstance(tree, int):
+        return pool[tree].lazy() if lazy else pool[tree]
+    if isinstance(tree, str):
+        return float(tree)
+    if len(tree) == 2:
+        return tree[0](build(tree[1], pool, lazy))
+    op, left, right = tree
+    return op(build(left, pool, lazy), build(right, pool, lazy))
+
+
+def outcome(f):
+    try:
+        return repr(f())
+    except (ZeroDivisionError, RuntimeError) as e:
+        return type(e)
+
+
+@given(pool=st.lists(numdicts, min_size=3, max_size=3), tree=trees(st.integers(0, 2)))
+def test_matches_eager(pool, tree):
+    eager = outcome(lambda: build(tree, pool, lazy=False))
+    lazy = outcome(lambda: build(tree, pool, lazy=True).evaluate())
+    if eager is ZeroDivisionError and lazy is not ZeroDivisionError:
+        # eager evaluation can fail on a key that never makes it into the result
+        return
+    assert lazy == eager
+
+
+@mark_params
+@param(tag='right', f=lambda a, b: (a.lazy() + b).evaluate(), expected=NumDict(x=4, y=2))
+@param(tag='reflected', f=lambda a, b: (b + a.lazy()).evaluate(), expected=NumDict(x=4))
+@param(tag='scalar_left', f=lambda a, b: (10 - a.lazy()).evaluate(), expected=NumDict(x=9, y=8))
+@param(
+    tag='nested', f=lambda a, b: (a.lazy() * (b.lazy() + a)).evaluate(), expected=NumDict(x=4, y=2)
+)
+def test_missing_keys_use_identity(f, expected):
+    a, b = NumDict(x=1, y=2), NumDict(x=3)
+    result = f(a, b)
+    assert result == expected
+    assert repr(result) == repr(expected)
+
+
+def test_result_type_comes_from_left():
+    a, b = NumAttyDict(x=1), NumDict(x=2)
+    assert type((a.lazy() + b).evaluate()) is NumAttyDict
+    assert type((b.lazy() + a).evaluate()) is NumDict
+
+
+def test_values_are_read_on_evaluate():
+    a = NumDict(x=1)
+    expr = a.lazy() * 2
+    a['x'] = 5
+    a['y'] = 1
+    assert expr.evaluate() == NumDict(x=10, y=2)
+
+
+def test_comparison_keys_must_match():
+    a, b = NumDict(x=1, y=2), NumDict(x=3)
+    expr = a.lazy() > b
+    with pytest.raises(RuntimeError):
+        expr.evaluate()
+    assert (a.lazy() > 1).evaluate() == NumDict(x=False, y=True)
+
+
+def test_unsupported_operand():
+    with pytest.raises(TypeError):
+        NumDict(x=1).lazy() + 'x'
+    with pytest.raises(TypeError):
+        NumDict(x=1).lazy() + {'x': 1}
+
+
+def test_kernels_are_cached():
+    a, b = NumDict(x=1), NumDict(x=2)
+    (a.lazy() * b + 1).evaluate()
+    hits = NumExpr.kernel_cache_info().hits
+    assert (b.lazy() * a + 5).evaluate() == NumDict(x=7)
+    assert NumExpr.kernel_cache_info().hits == hits + 1
+
+
+def test_repr():
+    a, b = NumDict(x=1), NumDict(x=2)
+    expected = 'NumExpr(for k, v in d0.items(): t0 = v + d1.get(k, 0); out[k] = t0)'
+    assert repr(a.lazy() + b) == expected
+
+
+def test_long_chain():
+    a, b = NumDict(x=1, y=2), NumDict(x=3)
+    lazy, eager = a.lazy(), a
+    for i in range(500):
+        lazy, eager = lazy * b - i, eager * b - i
+    assert lazy.evaluate() == eager
+
+
+def test_shared_subexpressions_are_computed_once():
+    a = NumDict(x=1.0, y=2.0)
+    expr = a.lazy()
+    for _ in range(30):
+        expr = expr * 0.5 + expr * 0.5
+    assert expr.evaluate() == a
+    # a statement for each of the 3 nodes added per round, then one for the result
+    assert repr(expr).count(';') == 90
@@ -1,4 +1,4 @@
-from typing import NamedTuple, Any, Iterator, Tuple, Dict
+from typing import NamedTuple, Any, Iterator, Mapping, Tuple, Dict
 
 
 import string
@@ -9,9 +9,9 @@ import pytest
 import hypothesis.strategies as st
 from hypothesis import given
 
-from collectionish import AttyDict
+from collectionish import AttyDict, AttyView, FrozenAttyDict, LazyAttyDict
 from collectionish.utils import is_valid_identifier, is_mapping
-from collectionish.ops import rgetattr, flatten_mapping
+from collectionish.ops import rgetattr, flatten_mapping, to_plain
 
 py_names = st.text(string.ascii_lowercase + '_').filter(is_valid_identifier)
 
@@ -77,3 +77,86 @@ def test_flatten_attydict_with_keeptype_and_underscore_delim_is_fine():
     flat = flatten_mapping(attydict, keep_type=True, delimiter='_')
     assert isinstance(flat, AttyDict)
     assert flat == AttyDict(this_nested_number=1, this_nested_name='teddy', other=2)
+
+
+plain_values = st.recursive(
+    st.one_of(st.integers(), st.text(string.ascii_lowercase)),
+    lambda children: st.one_of(
+        st.lists(children, max_size=4),
+        st.lists(children, max_size=4).map(tuple),
+        st.dictionaries(py_names, children, max_size=4),
+    ),
+    max_leaves=10,
+)
+
+
+def exactly_plain(value) -> bool:
+    if type(value) is dict:
+        return all(map(exactly_plain, value.values()))
+    if type(value) in (list, tuple):
+        return all(map(exactly_plain, value))
+    return not isinstance(value, (Mapping, list, tuple))
+
+
+@given(plain_values)
+def test_to_plain_returns_plain_values_as_they_are(value):
+    assert to_plain(value) is value
+
+
+@pytest.mark.parametrize('cls,', [AttyDict, LazyAttyDict, FrozenAttyDict, AttyView])
+@given(value=st.dictionaries(py_names, plain_values, max_size=4))
+def test_to_plain(cls, value):
+    converted = to_plain(cls(value))
+    assert exactly_plain(converted)
+    assert converted == (to_plain(FrozenAttyDict(value)) if cls is FrozenAttyDict else value)
+
+
+def test_to_dict():
+    atty = AttyDict(a={'b': [{'c': 1}, (2, {'d': 3})]})
+    converted = atty.to_dict()
+    assert converted == atty
+    assert exactly_plain(converted)
+
+
+def test_to_plain_reuses_plain_subtrees():
+    plain = {'a': [1, 2]}
+    converted = to_plain(LazyAttyDict(x=plain, y=AttyDict(z=1)))
+    assert converted['x'] is plain
+    assert type(converted['y']) is dict
+
+
+def test_to_plain_shares_repeated_subtrees():
+    shared = AttyDict(a=1)
+    converted = to_plain([shared, {'b': shared}])
+    assert converted[0] is converted[1]['b']
+    assert type(converted[0]) is dict
+
+
+def test_to_plain_converts_subclasses():
+    Pair = NamedTuple('Pair', [('a', int), ('b', int)])
+    converted = to_plain({'x': Pair(1, 2), 'y': [AttyDict()]})
+    assert type(converted['x']) is tuple
+    assert converted == {'x': (1, 2), 'y': [{}]}
+
+
+def test_to_plain_deep():
+    value = leaf = {}
+    for _ in range(100_000):
+        leaf['a'] = AttyDict()
+        leaf = leaf['a']
+    converted = to_plain(value)
+    for _ in range(100_000):
+        converted = converted['a']
+        assert type(converted) is dict
+
+
+def test_to_plain_cycle():
+    atty = AttyDict(a=[])
+    atty.a.append(atty)
+    with pytest.raises(ValueError):
+        to_plain(atty)
+
+
+def test_to_plain_leaves():
+    assert to_plain(1) == 1
+    assert to_plain({1, 2}) == {1, 2}
@@ -0,0 +1,114 @@
+import copy
+import pickle
+import string
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, rule, invariant
+
+from collectionish import OrderedSet, UniqueTuple
+
+from tests.utils import param, mark_params
+
+
+values = st.sampled_from(string.ascii_lowercase[:8])
+
+
+class OrderedSetMachine(RuleBasedStateMachine):
+    """compare an OrderedSet against a dict (which also remembers insertion order)."""
+
+    def __init__(self):
+        super().__init__()
+        self.ordered = OrderedSet()
+        self.shadow = {}
+
+    @rule(v=values)
+    def add(self, v):
+        self.ordered.add(v)
+        self.shadow.setdefault(v, None)
+
+    @rule(v=values)
+    def discard(self, v):
+        self.ordered.discard(v)
+        self.shadow.pop(v, None)
+
+    @rule()
+    def pop(self):
+        if self.shadow:
+            expected, _ = self.shadow.popitem()
+            assert self.ordered.pop() == expected
+        else:
+            with pytest.raises(KeyError):
+                self.ordered.pop()
+
+    @invariant()
+    def check(self):
+        assert list(self.ordered) == list(self.shadow)
+        assert list(reversed(self.ordered)) == list(reversed(list(self.shadow)))
+        assert len(self.ordered) == len(self.shadow)
+        assert self.ordered._tombstones <= len(self.ordered)
+        for v in self.shadow:
+            assert v in self.ordered
+
+    @invariant()
+    def check_freeze(self):
+        frozen = self.ordered.freeze()
+        assert isinstance(frozen, UniqueTuple)
+        assert frozen == UniqueTuple(*self.shadow)
+        for i, v in enumerate(frozen):
+            assert frozen.index(v) == i
+
+
+TestOrderedSet = OrderedSetMachine.TestCase
+
+
+@given(st.lists(values))
+def test_init_matches_uniquetuple(args):
+    assert tuple(OrderedSet(*args)) == UniqueTuple(*args)
+    assert tuple(OrderedSet.from_iterable(args)) == UniqueTuple(*args)
+    assert tuple(OrderedSet.from_iterable(UniqueTuple(*args))) == UniqueTuple(*args)
+
+
+def test_from_keyed_uniquetuple():
+    keyed = UniqueTuple(('a', 1), ('b', 2), ('c', 1), key=lambda x: x[1])
+    ordered = OrderedSet.from_iterable(keyed)
+    assert tuple(ordered) == (('a', 1), ('b', 2))
+    assert ('a', 1) in ordered
+    assert 1 not in ordered
+    ordered.add(1)
+    assert tuple(ordered) == (('a', 1), ('b', 2), 1)
+
+
+def test_remove_missing_raises():
+    with pytest.raises(KeyError):
+        OrderedSet(1, 2).remove(3)
+
+
+def test_unhashable_not_in():
+    assert [1] not in OrderedSet(1, 2)
+
+
+@mark_params
+@param(tag='or', op=lambda a, b: a | b, expected=(3, 2, 1, 4))
+@param(tag='and', op=lambda a, b: a & b, expected=(3, 1))
+@param(tag='sub', op=lambda a, b: a - b, expected=(2,))
+def test_set_operations_keep_order(op, expected):
+    result = op(OrderedSet(3, 2, 1), OrderedSet(4, 1, 3))
+    assert isinstance(result, OrderedSet)
+    assert tuple(result) == expected
+
+
+@mark_params
+@param(tag='pickle', copier=lambda x: pickle.loads(pickle.dumps(x)))
+@param(tag='copy', copier=copy.copy)
+@param(tag='method', copier=lambda x: x.copy())
+def test_copy(copier):
+    ordered = OrderedSet(3, 2, 1, 0)
+    ordered.discard(2)
+    copied = copier(ordered)
+    assert copied is not ordered
+    assert tuple(copied) == (3, 1, 0)
+    copied.add(5)
+    assert 5 not in ordered
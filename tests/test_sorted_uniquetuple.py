@@ -0,0 +1,101 @@
+import copy
+import pickle
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import SortedUniqueTuple
+
+from tests.utils import param, mark_params
+
+
+small_ints = st.lists(st.integers(-20, 20))
+
+
+@given(small_ints)
+def test_sorted_and_unique(args):
+    st_ = SortedUniqueTuple(*args)
+    assert list(st_) == sorted(set(args))
+    assert SortedUniqueTuple.from_iterable(iter(args)) == st_
+
+
+def test_from_iterable_with_sorted_is_identity():
+    st_ = SortedUniqueTuple(3, 2, 1)
+    assert SortedUniqueTuple.from_iterable(st_) is st_
+
+
+@given(args=small_ints, probe=st.integers(-25, 25))
+def test_lookups(args, probe):
+    st_ = SortedUniqueTuple(*args)
+    assert (probe in st_) == (probe in args)
+    assert st_.count(probe) == int(probe in args)
+    if probe in args:
+        assert st_.index(probe) == sorted(set(args)).index(probe)
+    else:
+        with pytest.raises(ValueError):
+            st_.index(probe)
+
+
+@mark_params
+@param(tag='in_range', start=1, stop=3, raises=False)
+@param(tag='negative', start=-3, stop=-1, raises=False)
+@param(tag='after', start=3, stop=4, raises=True)
+@param(tag='before', start=0, stop=2, raises=True)
+@param(tag='empty', start=3, stop=1, raises=True)
+def test_index_bounds(start, stop, raises):
+    st_ = SortedUniqueTuple('a', 'b', 'c', 'd')
+    if raises:
+        with pytest.raises(ValueError):
+            st_.index('c', start, stop)
+    else:
+        assert st_.index('c', start, stop) == 2
+
+
+def test_uncomparable_not_in():
+    assert 'a' not in SortedUniqueTuple(1, 2)
+    assert [1] not in SortedUniqueTuple(1, 2)
+
+
+@given(args=small_ints, lo=st.none() | st.integers(-25, 25), hi=st.none() | st.integers(-25, 25))
+def test_between(args, lo, hi):
+    result = SortedUniqueTuple(*args).between(lo, hi)
+    assert isinstance(result, SortedUniqueTuple)
+    expected = [
+        x for x in sorted(set(args)) if (lo is None or lo <= x) and (hi is None or x < hi)
+    ]
+    assert list(result) == expected
+
+
+@given(a=small_ints, others=st.lists(small_ints, max_size=3))
+def test_set_operations(a, others):
+    st_ = SortedUniqueTuple(*a)
+    for sorted_others in (others, [SortedUniqueTuple(*o) for o in others]):
+        assert list(st_.union(*sorted_others)) == sorted(set(a).union(*others))
+        assert list(st_.intersection(*sorted_others)) == sorted(set(a).intersection(*others))
+        assert list(st_.difference(*sorted_others)) == sorted(set(a).difference(*others))
+
+
+@given(a=small_ints, b=small_ints)
+def test_operators(a, b):
+    x, y = SortedUniqueTuple(*a), SortedUniqueTuple(*b)
+    assert x | y == x.union(y)
+    assert x & y == x.intersection(y)
+    assert x - y == x.difference(y)
+
+
+def test_operators_require_sorted_uniquetuple():
+    with pytest.raises(TypeError):
+        SortedUniqueTuple(1, 2) | (2, 3)
+
+
+@mark_params
+@param(tag='pickle', copier=lambda x: pickle.loads(pickle.dumps(x)))
+@param(tag='copy', copier=copy.copy)
+@param(tag='deepcopy', copier=copy.deepcopy)
+def test_copy(copier):
+    st_ = SortedUniqueTuple(3, 2, 1)
+    copied = copier(st_)
+    assert copied == st_
+    assert isinstance(copied, SortedUniqueTuple)
@@ -0,0 +1,93 @@
+from itertools import count, islice
+
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import UniqueStream, UniqueTuple
+
+from tests.utils import param, mark_params
+
+
+small_ints = st.lists(st.integers(0, 20))
+
+
+@given(small_ints)
+def test_exact_matches_uniquetuple(args):
+    assert list(UniqueStream(args)) == list(UniqueTuple(*args))
+
+
+@given(small_ints)
+def test_exact_with_key(args):
+    assert list(UniqueStream(args, key=lambda x: x % 5)) == list(
+        UniqueTuple(*args, key=lambda x: x % 5)
+    )
+
+
+@given(args=small_ints, window=st.integers(1, 5))
+def test_window(args, window):
+    expected = []
+    recent = []
+    for x in args:
+        if x in recent:
+            recent.remove(x)
+        else:
+            expected.append(x)
+        recent = (recent + [x])[-window:]
+    assert list(UniqueStream(args, window=window)) == expected
+
+
+@given(small_ints)
+def test_large_window_is_exact(args):
+    assert list(UniqueStream(args, window=100)) == list(UniqueTuple(*args))
+
+
+@given(small_ints)
+def test_approximate_never_yields_duplicates(args):
+    result = list(UniqueStream.approximate(args, capacity=10, error_rate=0.1))
+    assert len(result) == len(set(result))
+    assert set(result) <= set(args)
+
+
+def test_approximate_error_rate():
+    n = 10_000
+    result = list(UniqueStream.approximate(range(n), capacity=n, error_rate=0.01))
+    assert len(result) >= n * 0.97
+
+
+def test_is_lazy():
+    stream = UniqueStream(x % 3 for x in count())
+    assert list(islice(stream, 3)) == [0, 1, 2]
+
+
+def test_is_lazy_with_infinite_unique_items():
+    stream = UniqueStream(count(), window=10)
+    assert list(islice(stream, 5)) == [0, 1, 2, 3, 4]
+
+
+def test_bounded_modes_have_bounded_memory():
+    window = UniqueStream(range(100_000), window=100)
+    approx = UniqueStream.approximate(range(100_000), capacity=100)
+    list(islice(window, 1000))
+    list(islice(approx, 1000))
+    sizes = (window.nbytes, approx.nbytes)
+    list(window)
+    list(approx)
+    assert (window.nbytes, approx.nbytes) == sizes
+
+
+def test_exact_memory_grows():
+    stream = UniqueStream(range(1000))
+    empty = stream.nbytes
+    list(stream)
+    assert stream.nbytes > empty
+
+
+@mark_params
+@param(tag='window', make=lambda: UniqueStream([], window=0))
+@param(tag='capacity', make=lambda: UniqueStream.approximate([], capacity=0))
+@param(tag='error_rate', make=lambda: UniqueStream.approximate([], capacity=10, error_rate=1))
+def test_invalid_arguments(make):
+    with pytest.raises(ValueError):
+        make()
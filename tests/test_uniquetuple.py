@@ -1,8 +1,17 @@
 from typing import Sequence, Hashable, Union
+from functools import reduce
+from itertools import chain
+import copy
+import operator
+import pickle
+
+import pytest
 
 from hypothesis import given, infer, assume
+from hypothesis import strategies as st
 
 from collectionish import UniqueTuple
+from collectionish._lru import LRUCache
 from collectionish.utils import is_hashable
 
 from tests.utils import param, mark_params
@@ -29,3 +38,282 @@ def test_typehints(inp):
     hint = UniqueTuple[inp]
     assert hint.__args__ == (inp,)
     assert hint.__origin__ == UniqueTuple
+
+
+@given(args=infer)
+def test_membership_matches_tuple(args: Sequence[Hashable]):
+    assume(all(map(is_hashable, args)))
+    ut = UniqueTuple(*args)
+    for arg in args:
+        assert arg in ut
+        assert ut.count(arg) == 1
+        assert ut.index(arg) == tuple.index(ut, arg)
+
+
+@mark_params
+@param(tag='missing', inp=4)
+@param(tag='unhashable', inp=[1])
+def test_not_in(inp):
+    ut = UniqueTuple(3, 2, 1)
+    assert inp not in ut
+    assert ut.count(inp) == 0
+    with pytest.raises(ValueError):
+        ut.index(inp)
+
+
+@mark_params
+@param(tag='in_range', start=1, stop=3, expected=2)
+@param(tag='negative_start', start=-2, stop=None, expected=2)
+def test_index_with_bounds(start, stop, expected):
+    ut = UniqueTuple('a', 'b', 'c', 'd')
+    if stop is None:
+        assert ut.index('c', start) == expected
+    else:
+        assert ut.index('c', start, stop) == expected
+
+
+@mark_params
+@param(tag='after', start=3, stop=4)
+@param(tag='before', start=0, stop=2)
+def test_index_out_of_bounds(start, stop):
+    ut = UniqueTuple('a', 'b', 'c', 'd')
+    with pytest.raises(ValueError):
+        ut.index('c', start, stop)
+
+
+@mark_params
+@param(tag='pickle', copier=lambda x: pickle.loads(pickle.dumps(x)))
+@param(tag='copy', copier=copy.copy)
+@param(tag='deepcopy', copier=copy.deepcopy)
+def test_copy(copier):
+    ut = UniqueTuple(3, 2, 1)
+    assert 2 in ut
+    copied = copier(ut)
+    assert copied == ut
+    assert isinstance(copied, UniqueTuple)
+
+
+@given(args=infer)
+def test_from_iterable_matches_init(args: Sequence[Hashable]):
+    assume(all(map(is_hashable, args)))
+    expected = UniqueTuple(*args)
+    assert UniqueTuple.from_iterable(args) == expected
+    assert UniqueTuple.from_iterable(iter(args)) == expected
+    assert UniqueTuple.from_iterable(arg for arg in args) == expected
+
+
+def test_from_iterable_with_uniquetuple_is_identity():
+    ut = UniqueTuple(3, 2, 1)
+    assert UniqueTuple.from_iterable(ut) is ut
+
+
+def test_from_iterable_with_uniquetuple_subclass():
+    class SubTuple(UniqueTuple):
+        pass
+
+    ut = UniqueTuple(3, 2, 1)
+    assert ut.index(1) == 2
+    sub = SubTuple.from_iterable(ut)
+    assert isinstance(sub, SubTuple)
+    assert sub == ut
+    assert sub.index(1) == 2
+
+
+small_ints = st.lists(st.integers(0, 10))
+
+
+def is_ordered_by_first_appearance(ut: UniqueTuple, *sources) -> bool:
+    order = UniqueTuple.from_iterable(chain(*sources))
+    return list(ut) == [v for v in order if v in ut]
+
+
+@given(a=small_ints, others=st.lists(small_ints, max_size=3))
+def test_union(a, others):
+    result = UniqueTuple(*a).union(*others)
+    assert set(result) == set(a).union(*others)
+    assert is_ordered_by_first_appearance(result, a, *others)
+
+
+@given(a=small_ints, others=st.lists(small_ints, max_size=3))
+def test_intersection(a, others):
+    result = UniqueTuple(*a).intersection(*others)
+    assert set(result) == set(a).intersection(*others)
+    assert is_ordered_by_first_appearance(result, a)
+
+
+@given(a=small_ints, others=st.lists(small_ints, max_size=3))
+def test_difference(a, others):
+    result = UniqueTuple(*a).difference(*others)
+    assert set(result) == set(a).difference(*others)
+    assert is_ordered_by_first_appearance(result, a)
+
+
+@given(a=small_ints, others=st.lists(small_ints, max_size=3))
+def test_symmetric_difference(a, others):
+    result = UniqueTuple(*a).symmetric_difference(*others)
+    expected = reduce(set.symmetric_difference, map(set, others), set(a))
+    assert set(result) == expected
+    assert is_ordered_by_first_appearance(result, a, *others)
+
+
+@given(a=small_ints, b=small_ints)
+def test_comparisons_match_set(a, b):
+    ut = UniqueTuple(*a)
+    assert ut.issubset(b) == set(a).issubset(b)
+    assert ut.issuperset(b) == set(a).issuperset(b)
+    assert ut.isdisjoint(b) == set(a).isdisjoint(b)
+
+
+@given(a=small_ints, b=small_ints)
+def test_operators(a, b):
+    x, y = UniqueTuple(*a), UniqueTuple(*b)
+    assert x | y == x.union(y)
+    assert x & y == x.intersection(y)
+    assert x - y == x.difference(y)
+    assert x ^ y == x.symmetric_difference(y)
+
+
+@mark_params
+@param(tag='or', op=operator.or_)
+@param(tag='and', op=operator.and_)
+@param(tag='sub', op=operator.sub)
+@param(tag='xor', op=operator.xor)
+def test_operators_require_uniquetuple(op):
+    with pytest.raises(TypeError):
+        op(UniqueTuple(1, 2), (2, 3))
+
+
+@pytest.fixture
+def small_intern_cache(monkeypatch):
+    monkeypatch.setattr(UniqueTuple, '_intern_cache', LRUCache(maxsize=2))
+
+
+@pytest.mark.usefixtures('small_intern_cache')
+def test_intern_returns_shared_instance():
+    a = UniqueTuple.intern('a', 'b', 'a')
+    b = UniqueTuple.intern('a', 'b', 'a')
+    assert a is b
+    assert a == UniqueTuple('a', 'b')
+    assert UniqueTuple.intern_cache_info() == (1, 1, 2, 1)
+
+
+@pytest.mark.usefixtures('small_intern_cache')
+def test_intern_evicts_least_recently_used():
+    first = UniqueTuple.intern(1)
+    UniqueTuple.intern(2)
+    UniqueTuple.intern(1)
+    UniqueTuple.intern(3)  # evicts 2
+    assert UniqueTuple.intern(1) is first
+    assert UniqueTuple.intern_cache_info().currsize == 2
+    assert UniqueTuple.intern_cache_info().misses == 3
+    UniqueTuple.intern(2)
+    assert UniqueTuple.intern_cache_info().misses == 4
+
+
+@pytest.mark.usefixtures('small_intern_cache')
+def test_intern_keeps_subclasses_apart():
+    class SubTuple(UniqueTuple):
+        pass
+
+    assert type(SubTuple.intern(1, 2)) is SubTuple
+    assert type(UniqueTuple.intern(1, 2)) is UniqueTuple
+
+
+@pytest.mark.usefixtures('small_intern_cache')
+def test_intern_keeps_equal_values_of_different_types_apart():
+    assert type(UniqueTuple.intern(1)[0]) is int
+    assert type(UniqueTuple.intern(True)[0]) is bool
+    assert type(UniqueTuple.intern(1.0)[0]) is float
+    assert type(UniqueTuple.intern((1,))[0][0]) is int
+    assert type(UniqueTuple.intern((True,))[0][0]) is bool
+    assert type(next(iter(UniqueTuple.intern(frozenset([1.0]))[0]))) is float
+
+
+@pytest.mark.usefixtures('small_intern_cache')
+def test_intern_cache_clear():
+    UniqueTuple.intern(1)
+    UniqueTuple.intern_cache_clear()
+    assert UniqueTuple.intern_cache_info() == (0, 0, 2, 0)
+
+
+@given(args=infer)
+def test_hash_matches_tuple(args: Sequence[Hashable]):
+    assume(all(map(is_hashable, args)))
+    ut = UniqueTuple(*args)
+    assert hash(ut) == hash(tuple(ut))
+    assert hash(ut) == hash(ut)
+
+
+records = st.lists(st.fixed_dictionaries({'id': st.integers(0, 5), 'v': st.integers(0, 2)}))
+
+
+def by_id(record):
+    return record['id']
+
+
+def first_per_key(items, key):
+    firsts = {}
+    for item in items:
+        firsts.setdefault(key(item), item)
+    return list(firsts.values())
+
+
+@given(records)
+def test_key(args):
+    ut = UniqueTuple(*args, key=by_id)
+    assert list(ut) == first_per_key(args, by_id)
+    assert UniqueTuple.from_iterable(iter(args), key=by_id) == ut
+    assert ut.key is by_id
+    for i, record in enumerate(ut):
+        assert record in ut
+        assert ut.index(record) == i
+        assert ut.index_by_key(record['id']) == i
+        assert ut.get_by_key(record['id']) is record
+
+
+def test_key_lookups_check_equality():
+    ut = UniqueTuple({'id': 1, 'v': 1}, {'id': 2, 'v': 1}, key=by_id)
+    assert {'id': 1, 'v': 2} not in ut
+    assert ut.count({'id': 1, 'v': 2}) == 0
+    with pytest.raises(ValueError):
+        ut.index({'id': 1, 'v': 2})
+    with pytest.raises(KeyError):
+        ut.index_by_key(3)
+    assert ut.get_by_key(3, 'default') == 'default'
+
+
+@mark_params
+@param(tag='missing_key', value={'x': 1})
+@param(tag='not_subscriptable', value=1)
+def test_key_lookups_of_values_the_key_cant_handle(value):
+    ut = UniqueTuple({'id': 1}, key=by_id)
+    assert value not in ut
+    assert ut.count(value) == 0
+    with pytest.raises(ValueError):
+        ut.index(value)
+
+
+def test_key_is_kept_by_set_operations():
+    a = UniqueTuple({'id': 1}, {'id': 2}, {'id': 3}, key=by_id)
+    b = UniqueTuple({'id': 3}, {'id': 4}, key=by_id)
+    assert list(a | b) == [{'id': 1}, {'id': 2}, {'id': 3}, {'id': 4}]
+    assert list(a & b) == [{'id': 3}]
+    assert list(a - UniqueTuple({'id': 1}, key=by_id)) == [{'id': 2}, {'id': 3}]
+    assert list(a ^ b) == [{'id': 1}, {'id': 2}, {'id': 4}]
+    assert a.difference([{'id': 1}]).key is by_id
+    assert (a & b).get_by_key(3) == {'id': 3}
+    assert a.issuperset([{'id': 2}])
+    assert not a.isdisjoint(b)
+    assert UniqueTuple({'id': 2}, key=by_id).issubset(a)
+
+
+def test_from_iterable_with_different_key_rebuilds():
+    ut = UniqueTuple(1, 2, 3, 4)
+    assert UniqueTuple.from_iterable(ut, key=lambda x: x % 2) == UniqueTuple(1, 2)
+
+
+def test_pickle_with_key():
+    ut = UniqueTuple({'id': 1}, {'id': 1, 'v': 2}, {'id': 2}, key=by_id)
+    unpickled = pickle.loads(pickle.dumps(ut))
+    assert unpickled == ut
+    assert unpickled.key is by_id
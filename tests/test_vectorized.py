@@ -0,0 +1,73 @@
+import pytest
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from collectionish import UniqueTuple, IntUniqueTuple
+from collectionish import _vectorized
+
+from tests.utils import param, mark_params
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def threshold(request, monkeypatch):
+    if request.param == 'numpy':
+        monkeypatch.setattr(_vectorized, 'UNIQUE_THRESHOLD', 0)
+    return request.param
+
+
+@mark_params
+@param(tag='int', dtype='int64')
+@param(tag='small_int', dtype='int8')
+@param(tag='uint', dtype='uint16')
+@param(tag='float', dtype='float64')
+@param(tag='bool', dtype='bool')
+def test_uniquetuple_from_array(threshold, dtype):
+    values = [3, 0, 1, 3, 2, 0, 1, 1]
+    arr = np.array(values, dtype=dtype)
+    result = UniqueTuple.from_iterable(arr)
+    assert result == UniqueTuple(*arr.tolist())
+    assert all(type(v) in (bool, int, float) for v in result)
+
+
+@given(st.lists(st.integers(-100, 100)))
+def test_unique_in_order(values):
+    arr = np.array(values, dtype='int64')
+    assert _vectorized.unique_in_order(arr).tolist() == list(dict.fromkeys(values))
+
+
+def test_nan_falls_back_to_python(threshold):
+    arr = np.array([1.0, np.nan, 1.0, np.nan])
+    assert not _vectorized.use_numpy_unique(arr)
+    result = UniqueTuple.from_iterable(arr)
+    assert len(result) == 3
+    assert result[0] == 1.0
+
+
+def test_negative_zero_keeps_first_appearance(threshold):
+    arr = np.array([-0.0, 0.0, 1.0])
+    assert str(UniqueTuple.from_iterable(arr)) == str(UniqueTuple(-0.0, 1.0))
+
+
+@mark_params
+@param(tag='int', dtype='int32')
+@param(tag='uint', dtype='uint32')
+@param(tag='bool', dtype='bool')
+def test_int_uniquetuple_from_array(threshold, dtype):
+    arr = np.array([3, 0, 1, 3, 2, 0, 1, 1], dtype=dtype)
+    result = IntUniqueTuple.from_iterable(arr)
+    assert result == UniqueTuple(*arr.tolist())
+    assert 1 in result
+    assert 7 not in result
+
+
+def test_int_uniquetuple_rejects_large_uint64(threshold):
+    with pytest.raises(OverflowError):
+        IntUniqueTuple.from_iterable(np.array([2 ** 64 - 1, 0], dtype='uint64'))
+
+
+def test_multidimensional_arrays_are_left_alone():
+    assert not _vectorized.is_numeric_array(np.zeros((2, 2)))
+    assert not _vectorized.is_numeric_array(np.array(['a', 'b']))